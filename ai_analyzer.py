@@ -1,122 +1,106 @@
-import re
 import math
 from password_rules import PasswordRules
+from analysis_result import LENGTH_OK, NOT_COMMON, AnalysisResult
+from char_classes import UPPER, LOWER, DIGIT, SPECIAL, char_flags, scan
+from policy import Policy
 from translations import TRANSLATIONS
 
+# Puanlama mantığı değiştiğinde artırılır (kayıtlı denetim sonuçları yeniden hesaplanır)
+ANALYZER_VERSION = 1
+
 class AIAnalyzer:
     """
     Şifre gücünü analiz eden heuirstic (sezgisel) AI motoru.
     Ağırlıklı puanlama sistemi ve bulanık mantık eşikleri kullanır.
     """
     
-    def __init__(self, lang="en"):
+    def __init__(self, lang="en", blocklist=None, cache=None, estimator=None, policy=None):
         self.rules = PasswordRules()
+        # Puanlama ağırlıkları ve eşikler (derlenmiş Policy); varsayılan önceki sabitlerle aynı
+        self.policy = policy if policy is not None else Policy()
+        # Yaygın şifre kontrolü için kara liste (`in` destekleyen herhangi bir nesne)
+        self.blocklist = blocklist if blocklist is not None else self.rules.load_blocklist()
+        # İsteğe bağlı sonuç önbelleği (AnalysisCache); sonuçlar paylaşılır, değiştirilmemeli
+        self.cache = cache
+        # İsteğe bağlı desen tahmincisi (PatternEstimator); verilirse sonuca
+        # guess_bits/patterns eklenir ve radar entropisi min(Shannon, desen) olur
+        self.estimator = estimator
+        self.set_language(lang)
+
+    def set_language(self, lang):
+        """Varsayılan görüntüleme dilini değiştirir (puanlamayı etkilemez)."""
         self.lang = lang
         self.texts = TRANSLATIONS.get(lang, TRANSLATIONS["en"])
 
-    def analyze(self, password: str, lang=None) -> dict:
+    @property
+    def version(self):
+        """Analizör ve politika sürümü; kaydedilmiş puanların geçerliliği için."""
+        return f"{ANALYZER_VERSION}:{self.policy.digest()}"
+
+    def analyze(self, password: str, lang=None) -> AnalysisResult:
+        """
+        Şifreyi analiz eder ve detaylı bir rapor (AnalysisResult) döner.
+        lang yalnızca bu sonucun görüntüleme dilidir; self.lang değişmez.
+        """
+        lang = lang or self.lang
+        if self.cache is None:
+            return self._analyze(password, lang)
+        return self._analyze_cached(password, lang)
+
+    def analyze_many(self, passwords, lang=None, use_cache=False):
         """
-        Şifreyi analiz eder ve detaylı bir rapor döner.
+        Şifre dizisini sırayla analiz eden üreteç (generator).
+        Sonuçlar analyze() ile birebir aynıdır. self.lang değişmez.
+        use_cache=True ise analizörün önbelleği kullanılır.
         """
-        if lang:
-            self.lang = lang
-            self.texts = TRANSLATIONS.get(lang, TRANSLATIONS["en"])
+        lang = lang or self.lang
+        analyze = self._analyze_cached if use_cache and self.cache is not None else self._analyze
+        for password in passwords:
+            yield analyze(password, lang)
 
+    def _analyze_cached(self, password, lang):
+        # Önbellekteki sonuç dilden bağımsızdır; okurken istenen dile çevrilir
+        cache = self.cache
+        key = cache.key(password)
+        result = cache.get(key)
+        if result is None:
+            result = self._analyze(password, lang)
+            cache.put(key, result)
+            return result
+        return result.localized(lang)
+
+    def _analyze(self, password, lang):
+        """
+        Tek şifre için analiz çekirdeği. Her kural ve entropi hesabı
+        şifre başına yalnızca bir kez çalışır.
+        """
         if not password:
-            return {
-                "score": 0, 
-                "status": self.texts["ready"], 
-                "suggestions": [self.texts["empty_msg"]],
-                "checks": {
-                    "length": False, "upper": False, "lower": False, 
-                    "digit": False, "special": False, "common": False
-                }
-            }
-
-        score = 0
-        suggestions = []
-        
-        # 1. Uzunluk Analizi (30 Puan)
-        length = len(password)
-        if length >= self.rules.DESIRED_LENGTH:
-            score += 30
-        elif length >= self.rules.MIN_LENGTH:
-            score += 15
-            suggestions.append(self.texts["sugg_len_long"])
-        else:
-            suggestions.append(self.texts["sugg_len_short"])
+            return AnalysisResult.empty(lang)
 
-        # 2. Karakter Çeşitliliği Analizi (40 Puan)
-        diversity_score = 0
-        if self.rules.HAS_UPPER.search(password):
-            diversity_score += 10
-        else:
-            suggestions.append(self.texts["sugg_up"])
-            
-        if self.rules.HAS_LOWER.search(password):
-            diversity_score += 10
-        else:
-            suggestions.append(self.texts["sugg_lo"])
-            
-        if self.rules.HAS_DIGIT.search(password):
-            diversity_score += 10
-        else:
-            suggestions.append(self.texts["sugg_num"])
-            
-        if self.rules.HAS_SPECIAL.search(password):
-            diversity_score += 10
-        else:
-            suggestions.append(self.texts["sugg_spec"])
-            
-        score += diversity_score
+        # Sınıf bitleri, karakter sayıları ve benzersizlik tek geçişte
+        flags, counts = scan(password)
+        length = len(password)
+        return self._build_result(
+            lang, length, flags, password in self.blocklist,
+            _entropy_from_counts(counts, length), len(counts), self._estimate(password))
 
-        # 3. Yaygın Şifre Kontrolü (-50 Puan Ceza)
-        if password.lower() in self.rules.COMMON_PASSWORDS:
-            score -= 50
-            suggestions.append(self.texts["sugg_common"])
+    def _estimate(self, password):
+        estimator = self.estimator
+        return estimator.estimate(password) if estimator is not None else None
 
-        # 5. Shannon Entropisi Analizi
-        entropy = self._calculate_entropy(password)
-        
-        # Puan Sınırlandırma (0 - 100)
-        score = max(0, min(100, score))
-        
-        # Durum Belirleme (AI Karar Mekanizması)
-        status = self._get_status(score)
-        
-        if score == 100:
-            suggestions = [self.texts["excellent"]]
-
-        # Kontrol Listesi Durumu (UI için)
-        checks = {
-            "length": length >= self.rules.MIN_LENGTH,
-            "upper": bool(self.rules.HAS_UPPER.search(password)),
-            "lower": bool(self.rules.HAS_LOWER.search(password)),
-            "digit": bool(self.rules.HAS_DIGIT.search(password)),
-            "special": bool(self.rules.HAS_SPECIAL.search(password)),
-            "common": password.lower() not in self.rules.COMMON_PASSWORDS if password else False
-        }
-
-        # 6. Radar Grafik Metrikleri (0.0 - 1.0)
-        metrics = {
-            "length": min(1.0, length / 16),
-            "variety": (bool(self.rules.HAS_UPPER.search(password)) + 
-                        bool(self.rules.HAS_LOWER.search(password)) + 
-                        bool(self.rules.HAS_DIGIT.search(password)) + 
-                        bool(self.rules.HAS_SPECIAL.search(password))) / 4,
-            "entropy": min(1.0, entropy / 128) if length > 0 else 0, # 128 bit ideal kabul edildi
-            "uniqueness": len(set(password)) / length if length > 0 else 0,
-            "safety": 0.0 if password.lower() in self.rules.COMMON_PASSWORDS else 1.0
-        }
-
-        return {
-            "score": score,
-            "status": status,
-            "suggestions": suggestions,
-            "checks": checks,
-            "entropy": round(entropy, 2),
-            "metrics": metrics
-        }
+    def _build_result(self, lang, length, flags, is_common, entropy, unique, guess=None):
+        """Çıkarılmış özelliklerden puanı ve sonucu oluşturur (metinler erişimde çevrilir)."""
+        # Uzunluk, karakter çeşitliliği ve yaygın şifre cezası politikaya göre;
+        # mask: her bit bir öneri anahtarını temsil eder
+        policy = self.policy
+        score, status, mask = policy.evaluate(length, flags, is_common)
+        check_bits = (flags & 15) | (LENGTH_OK if length >= policy.min_length else 0) \
+            | (0 if is_common else NOT_COMMON)
+        if guess is None:
+            return AnalysisResult(score, status, mask, check_bits, length, unique, entropy,
+                                  lang=lang)
+        return AnalysisResult(score, status, mask, check_bits, length, unique, entropy,
+                              guess.bits, tuple(match.pattern for match in guess.sequence), lang)
 
     def _calculate_entropy(self, password: str) -> float:
         """
@@ -126,24 +110,172 @@ class AIAnalyzer:
         if not password:
             return 0.0
         
-        length = len(password)
-        frequencies = {}
-        for char in password:
-            frequencies[char] = frequencies.get(char, 0) + 1
-            
-        entropy = 0.0
-        for count in frequencies.values():
-            p_i = count / length
-            entropy -= p_i * math.log2(p_i)
-            
-        # Toplam bit gücü (H * uzunluk)
-        return entropy * length
+        return _entropy_from_counts(scan(password)[1], len(password))
+
+    def session(self):
+        """Tuş vuruşu bazında artımlı analiz için yeni bir oturum döner."""
+        return AnalysisSession(self)
 
     def _get_status(self, score: int) -> str:
         """Puan değerine göre metinsel durum döner."""
-        if score < 40:
-            return self.texts["weak"]
-        elif score < 75:
-            return self.texts["medium"]
+        return self.texts[self.policy.status(score)]
+
+
+class AnalysisSession:
+    """
+    Artımlı (tuş vuruşu bazında) analiz oturumu.
+    Karakter sayıları, sınıf sayaçları ve sum(c * log2 c) toplamı tutulur;
+    sona ekleme ve sondan silme karakter başına O(1) güncellenir, diğer
+    düzenlemelerde durum baştan hesaplanır.
+    Entropi L*log2(L) - sum(c*log2 c) olarak hesaplandığından analyze() ile
+    yalnızca kayan nokta yuvarlama farkı kadar ayrışabilir.
+    """
+
+    def __init__(self, analyzer, lang=None):
+        self.analyzer = analyzer
+        self.lang = lang or analyzer.lang
+        self._class_cache = {}
+        self._reset("")
+
+    def _reset(self, text):
+        self.text = ""
+        self._counts = {}
+        # Büyük, küçük, rakam, özel karakter sayaçları
+        self._classes = [0, 0, 0, 0]
+        self._sum_clogc = 0.0
+        self._result = None
+        for char in text:
+            self._add(char)
+        self.text = text
+
+    def _char_classes(self, char):
+        classes = self._class_cache.get(char)
+        if classes is None:
+            flags = char_flags(char)
+            classes = self._class_cache[char] = (
+                bool(flags & UPPER), bool(flags & LOWER),
+                bool(flags & DIGIT), bool(flags & SPECIAL),
+            )
+        return classes
+
+    def _add(self, char):
+        count = self._counts.get(char, 0)
+        self._counts[char] = count + 1
+        self._sum_clogc += _clogc(count + 1) - _clogc(count)
+        upper, lower, digit, special = self._char_classes(char)
+        classes = self._classes
+        classes[0] += upper
+        classes[1] += lower
+        classes[2] += digit
+        classes[3] += special
+
+    def _remove(self, char):
+        count = self._counts[char]
+        if count == 1:
+            del self._counts[char]
         else:
-            return self.texts["strong"]
+            self._counts[char] = count - 1
+        self._sum_clogc += _clogc(count - 1) - _clogc(count)
+        upper, lower, digit, special = self._char_classes(char)
+        classes = self._classes
+        classes[0] -= upper
+        classes[1] -= lower
+        classes[2] -= digit
+        classes[3] -= special
+
+    def append(self, chars):
+        """Metnin sonuna karakter ekler ve sonucu döner."""
+        for char in chars:
+            self._add(char)
+        self.text += chars
+        self._result = None
+        return self.result()
+
+    def delete(self, count=1):
+        """Metnin sonundan count karakter siler ve sonucu döner."""
+        count = min(count, len(self.text))
+        if count:
+            for char in self.text[-count:]:
+                self._remove(char)
+            self.text = self.text[:-count]
+            self._result = None
+        return self.result()
+
+    def update(self, text):
+        """
+        Yeni metne geçer. Sona ekleme ve sondan silme artımlı işlenir;
+        diğer düzenlemelerde durum baştan hesaplanır.
+        """
+        prev = self.text
+        if text == prev:
+            return self.result()
+        if len(text) > len(prev) and text.startswith(prev):
+            return self.append(text[len(prev):])
+        if len(text) < len(prev) and prev.startswith(text):
+            return self.delete(len(prev) - len(text))
+        self._reset(text)
+        return self.result()
+
+    def entropy(self):
+        """Toplam bit gücü: L*H = L*log2(L) - sum(c*log2 c)."""
+        length = len(self.text)
+        if not length:
+            return 0.0
+        # Tek karakter türünde sonuç tam olarak 0 olmalı
+        if len(self._counts) == 1:
+            return 0.0
+        return max(0.0, _clogc(length) - self._sum_clogc)
+
+    def result(self):
+        """
+        Geçerli metnin analiz sonucunu döner (değişmediyse önbellekten).
+        self.lang değiştiyse önbellekteki sonuç yeni dilde yeniden görüntülenir.
+        Analizörün önbelleği (analyzer.cache) varsa tam metin için önce ona
+        bakılır ve yeni sonuçlar ona yazılır; geri silme ve yeniden yazmada
+        kara liste ve desen tahmini tekrar çalışmaz.
+        """
+        result = self._result
+        if result is not None and result.lang != self.lang:
+            self._result = result.localized(self.lang)
+        if self._result is None:
+            text = self.text
+            if not text:
+                self._result = self.analyzer._analyze(text, self.lang)
+                return self._result
+            cache = self.analyzer.cache
+            if cache is None:
+                self._result = self._build()
+                return self._result
+            key = cache.key(text)
+            cached = cache.get(key)
+            if cached is None:
+                self._result = self._build()
+                cache.put(key, self._result)
+            else:
+                self._result = cached.localized(self.lang)
+        return self._result
+
+    def _build(self):
+        analyzer = self.analyzer
+        text = self.text
+        upper, lower, digit, special = self._classes
+        flags = ((UPPER if upper else 0) | (LOWER if lower else 0)
+                 | (DIGIT if digit else 0) | (SPECIAL if special else 0))
+        return analyzer._build_result(
+            self.lang, len(text), flags,
+            text in analyzer.blocklist, self.entropy(), len(self._counts),
+            analyzer._estimate(text))
+
+
+def _entropy_from_counts(counts, length):
+    """Karakter sayılarından toplam Shannon bitleri (H * uzunluk)."""
+    entropy = 0.0
+    for count in counts.values():
+        p_i = count / length
+        entropy -= p_i * math.log2(p_i)
+    return entropy * length
+
+
+def _clogc(count):
+    """c * log2(c) (0 için 0)."""
+    return count * math.log2(count) if count > 1 else 0.0
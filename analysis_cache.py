@@ -0,0 +1,109 @@
+import sys
+import secrets
+import hashlib
+import threading
+from collections import OrderedDict
+
+class AnalysisCache:
+    """
+    Analiz sonuçları için sınırlı LRU önbellek.
+    Anahtarlar şifrenin kendisi değil, süreç başına rastgele anahtarla
+    hesaplanan BLAKE2b MAC değeridir; önbellekte düz metin tutulmaz.
+    Sonuçlar dilden bağımsızdır (AnalysisResult), bu yüzden anahtarda dil
+    yoktur; çağıran okurken localized(lang) kullanır.
+    Hem kayıt sayısı hem de yaklaşık bayt boyutu ile sınırlandırılır.
+    """
+
+    def __init__(self, max_entries=1024, max_bytes=1 << 20):
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self._lock = threading.Lock()
+        self._entries = OrderedDict()
+        self._bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._new_key()
+
+    def _new_key(self):
+        # Anahtar yalnızca BLAKE2b durumunda yaşar. Python'da bellekten güvenle
+        # silinemez; clear() anahtarı değiştirir, eski MAC'ler geçersiz kalır.
+        self._mac = hashlib.blake2b(key=secrets.token_bytes(32), digest_size=16)
+
+    def key(self, password):
+        """Şifre için önbellek anahtarını (16 bayt) hesaplar."""
+        mac = self._mac.copy()
+        mac.update(password.encode("utf-8", "surrogatepass"))
+        return mac.digest()
+
+    def get(self, key):
+        """Anahtara ait sonucu döner (yoksa None) ve LRU sırasını günceller."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry[0]
+
+    def put(self, key, result):
+        size = _result_size(result) + sys.getsizeof(key)
+        if size > self.max_bytes:
+            return
+        with self._lock:
+            old = self._entries.pop(key, None)
+            if old is not None:
+                self._bytes -= old[1]
+            self._entries[key] = (result, size)
+            self._bytes += size
+            while len(self._entries) > self.max_entries or self._bytes > self.max_bytes:
+                self._evict_oldest()
+
+    def evict(self, count=1):
+        """En eski count kaydı açıkça çıkarır; çıkarılan sayıyı döner."""
+        with self._lock:
+            count = min(count, len(self._entries))
+            for _ in range(count):
+                self._evict_oldest()
+            return count
+
+    def _evict_oldest(self):
+        _, (_, size) = self._entries.popitem(last=False)
+        self._bytes -= size
+        self.evictions += 1
+
+    def clear(self):
+        """Tüm kayıtları siler ve yeni MAC anahtarı üretir."""
+        with self._lock:
+            self._entries.clear()
+            self._bytes = 0
+            self._new_key()
+
+    def __len__(self):
+        return len(self._entries)
+
+    def stats(self):
+        lookups = self.hits + self.misses
+        return {
+            "entries": len(self._entries),
+            "bytes": self._bytes,
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "hit_rate": self.hits / lookups if lookups else 0.0,
+        }
+
+
+def _result_size(result):
+    """
+    Sonucun yaklaşık bellek boyutu (paylaşılan çeviri metinleri hariç).
+    AnalysisResult kendi float/demet alanlarını __sizeof__ içinde sayar;
+    iç içe sözlükler yalnızca eski sözlük sonuçlarında bulunur.
+    """
+    size = sys.getsizeof(result)
+    if isinstance(result, dict):
+        for value in result.values():
+            if isinstance(value, (dict, list)):
+                size += sys.getsizeof(value)
+    return size
@@ -0,0 +1,172 @@
+"""
+Dilden bağımsız, sıkıştırılmış analiz sonucu.
+
+AnalysisResult yalnızca sayıları tutar: puan, durum anahtarı, öneri
+maskesi, kontrol bitleri, uzunluk, benzersiz karakter sayısı ve ham
+entropi bitleri. İç içe `checks`/`metrics` sözlükleri ve çevrilmiş
+durum/öneri metinleri yalnızca erişildiğinde üretilir; dil yalnızca
+görüntüleme içindir (localized(lang) aynı verili bir kopya döner).
+
+Sonuç salt okunur bir Mapping'dir: result["score"], result.get("metrics"),
+{**result} ve dict ile eşitlik karşılaştırması eski sözlük sonuçlarıyla
+aynı çalışır. JSON için to_dict() kullanılır.
+"""
+
+import sys
+from collections.abc import Mapping
+
+from char_classes import UPPER, LOWER, DIGIT, SPECIAL
+from translations import TRANSLATIONS
+
+# Kontrol bitleri (alt dört bit char_classes sınıf bitleridir)
+LENGTH_OK = 16
+NOT_COMMON = 32
+
+# Öneri maskesi bitleri ve çeviri anahtarları (görüntüleme sırasıyla)
+SUGGESTION_BITS = (
+    (1, "sugg_len_long"),
+    (2, "sugg_len_short"),
+    (4, "sugg_up"),
+    (8, "sugg_lo"),
+    (16, "sugg_num"),
+    (32, "sugg_spec"),
+    (64, "sugg_common"),
+    (128, "excellent"),
+    (256, "empty_msg"),
+)
+EMPTY_MASK = 256
+
+# Sınıf bitleri (0-15) -> bulunan sınıf sayısı
+_VARIETY = tuple(bin(flags).count("1") for flags in range(16))
+
+_KEYS = ("score", "status", "suggestions", "checks", "entropy", "metrics")
+_GUESS_KEYS = _KEYS + ("guess_bits", "patterns")
+_EMPTY_KEYS = _KEYS[:4]
+
+
+def _texts(lang):
+    return TRANSLATIONS.get(lang, TRANSLATIONS["en"])
+
+
+class AnalysisResult(Mapping):
+    """Tek şifrenin analiz sonucu (__slots__; metinler erişimde çevrilir)."""
+
+    __slots__ = ("score", "status_key", "mask", "check_bits", "length", "unique",
+                 "bits", "guess_bits", "patterns", "lang")
+
+    def __init__(self, score, status_key, mask, check_bits, length, unique, bits,
+                 guess_bits=None, patterns=None, lang="en"):
+        self.score = score
+        self.status_key = status_key
+        self.mask = mask
+        self.check_bits = check_bits
+        self.length = length
+        self.unique = unique
+        # Ham Shannon bitleri (H * uzunluk); "entropy" anahtarı yuvarlanmış değerdir
+        self.bits = bits
+        self.guess_bits = guess_bits
+        self.patterns = patterns
+        self.lang = lang
+
+    @classmethod
+    def empty(cls, lang="en"):
+        return cls(0, "ready", EMPTY_MASK, 0, 0, 0, 0.0, lang=lang)
+
+    def localized(self, lang):
+        """Aynı verili, başka dilde görüntülenen kopya."""
+        if lang == self.lang:
+            return self
+        return AnalysisResult(self.score, self.status_key, self.mask, self.check_bits,
+                              self.length, self.unique, self.bits, self.guess_bits,
+                              self.patterns, lang)
+
+    def status_text(self, lang=None):
+        return _texts(lang or self.lang)[self.status_key]
+
+    def suggestion_texts(self, lang=None):
+        texts = _texts(lang or self.lang)
+        mask = self.mask
+        return [texts[key] for bit, key in SUGGESTION_BITS if mask & bit]
+
+    def checks(self):
+        bits = self.check_bits
+        return {
+            "length": bool(bits & LENGTH_OK),
+            "upper": bool(bits & UPPER),
+            "lower": bool(bits & LOWER),
+            "digit": bool(bits & DIGIT),
+            "special": bool(bits & SPECIAL),
+            "common": bool(bits & NOT_COMMON),
+        }
+
+    def metrics(self):
+        """Radar grafik metrikleri (0.0 - 1.0); boş şifrede hepsi 0."""
+        length = self.length
+        if not length:
+            return dict.fromkeys(("length", "variety", "entropy", "uniqueness", "safety"), 0.0)
+        bits = self.bits
+        if self.guess_bits is not None:
+            bits = min(bits, self.guess_bits)
+        return {
+            "length": min(1.0, length / 16),
+            "variety": _VARIETY[self.check_bits & 15] / 4,
+            "entropy": min(1.0, bits / 128),  # 128 bit ideal kabul edildi
+            "uniqueness": self.unique / length,
+            "safety": 1.0 if self.check_bits & NOT_COMMON else 0.0,
+        }
+
+    def _keys(self):
+        if not self.length:
+            return _EMPTY_KEYS
+        return _KEYS if self.guess_bits is None else _GUESS_KEYS
+
+    def __getitem__(self, key):
+        if key not in self._keys():
+            raise KeyError(key)
+        if key == "score":
+            return self.score
+        if key == "status":
+            return self.status_text()
+        if key == "suggestions":
+            return self.suggestion_texts()
+        if key == "checks":
+            return self.checks()
+        if key == "entropy":
+            return round(self.bits, 2)
+        if key == "metrics":
+            return self.metrics()
+        if key == "guess_bits":
+            return round(self.guess_bits, 2)
+        return list(self.patterns)
+
+    def __contains__(self, key):
+        return key in self._keys()
+
+    def __iter__(self):
+        return iter(self._keys())
+
+    def __len__(self):
+        return len(self._keys())
+
+    def to_dict(self, lang=None):
+        """Eski sözlük biçimi (JSON için)."""
+        result = self if lang is None else self.localized(lang)
+        return {key: result[key] for key in result._keys()}
+
+    def __repr__(self):
+        return f"AnalysisResult({self.to_dict()!r})"
+
+    def __reduce__(self):
+        # Süreçler arası aktarımda yalnızca sayılar taşınır
+        return (AnalysisResult, (self.score, self.status_key, self.mask, self.check_bits,
+                                 self.length, self.unique, self.bits, self.guess_bits,
+                                 self.patterns, self.lang))
+
+    def __sizeof__(self):
+        # Sonuca ait float ve desen demeti dahil (küçük tamsayılar ve dizeler paylaşılır)
+        size = object.__sizeof__(self) + sys.getsizeof(self.bits)
+        if self.guess_bits is not None:
+            size += sys.getsizeof(self.guess_bits)
+        if self.patterns is not None:
+            size += sys.getsizeof(self.patterns)
+        return size
@@ -0,0 +1,128 @@
+import os
+import time
+from collections import deque
+from PySide6.QtCore import QObject, QRunnable, QThreadPool, QTimer, Signal
+
+class LatencyStats:
+    """Son N ölçümün (ms) kayan penceresi; yüzdelik özetleri döner."""
+
+    def __init__(self, size=256):
+        self._samples = deque(maxlen=size)
+
+    def add(self, ms):
+        self._samples.append(ms)
+
+    def summary(self):
+        samples = sorted(self._samples)
+        if not samples:
+            return {"count": 0, "p50": 0.0, "p95": 0.0, "max": 0.0}
+        return {
+            "count": len(samples),
+            "p50": samples[len(samples) // 2],
+            "p95": samples[min(len(samples) - 1, int(len(samples) * 0.95))],
+            "max": samples[-1],
+        }
+
+
+class _ResultBridge(QObject):
+    """İşçi iş parçacığından GUI iş parçacığına sonuç taşıyan sinyal köprüsü."""
+    finished = Signal(int, object, float)
+
+
+class _AnalysisTask(QRunnable):
+    def __init__(self, scheduler, generation, text):
+        super().__init__()
+        self.scheduler = scheduler
+        self.generation = generation
+        self.text = text
+
+    def run(self):
+        scheduler = self.scheduler
+        # Kuyrukta beklerken eskimiş istekler hiç çalıştırılmaz
+        if self.generation != scheduler._generation:
+            return
+        start = time.perf_counter()
+        result = scheduler.session.update(self.text)
+        scheduler._bridge.finished.emit(self.generation, result,
+                                        (time.perf_counter() - start) * 1000)
+
+
+class AnalysisScheduler(QObject):
+    """
+    Girişi geciktirerek (debounce) birleştirir ve analizi QThreadPool
+    işçisinde çalıştırır. Eski metne ait sonuçlar atılır; yalnızca en son
+    isteğin sonucu result_ready ile GUI iş parçacığına gönderilir.
+
+    Oturum tek iş parçacıklı havuzda çalıştığından sırayla güncellenir.
+    LOCKSENSE_PROFILE=1 ise gecikme özetleri periyodik olarak yazdırılır.
+    """
+
+    result_ready = Signal(object)
+
+    def __init__(self, session, debounce_ms=30, parent=None):
+        super().__init__(parent)
+        self.session = session
+        self._generation = 0
+        self._pending_text = ""
+        self._input_at = 0.0
+
+        self._timer = QTimer(self)
+        self._timer.setSingleShot(True)
+        self._timer.setInterval(debounce_ms)
+        self._timer.timeout.connect(self._dispatch)
+
+        self._pool = QThreadPool(self)
+        self._pool.setMaxThreadCount(1)
+
+        self._bridge = _ResultBridge()
+        self._bridge.finished.connect(self._on_finished)
+
+        self.dropped = 0
+        self.input_latency = LatencyStats()
+        self.analysis_time = LatencyStats()
+        self.frame_time = LatencyStats()
+        self._profile = os.environ.get("LOCKSENSE_PROFILE") == "1"
+        self._delivered = 0
+
+    def request(self, text, immediate=False):
+        """Yeni metin için analiz ister; önceki bekleyen istekleri geçersiz kılar."""
+        self._generation += 1
+        self._pending_text = text
+        self._input_at = time.perf_counter()
+        if immediate:
+            self._timer.stop()
+            self._dispatch()
+        else:
+            self._timer.start()
+
+    def _dispatch(self):
+        self._pool.start(_AnalysisTask(self, self._generation, self._pending_text))
+
+    def _on_finished(self, generation, result, analysis_ms):
+        self.analysis_time.add(analysis_ms)
+        if generation != self._generation:
+            self.dropped += 1
+            return
+        self.result_ready.emit(result)
+        self.input_latency.add((time.perf_counter() - self._input_at) * 1000)
+        self._delivered += 1
+        if self._profile and self._delivered % 50 == 0:
+            print(f"[LockSense] {self.report()}")
+
+    def record_frame(self, ms):
+        """GUI iş parçacığında sonucu uygulama süresini (ms) kaydeder."""
+        self.frame_time.add(ms)
+
+    def report(self):
+        return {
+            "input_latency_ms": self.input_latency.summary(),
+            "analysis_ms": self.analysis_time.summary(),
+            "frame_ms": self.frame_time.summary(),
+            "dropped": self.dropped,
+        }
+
+    def shutdown(self):
+        """Bekleyen istekleri iptal eder ve işçinin bitmesini bekler."""
+        self._timer.stop()
+        self._generation += 1
+        self._pool.waitForDone()
@@ -0,0 +1,144 @@
+"""
+Büyük şifre dosyaları için çok çekirdekli denetim çalıştırıcısı.
+
+Girdi dosyası satır sınırlarına hizalanmış bayt aralıklarına (parça) bölünür.
+Her süreç kendi AIAnalyzer örneğini bir kez oluşturur, parçayı dosyadan
+kendisi okur ve sonuçları parça başına tek mesajla geri gönderir; böylece
+süreçler arası iletişim (IPC) satır başına değil parça başına yapılır.
+
+Kullanım:
+    python -m audit_runner cracked.txt -o report.jsonl --workers 16 --unordered
+"""
+
+import os
+import sys
+import json
+import argparse
+from multiprocessing import Pool
+
+from ai_analyzer import AIAnalyzer
+
+DEFAULT_CHUNK_BYTES = 1 << 20
+
+# Süreç başına analizör (initializer ile oluşturulur)
+_analyzer = None
+
+
+def plan_chunks(path, chunk_bytes=DEFAULT_CHUNK_BYTES):
+    """Dosyayı satır sonlarına hizalı (başlangıç, bitiş) bayt aralıklarına böler."""
+    size = os.path.getsize(path)
+    spans = []
+    with open(path, "rb") as f:
+        start = 0
+        while start < size:
+            end = min(size, start + chunk_bytes)
+            if end < size:
+                f.seek(end)
+                f.readline()
+                end = f.tell()
+            spans.append((start, end))
+            start = end
+    return spans
+
+
+def _init_worker(lang, blocklist_path):
+    global _analyzer
+    blocklist = None
+    if blocklist_path:
+        from password_rules import PasswordRules
+        blocklist = PasswordRules.load_blocklist(blocklist_path)
+    _analyzer = AIAnalyzer(lang, blocklist=blocklist)
+
+
+def _read_span(path, span):
+    """Parçadaki boş olmayan satırları (bayt konumu, şifre) olarak döner."""
+    start, end = span
+    with open(path, "rb") as f:
+        f.seek(start)
+        data = f.read(end - start)
+    offsets = []
+    passwords = []
+    pos = start
+    for line in data.splitlines(keepends=True):
+        text = line.rstrip(b"\r\n")
+        if text:
+            offsets.append(pos)
+            passwords.append(text.decode("utf-8", "surrogateescape"))
+        pos += len(line)
+    return offsets, passwords
+
+
+def _analyze_span(task):
+    path, span = task
+    offsets, passwords = _read_span(path, span)
+    return list(zip(offsets, _analyzer.analyze_many(passwords)))
+
+
+def _analyze_span_jsonl(task):
+    path, span = task
+    offsets, passwords = _read_span(path, span)
+    dumps = json.dumps
+    lines = [dumps({"offset": offset, **result}, ensure_ascii=False)
+             for offset, result in zip(offsets, _analyzer.analyze_many(passwords))]
+    lines.append("")
+    return "\n".join(lines).encode("utf-8")
+
+
+def _run(path, worker_fn, workers, lang, chunk_bytes, ordered, blocklist_path):
+    workers = workers or os.cpu_count() or 1
+    tasks = [(path, span) for span in plan_chunks(path, chunk_bytes)]
+    with Pool(workers, initializer=_init_worker, initargs=(lang, blocklist_path)) as pool:
+        mapper = pool.imap if ordered else pool.imap_unordered
+        yield from mapper(worker_fn, tasks)
+
+
+def audit_file(path, workers=None, lang="en", chunk_bytes=DEFAULT_CHUNK_BYTES,
+               ordered=True, blocklist_path=None):
+    """
+    Dosyadaki her şifreyi süreç havuzunda analiz eder ve (bayt konumu, sonuç)
+    çiftleri üretir. ordered=False ise parçalar bitiş sırasıyla gelir.
+    """
+    for chunk in _run(path, _analyze_span, workers, lang, chunk_bytes, ordered, blocklist_path):
+        yield from chunk
+
+
+def audit_file_jsonl(path, out, workers=None, lang="en", chunk_bytes=DEFAULT_CHUNK_BYTES,
+                     ordered=True, blocklist_path=None):
+    """
+    audit_file() ile aynı, ancak JSONL satırları işçi süreçlerde üretilir ve
+    ikili `out` dosyasına parça parça yazılır. Yazılan parça sayısını döner.
+    """
+    count = 0
+    for blob in _run(path, _analyze_span_jsonl, workers, lang, chunk_bytes, ordered, blocklist_path):
+        out.write(blob)
+        count += 1
+    return count
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(
+        prog="python -m audit_runner",
+        description="Şifre dosyasını çok çekirdekli olarak analiz eder (JSONL çıktı).")
+    parser.add_argument("input", help="satır başına bir şifre içeren dosya")
+    parser.add_argument("-o", "--output", help="çıktı dosyası (varsayılan: stdout)")
+    parser.add_argument("-w", "--workers", type=int, default=None,
+                        help="süreç sayısı (varsayılan: çekirdek sayısı)")
+    parser.add_argument("--chunk-bytes", type=int, default=DEFAULT_CHUNK_BYTES)
+    parser.add_argument("--unordered", action="store_true",
+                        help="sonuçları parça bitiş sırasıyla yaz (daha hızlı)")
+    parser.add_argument("--lang", default="en", choices=["tr", "en", "de"])
+    parser.add_argument("--blocklist", default=None, help="kara liste dizin dosyası")
+    args = parser.parse_args(argv)
+
+    out = open(args.output, "wb") if args.output else sys.stdout.buffer
+    try:
+        audit_file_jsonl(args.input, out, args.workers, args.lang, args.chunk_bytes,
+                         not args.unordered, args.blocklist)
+    finally:
+        if args.output:
+            out.close()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,50 @@
+"""
+analyze() döngüsü ile analyze_many() toplu yolunun karşılaştırması.
+
+Kullanım:
+    python -m benchmarks.bench_batch [adet]
+"""
+import random
+import string
+import sys
+import time
+
+from ai_analyzer import AIAnalyzer
+
+
+def make_corpus(count, seed=42):
+    """Deterministik, karışık uzunluk ve sınıflarda sentetik şifreler üretir."""
+    rng = random.Random(seed)
+    alphabet = string.ascii_letters + string.digits + "!@#$%^&*"
+    return ["".join(rng.choice(alphabet) for _ in range(rng.randint(4, 24)))
+            for _ in range(count)]
+
+
+def bench(label, func, corpus):
+    start = time.perf_counter()
+    func(corpus)
+    elapsed = time.perf_counter() - start
+    print(f"{label:<24} {len(corpus) / elapsed:>12,.0f} şifre/sn  ({elapsed:.3f} sn)")
+    return elapsed
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 200_000
+    corpus = make_corpus(count)
+    analyzer = AIAnalyzer("en")
+
+    def loop(items):
+        for password in items:
+            analyzer.analyze(password)
+
+    def batch(items):
+        for _ in analyzer.analyze_many(items):
+            pass
+
+    base = bench("analyze() döngüsü", loop, corpus)
+    fast = bench("analyze_many()", batch, corpus)
+    print(f"hızlanma: {base / fast:.2f}x")
+
+
+if __name__ == "__main__":
+    main()
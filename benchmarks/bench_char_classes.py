@@ -0,0 +1,50 @@
+"""
+Karakter sınıflandırma mikro ölçümü: eski regex yolu (dört desen, puanlama,
+checks ve variety için üçer arama + set + sayım sözlüğü) ile tek geçişli
+char_classes.scan karşılaştırması.
+
+Kullanım:
+    python -m benchmarks.bench_char_classes
+"""
+import time
+
+from benchmarks.bench_batch import make_corpus
+from benchmarks.bench_keystroke import passphrase
+from char_classes import scan
+from password_rules import PasswordRules
+
+
+def regex_path(password, rules=PasswordRules):
+    for _ in range(3):
+        flags = (rules.HAS_UPPER.search(password) is not None,
+                 rules.HAS_LOWER.search(password) is not None,
+                 rules.HAS_DIGIT.search(password) is not None,
+                 rules.HAS_SPECIAL.search(password) is not None)
+    frequencies = {}
+    for char in password:
+        frequencies[char] = frequencies.get(char, 0) + 1
+    return flags, frequencies, len(set(password))
+
+
+def timed(func, passwords):
+    start = time.perf_counter()
+    for password in passwords:
+        func(password)
+    return (time.perf_counter() - start) / len(passwords) * 1e6
+
+
+def main():
+    cases = [
+        ("korpus (8-20)", make_corpus(50_000)),
+        ("1K parola", [passphrase(1_000, seed) for seed in range(200)]),
+        ("10K parola", [passphrase(10_000, seed) for seed in range(20)]),
+    ]
+    print(f"{'girdi':>14} {'regex µs':>10} {'scan µs':>9} {'hızlanma':>9}")
+    for name, passwords in cases:
+        old = timed(regex_path, passwords)
+        new = timed(scan, passwords)
+        print(f"{name:>14} {old:>10.2f} {new:>9.2f} {old / new:>8.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,43 @@
+"""
+Arayüzsüz CLI'nin soğuk başlatma süresini ölçer ve bütçeyle karşılaştırır.
+Bütçe aşılırsa çıkış kodu 1'dir (CI'da kullanılabilir).
+
+Kullanım:
+    python -m benchmarks.bench_cli_startup [tekrar]
+"""
+import os
+import statistics
+import subprocess
+import sys
+import time
+
+from locksense import STARTUP_BUDGET_MS
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def measure(command, runs):
+    samples = []
+    for _ in range(runs):
+        start = time.perf_counter()
+        subprocess.run(command, cwd=ROOT, check=True, stdout=subprocess.DEVNULL)
+        samples.append((time.perf_counter() - start) * 1000)
+    return statistics.median(samples)
+
+
+def main():
+    runs = int(sys.argv[1]) if len(sys.argv) > 1 else 15
+    interpreter = measure([sys.executable, "-c", "pass"], runs)
+    startup = measure([sys.executable, "-m", "locksense", "--version"], runs)
+    check = measure([sys.executable, "-m", "locksense", "Parola1!"], runs)
+    print(f"yorumlayıcı        {interpreter:7.1f} ms")
+    print(f"locksense --version {startup:6.1f} ms")
+    print(f"locksense <şifre>  {check:7.1f} ms  (bütçe {STARTUP_BUDGET_MS} ms)")
+    if check > STARTUP_BUDGET_MS:
+        print("BÜTÇE AŞILDI")
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,44 @@
+"""
+Şifre üretim hızı: karakter başına secrets.choice (eski arayüz yöntemi)
+ile tamponlu, reddetmeli örneklemeli PasswordGenerator karşılaştırması.
+
+Kullanım:
+    python -m benchmarks.bench_generator
+"""
+import secrets
+import string
+import time
+
+from generator import PassphraseGenerator, PasswordGenerator
+
+
+def legacy(count):
+    alphabet = string.ascii_letters + string.digits + "!@#$%^&*"
+    return [''.join(secrets.choice(alphabet) for _ in range(16)) for _ in range(count)]
+
+
+def measure(label, func, count):
+    start = time.perf_counter()
+    func(count)
+    elapsed = time.perf_counter() - start
+    print(f"{label:<36} {elapsed:>8.3f} {count / elapsed:>12,.0f}")
+
+
+def main(count=100_000):
+    print(f"{'yöntem (' + format(count, ',') + ' adet)':<36} {'süre sn':>8} {'şifre/sn':>12}")
+    measure("secrets.choice x16", legacy, count)
+    generator = PasswordGenerator()
+    measure("PasswordGenerator 16", generator.generate_many, count)
+    measure("PasswordGenerator 16 tek tek",
+            lambda n: [generator.generate() for _ in range(n)], count)
+    measure("PasswordGenerator 32, AMBIGUOUS hariç",
+            PasswordGenerator(length=32, exclude_ambiguous=True).generate_many, count)
+    measure("PasswordGenerator 16, min_score=70",
+            PasswordGenerator(min_score=70).generate_many, count)
+    measure("PassphraseGenerator 6 kelime", PassphraseGenerator().generate_many, count)
+    measure("PassphraseGenerator 6, min_score=70",
+            PassphraseGenerator(min_score=70).generate_many, count)
+
+
+if __name__ == "__main__":
+    main()
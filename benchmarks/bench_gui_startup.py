@@ -0,0 +1,46 @@
+"""
+Masaüstü arayüzü soğuk başlatma ölçümü: main.py --profile-startup
+--auto-select ile ön kurulumlu (varsayılan) ve ön kurulumsuz (--no-prebuild)
+başlatmanın aşama sürelerinin medyanlarını karşılaştırır.
+
+Ekran yoksa Qt "offscreen" platformu kullanılır.
+
+Kullanım:
+    python -m benchmarks.bench_gui_startup [tekrar]
+"""
+import json
+import os
+import statistics
+import subprocess
+import sys
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+MARKS = ("imports", "selector_first_paint", "prebuilt", "selected_to_paint", "window_first_paint")
+
+
+def run(extra, runs):
+    env = dict(os.environ)
+    if not env.get("DISPLAY") and not env.get("WAYLAND_DISPLAY"):
+        env.setdefault("QT_QPA_PLATFORM", "offscreen")
+    samples = []
+    for _ in range(runs):
+        proc = subprocess.run([sys.executable, "main.py", "--profile-startup", "--auto-select", "en", *extra],
+                              cwd=ROOT, env=env, capture_output=True, text=True, check=True, timeout=60)
+        line = next(l for l in proc.stderr.splitlines() if l.startswith("[LockSense] startup "))
+        samples.append(json.loads(line.split(" ", 2)[2]))
+    return {mark: statistics.median(s[mark] for s in samples) if mark in samples[0] else None
+            for mark in MARKS}
+
+
+def main():
+    runs = int(sys.argv[1]) if len(sys.argv) > 1 else 7
+    print(f"{'aşama (ms, medyan)':<22} {'ön kurulum':>11} {'--no-prebuild':>14}")
+    staged = run((), runs)
+    eager = run(("--no-prebuild",), runs)
+    for mark in MARKS:
+        cells = ["-" if row[mark] is None else f"{row[mark]:.1f}" for row in (staged, eager)]
+        print(f"{mark:<22} {cells[0]:>11} {cells[1]:>14}")
+
+
+if __name__ == "__main__":
+    main()
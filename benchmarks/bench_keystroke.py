@@ -0,0 +1,54 @@
+"""
+Uzun parolalarda tuş vuruşu başına gecikme: tam analyze() ile
+artımlı AnalysisSession karşılaştırması.
+
+Kullanım:
+    python -m benchmarks.bench_keystroke
+"""
+import random
+import time
+
+from ai_analyzer import AIAnalyzer
+
+WORDS = ["correct", "horse", "battery", "staple", "Kale", "Şehir", "Brücke", "42", "!", "sunset"]
+
+
+def passphrase(length, seed=7):
+    rng = random.Random(seed)
+    parts = []
+    size = 0
+    while size < length:
+        word = rng.choice(WORDS)
+        parts.append(word)
+        size += len(word) + 1
+    return " ".join(parts)[:length]
+
+
+def per_keystroke(func, strokes):
+    start = time.perf_counter()
+    for text in strokes:
+        func(text)
+    return (time.perf_counter() - start) / len(strokes) * 1e6
+
+
+def main():
+    analyzer = AIAnalyzer("en")
+    print(f"{'uzunluk':>8} {'analyze() µs':>14} {'oturum µs':>12} {'hızlanma':>9}")
+    for length in (1_000, 2_500, 5_000, 10_000):
+        base = passphrase(length)
+        # 200 tuş: yazma ve geri silme karışık
+        strokes = []
+        text = base
+        for i in range(200):
+            text = text[:-1] if i % 4 == 3 else text + "x"
+            strokes.append(text)
+
+        full = per_keystroke(analyzer.analyze, strokes)
+        session = analyzer.session()
+        session.update(base)
+        incremental = per_keystroke(session.update, strokes)
+        print(f"{length:>8} {full:>14.1f} {incremental:>12.1f} {full / incremental:>8.1f}x")
+
+
+if __name__ == "__main__":
+    main()
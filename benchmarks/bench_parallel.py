@@ -0,0 +1,46 @@
+"""
+audit_runner ölçeklenme ölçümü: 1, 2, 4, ... çekirdek sayısına kadar süreç.
+
+Kullanım:
+    python -m benchmarks.bench_parallel [satır_sayısı]
+"""
+import io
+import os
+import sys
+import tempfile
+import time
+
+from audit_runner import audit_file_jsonl
+from benchmarks.bench_batch import make_corpus
+
+
+def worker_counts(limit):
+    count = 1
+    while count < limit:
+        yield count
+        count *= 2
+    yield limit
+
+
+def main():
+    lines = int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000
+    cores = os.cpu_count() or 1
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "corpus.txt")
+        with open(path, "w", encoding="utf-8") as f:
+            f.write("\n".join(make_corpus(lines)))
+            f.write("\n")
+
+        print(f"{lines:,} satır, {cores} çekirdek")
+        single = None
+        for workers in worker_counts(cores):
+            start = time.perf_counter()
+            audit_file_jsonl(path, io.BytesIO(), workers=workers, ordered=False)
+            elapsed = time.perf_counter() - start
+            single = single or elapsed * workers
+            print(f"{workers:>3} süreç  {lines / elapsed:>12,.0f} şifre/sn  "
+                  f"verim %{100 * single / (elapsed * workers):.0f}")
+
+
+if __name__ == "__main__":
+    main()
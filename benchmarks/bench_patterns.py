@@ -0,0 +1,36 @@
+"""
+Desen farkındalıklı tahmincinin (PatternEstimator) şifre uzunluğuna göre
+gecikmesi; Shannon entropisiyle karşılaştırmalı.
+
+Kullanım:
+    python -m benchmarks.bench_patterns
+"""
+import time
+
+from ai_analyzer import AIAnalyzer
+from benchmarks.bench_keystroke import passphrase
+from pattern_entropy import PatternEstimator
+
+
+def per_call(func, text, repeat):
+    start = time.perf_counter()
+    for _ in range(repeat):
+        func(text)
+    return (time.perf_counter() - start) / repeat * 1e6
+
+
+def main():
+    estimator = PatternEstimator()
+    analyzer = AIAnalyzer("en")
+    print(f"{'uzunluk':>8} {'Shannon µs':>12} {'desen µs':>10} {'Shannon bit':>12} {'desen bit':>10}")
+    for length in (8, 16, 32, 64, 128, 256, 1_000, 10_000):
+        text = passphrase(length) + "2025!"
+        repeat = max(5, 20_000 // length)
+        shannon = per_call(analyzer._calculate_entropy, text, repeat)
+        pattern = per_call(estimator.estimate, text, repeat)
+        print(f"{length:>8} {shannon:>12.1f} {pattern:>10.1f} "
+              f"{analyzer._calculate_entropy(text):>12.1f} {estimator.estimate(text).bits:>10.1f}")
+
+
+if __name__ == "__main__":
+    main()
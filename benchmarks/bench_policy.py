@@ -0,0 +1,41 @@
+"""
+Bir korpusu N politikaya göre puanlama: politika başına ayrı analyze_many()
+ile tek geçişli PolicySet.score_many() karşılaştırması.
+
+Kullanım:
+    python -m benchmarks.bench_policy
+"""
+import time
+
+from ai_analyzer import AIAnalyzer
+from benchmarks.bench_batch import make_corpus
+from policy import Policy, PolicySet
+
+
+def make_policies(count):
+    return [Policy({"name": f"p{i}", "min_length": 6 + i % 6, "desired_length": 12 + i % 4,
+                    "strong_threshold": 60 + i % 20, "class_points": {"special": 10 + i % 10}})
+            for i in range(count)]
+
+
+def main():
+    passwords = make_corpus(50_000)
+    print(f"{'politika':>9} {'ayrı analiz sn':>15} {'PolicySet sn':>13} {'hızlanma':>9}")
+    for count in (1, 4, 16):
+        policies = make_policies(count)
+        start = time.perf_counter()
+        for policy in policies:
+            for _ in AIAnalyzer(policy=policy).analyze_many(passwords):
+                pass
+        separate = time.perf_counter() - start
+
+        policy_set = PolicySet(policies)
+        start = time.perf_counter()
+        for _ in policy_set.score_many(passwords):
+            pass
+        shared = time.perf_counter() - start
+        print(f"{count:>9} {separate:>15.2f} {shared:>13.2f} {separate / shared:>8.1f}x")
+
+
+if __name__ == "__main__":
+    main()
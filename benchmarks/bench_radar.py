@@ -0,0 +1,39 @@
+"""
+RadarChartWidget çizim maliyeti (ekransız Qt platformu).
+
+Kullanım:
+    QT_QPA_PLATFORM=offscreen python -m benchmarks.bench_radar [kare]
+"""
+import os
+import sys
+import time
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+from PySide6.QtGui import QImage, QPainter
+from PySide6.QtWidgets import QApplication
+
+TARGET = [0.9, 0.75, 0.6, 0.8, 1.0]
+
+
+def main():
+    frames = int(sys.argv[1]) if len(sys.argv) > 1 else 2000
+    app = QApplication.instance() or QApplication([])
+    from ui_components import RadarChartWidget
+
+    widget = RadarChartWidget()
+    image = QImage(widget.size(), QImage.Format_ARGB32_Premultiplied)
+    widget.render(image)  # statik katmanı ısıt
+
+    start = time.perf_counter()
+    for i in range(frames):
+        # Animasyon karesi benzetimi: değerler değişir, tek çizim yapılır
+        widget.set_values([t * (i % 100) / 100 for t in TARGET])
+        widget.render(image)
+    elapsed = time.perf_counter() - start
+    print(f"kare başına çizim: {elapsed / frames * 1000:.3f} ms  ({frames / elapsed:,.0f} kare/sn)")
+    app.processEvents()
+
+
+if __name__ == "__main__":
+    main()
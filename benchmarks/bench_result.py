@@ -0,0 +1,45 @@
+"""
+Sonuç başına bellek ve oluşturma süresi: AnalysisResult (sayısal alanlar,
+metinler erişimde çevrilir) ile eski iç içe sözlük biçimi (to_dict).
+
+Kullanım:
+    python -m benchmarks.bench_result
+"""
+import time
+import tracemalloc
+
+from ai_analyzer import AIAnalyzer
+from benchmarks.bench_batch import make_corpus
+
+
+def measure(build):
+    tracemalloc.start()
+    start = time.perf_counter()
+    results = build()
+    elapsed = time.perf_counter() - start
+    size = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    # Süre tracemalloc açıkken ölçülmez
+    start = time.perf_counter()
+    build()
+    elapsed = time.perf_counter() - start
+    return results, size, elapsed
+
+
+def main(count=100_000):
+    passwords = make_corpus(count)
+    analyzer = AIAnalyzer("tr")
+    print(f"{'biçim':<28} {'bayt/sonuç':>11} {'µs/sonuç':>9}")
+    compact, size, elapsed = measure(lambda: list(analyzer.analyze_many(passwords)))
+    print(f"{'AnalysisResult':<28} {size / count:>11.0f} {elapsed / count * 1e6:>9.2f}")
+    _, size, elapsed = measure(lambda: [result.to_dict() for result in compact])
+    print(f"{'to_dict() (eski biçim)':<28} {size / count:>11.0f} {elapsed / count * 1e6:>9.2f}")
+    start = time.perf_counter()
+    for result in compact:
+        result["status"], result["suggestions"]
+    elapsed = time.perf_counter() - start
+    print(f"{'durum + öneri çevirisi':<28} {'-':>11} {elapsed / count * 1e6:>9.2f}")
+
+
+if __name__ == "__main__":
+    main()
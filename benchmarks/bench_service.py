@@ -0,0 +1,145 @@
+"""
+Puanlama servisi yük testi: kalıcı bağlantılar üzerinden (isteğe bağlı
+ardışık/pipelined) POST /analyze istekleri gönderir, p50/p99 gecikme ve
+saniyedeki istek sayısını raporlar.
+
+Hedef verilmezse servis alt süreçte iki kez başlatılır: mikro parti
+kapalı (--max-batch 1) ve açık (varsayılan) karşılaştırılır.
+
+Kullanım:
+    python -m benchmarks.bench_service
+    python -m benchmarks.bench_service --target 127.0.0.1:8765 -c 64 -p 4
+    python -m benchmarks.bench_service --target /run/locksense.sock
+"""
+import argparse
+import asyncio
+import json
+import subprocess
+import sys
+import time
+
+from benchmarks.bench_batch import make_corpus
+
+
+def _request(password):
+    body = json.dumps({"password": password}).encode("utf-8")
+    return (b"POST /analyze HTTP/1.1\r\nHost: locksense\r\nContent-Type: application/json\r\n"
+            b"Content-Length: " + str(len(body)).encode() + b"\r\n\r\n" + body)
+
+
+async def _read_response(reader):
+    status = await reader.readline()
+    if not status:
+        raise ConnectionError("bağlantı kapandı")
+    length = 0
+    while True:
+        line = await reader.readline()
+        if line in (b"\r\n", b"\n", b""):
+            break
+        name, _, value = line.partition(b":")
+        if name.strip().lower() == b"content-length":
+            length = int(value)
+    body = await reader.readexactly(length)
+    return int(status.split()[1]), body
+
+
+async def _open(target):
+    if target.startswith("/"):
+        return await asyncio.open_unix_connection(target)
+    host, port = target.rsplit(":", 1)
+    return await asyncio.open_connection(host, int(port))
+
+
+async def _health(target):
+    reader, writer = await _open(target)
+    writer.write(b"GET /health HTTP/1.1\r\nHost: locksense\r\nConnection: close\r\n\r\n")
+    health = json.loads((await _read_response(reader))[1])
+    writer.close()
+    return health
+
+
+async def _worker(target, requests, pipeline, latencies, errors):
+    reader, writer = await _open(target)
+    try:
+        for start in range(0, len(requests), pipeline):
+            group = requests[start:start + pipeline]
+            sent = time.perf_counter()
+            writer.write(b"".join(group))
+            await writer.drain()
+            for _ in group:
+                status, _ = await _read_response(reader)
+                latencies.append(time.perf_counter() - sent)
+                if status != 200:
+                    errors.append(status)
+    finally:
+        writer.close()
+
+
+async def load(target, total=20_000, connections=32, pipeline=1):
+    """Yük testini çalıştırır; özet sözlük döner."""
+    passwords = make_corpus(total, seed=5)
+    requests = [_request(password) for password in passwords]
+    before = await _health(target)
+    share = -(-total // connections)
+    latencies, errors = [], []
+    start = time.perf_counter()
+    await asyncio.gather(*(
+        _worker(target, requests[i * share:(i + 1) * share], pipeline, latencies, errors)
+        for i in range(connections)))
+    elapsed = time.perf_counter() - start
+
+    after = await _health(target)
+    batches = after["batches"] - before["batches"]
+
+    latencies.sort()
+    return {
+        "requests": len(latencies),
+        "errors": len(errors),
+        "rps": len(latencies) / elapsed,
+        "p50_ms": latencies[len(latencies) // 2] * 1000,
+        "p99_ms": latencies[min(len(latencies) - 1, int(len(latencies) * 0.99))] * 1000,
+        "mean_batch": (after["requests"] - before["requests"]) / batches if batches else 0.0,
+    }
+
+
+def _print(label, stats):
+    print(f"{label:<24} {stats['rps']:>10,.0f} {stats['p50_ms']:>8.2f} {stats['p99_ms']:>8.2f} "
+          f"{stats['mean_batch']:>7.1f} {stats['errors']:>6}")
+
+
+def _spawn(*extra):
+    process = subprocess.Popen([sys.executable, "-m", "service", "--port", "0", *extra],
+                               stdout=subprocess.PIPE, text=True)
+    line = process.stdout.readline().split()
+    if len(line) != 2:
+        process.kill()
+        raise RuntimeError("servis başlatılamadı")
+    return process, line[1]
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog="python -m benchmarks.bench_service")
+    parser.add_argument("--target", default=None, help="host:port veya Unix soketi yolu")
+    parser.add_argument("-n", "--requests", type=int, default=20_000)
+    parser.add_argument("-c", "--connections", type=int, default=32)
+    parser.add_argument("-p", "--pipeline", type=int, default=1, help="bağlantı başına ardışık istek")
+    args = parser.parse_args(argv)
+
+    print(f"{'hedef':<24} {'istek/sn':>10} {'p50 ms':>8} {'p99 ms':>8} {'parti':>7} {'hata':>6}")
+    if args.target:
+        _print(args.target, asyncio.run(load(args.target, args.requests, args.connections, args.pipeline)))
+        return 0
+    for label, extra in (("parti yok (max 1)", ("--max-batch", "1")), ("mikro parti", ())):
+        process, target = _spawn(*extra)
+        try:
+            for pipeline in sorted({1, args.pipeline, 8}):
+                stats = asyncio.run(load(target, args.requests, args.connections, pipeline))
+                _print(f"{label}, p={pipeline}", stats)
+        finally:
+            process.terminate()
+            process.wait()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
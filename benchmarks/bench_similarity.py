@@ -0,0 +1,55 @@
+"""
+Tekrar kullanım / yakın kopya dizininin ölçeklenmesi: girdi sayısı arttıkça
+şifre başına süre yaklaşık sabit kalmalıdır (alt-karesel).
+
+Korpus: rastgele şifreler + kelime/yıl/sembol varyantları + tek karakter
+yazım hataları + birebir tekrarlar.
+
+Kullanım:
+    python -m benchmarks.bench_similarity [en büyük adet]
+"""
+import random
+import sys
+import time
+
+from benchmarks.bench_batch import make_corpus
+from pattern_entropy import WORDS
+from similarity import SimilarityIndex
+
+
+def make_reuse_corpus(count, seed=7):
+    rng = random.Random(seed)
+    base = make_corpus(count // 2, seed)
+    out = list(base)
+    while len(out) < count:
+        kind = rng.random()
+        if kind < 0.4:
+            word = rng.choice(WORDS).capitalize()
+            out.append(f"{word}{rng.randint(1990, 2025)}{rng.choice('!.?*')}")
+        elif kind < 0.7:
+            source = rng.choice(base)
+            i = rng.randrange(len(source))
+            out.append(source[:i] + rng.choice("xyz") + source[i + 1:])
+        else:
+            out.append(rng.choice(out))
+    rng.shuffle(out)
+    return out
+
+
+def main(largest=1_000_000):
+    sizes = [size for size in (10_000, 100_000, 1_000_000) if size <= largest] or [largest]
+    print(f"{'adet':>10} {'süre sn':>9} {'µs/şifre':>9} {'küme':>8} {'tekrar':>8} {'varyant':>8} {'yakın':>8}")
+    for size in sizes:
+        corpus = make_reuse_corpus(size)
+        index = SimilarityIndex(key=b"k" * 32)
+        start = time.perf_counter()
+        index.add_many(enumerate(corpus))
+        report = index.report()
+        elapsed = time.perf_counter() - start
+        kinds = report["clusters_by_kind"]
+        print(f"{size:>10,} {elapsed:>9.2f} {elapsed / size * 1e6:>9.1f} {report['clusters']:>8,} "
+              f"{kinds['exact']:>8,} {kinds['variant']:>8,} {kinds['near']:>8,}")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000)
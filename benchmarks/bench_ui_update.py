@@ -0,0 +1,41 @@
+"""
+LockSenseUI.update_ui tuş vuruşu başına süre (ekransız Qt platformu).
+
+Kullanım:
+    python -m benchmarks.bench_ui_update [tuş_sayısı]
+"""
+import os
+import sys
+import time
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+from PySide6.QtWidgets import QApplication
+
+
+def main():
+    strokes = int(sys.argv[1]) if len(sys.argv) > 1 else 2000
+    app = QApplication.instance() or QApplication([])
+    from ui import LockSenseUI
+
+    window = LockSenseUI("en")
+    window.show()
+    target = "Correct-Horse7!Battery"
+    texts = [target[:i % len(target) + 1] for i in range(strokes)]
+    results = [window.analyzer.analyze(text) for text in texts]
+
+    # Sinyalleri kapatıp update_ui'yi doğrudan ölçeriz
+    window.password_input.blockSignals(True)
+    total = 0.0
+    for text, result in zip(texts, results):
+        window.password_input.setText(text)
+        start = time.perf_counter()
+        window.update_ui(result)
+        total += time.perf_counter() - start
+        app.processEvents()
+    print(f"update_ui: {total / strokes * 1000:.3f} ms/tuş ({strokes} tuş)")
+    window.scheduler.shutdown()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,72 @@
+"""
+Kasa içe/dışa aktarma hızı: eski yol (çağrı başına yeni bağlantı ve satır
+başına commit) ile kalıcı bağlantı + add_many() + yineleyici karşılaştırması.
+
+Kullanım:
+    python -m benchmarks.bench_vault [satır sayısı]
+"""
+import base64
+import os
+import sqlite3
+import sys
+import tempfile
+import time
+
+from vault import PasswordVault
+
+
+def make_entries(count):
+    return [(f"service{i % 5000}.example", f"user{i}", f"Parola_{i:06d}!") for i in range(count)]
+
+
+def legacy_add(db_path, service, username, password):
+    encoded = base64.b64encode(password.encode()).decode()
+    with sqlite3.connect(db_path) as conn:
+        conn.execute("INSERT INTO vault (service, username, password) VALUES (?, ?, ?)",
+                     (service, username, encoded))
+
+
+def main(count=100_000):
+    entries = make_entries(count)
+    with tempfile.TemporaryDirectory() as tmp:
+        # Eski yol çok yavaş: küçük bir örnekle ölçülür
+        legacy_count = min(count, 500)
+        legacy_path = os.path.join(tmp, "legacy.db")
+        PasswordVault(legacy_path).close()
+        start = time.perf_counter()
+        for entry in entries[:legacy_count]:
+            legacy_add(legacy_path, *entry)
+        legacy_rate = legacy_count / (time.perf_counter() - start)
+
+        with PasswordVault(os.path.join(tmp, "vault.db")) as vault:
+            start = time.perf_counter()
+            vault.add_many(entries)
+            import_rate = count / (time.perf_counter() - start)
+
+            start = time.perf_counter()
+            exported = sum(1 for _ in vault.get_passwords())
+            export_rate = exported / (time.perf_counter() - start)
+
+            # Tek servis araması: tam tarama ile indeksli arama
+            target = entries[len(entries) // 2][0]
+            start = time.perf_counter()
+            scanned = [row for row in vault.get_passwords() if row[0] == target]
+            scan_ms = (time.perf_counter() - start) * 1000
+            lookups = {}
+            for mode, query in (("exact", target), ("prefix", target[:9]), ("fuzzy", target[3:10])):
+                start = time.perf_counter()
+                for _ in range(100):
+                    vault.search(query, mode=mode)
+                lookups[mode] = (time.perf_counter() - start) * 10
+
+    print(f"eski add_password   {legacy_rate:>12,.0f} satır/sn  ({legacy_count} satır)")
+    print(f"add_many            {import_rate:>12,.0f} satır/sn  ({count} satır, "
+          f"{import_rate / legacy_rate:.0f}x)")
+    print(f"get_passwords       {export_rate:>12,.0f} satır/sn  ({exported} satır)")
+    print(f"tarama ile arama    {scan_ms:>12.2f} ms  ({len(scanned)} satır)")
+    for mode, ms in lookups.items():
+        print(f"search({mode})".ljust(20) + f"{ms:>12.3f} ms")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 100_000)
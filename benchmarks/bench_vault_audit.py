@@ -0,0 +1,47 @@
+"""
+Kasa sağlık denetimi: ilk tam denetim ile birkaç satır değiştikten sonraki
+artımlı denetimin süresi.
+
+Kullanım:
+    python -m benchmarks.bench_vault_audit [satır sayısı]
+"""
+import os
+import sys
+import tempfile
+import time
+
+from benchmarks.bench_batch import make_corpus
+from vault import PasswordVault
+from vault_audit import VaultAuditor
+
+
+def main(count=100_000):
+    passwords = make_corpus(count)
+    entries = [(f"service{i}.example", f"user{i}", password) for i, password in enumerate(passwords)]
+    with tempfile.TemporaryDirectory() as tmp:
+        with PasswordVault(os.path.join(tmp, "vault.db")) as vault:
+            vault.add_many(entries)
+            auditor = VaultAuditor(vault)
+
+            start = time.perf_counter()
+            report = auditor.run()
+            first = time.perf_counter() - start
+
+            start = time.perf_counter()
+            auditor.run()
+            unchanged = time.perf_counter() - start
+
+            vault.add_many(entries[:count // 100])
+            start = time.perf_counter()
+            incremental = auditor.run()
+            changed = time.perf_counter() - start
+
+    print(f"ilk denetim          {first * 1000:>9.0f} ms  ({report['rescored']} satır)")
+    print(f"değişiklik yok       {unchanged * 1000:>9.0f} ms")
+    print(f"%1 yeni satır        {changed * 1000:>9.0f} ms  ({incremental['rescored']} satır)")
+    print(f"zayıf {incremental['status']['weak']}, sızdırılmış {len(incremental['breached_ids'])}, "
+          f"tekrar kullanım grubu {incremental['reused_groups']}")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 100_000)
@@ -0,0 +1,47 @@
+"""
+Şifreli kasa ölçümü: kilit açma (scrypt KDF) süresi, şifreli içe aktarma ve
+satır başına şifre çözme hızı (tek ve çok iş parçacıklı).
+
+Kullanım:
+    python -m benchmarks.bench_vault_crypto [satır sayısı]
+"""
+import os
+import sys
+import tempfile
+import time
+
+from benchmarks.bench_vault import make_entries
+from vault import PasswordVault
+
+
+def main(count=100_000):
+    entries = make_entries(count)
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "vault.db")
+        start = time.perf_counter()
+        vault = PasswordVault(path, master_password="ana-parola")
+        setup = time.perf_counter() - start
+
+        start = time.perf_counter()
+        vault.add_many(entries)
+        import_rate = count / (time.perf_counter() - start)
+        vault.close()
+
+        start = time.perf_counter()
+        vault = PasswordVault(path, master_password="ana-parola")
+        unlock = time.perf_counter() - start
+        print(f"ilk kurulum (KDF)   {setup * 1000:>10.0f} ms")
+        print(f"kilit açma (KDF)    {unlock * 1000:>10.0f} ms")
+        print(f"şifreli add_many    {import_rate:>10,.0f} satır/sn")
+        for workers in sorted({1, 2, os.cpu_count() or 1}):
+            vault.decrypt_workers = workers
+            start = time.perf_counter()
+            total = sum(1 for _ in vault.get_passwords())
+            rate = total / (time.perf_counter() - start)
+            print(f"çözme ({workers} iş parç.)   {rate:>10,.0f} satır/sn "
+                  f"({1e6 / rate:.1f} µs/satır)")
+        vault.close()
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 100_000)
@@ -0,0 +1,37 @@
+"""
+analyze_many() ile NumPy vektörel yolunun karşılaştırması.
+
+Kullanım:
+    python -m benchmarks.bench_vectorized [adet] [parti_boyutu]
+"""
+import sys
+import time
+
+from ai_analyzer import AIAnalyzer
+from benchmarks.bench_batch import make_corpus
+from vectorized import VectorAnalyzer
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 200_000
+    batch_size = int(sys.argv[2]) if len(sys.argv) > 2 else 50_000
+    corpus = make_corpus(count)
+    analyzer = AIAnalyzer("en")
+    vector = VectorAnalyzer(analyzer)
+
+    start = time.perf_counter()
+    for _ in analyzer.analyze_many(corpus):
+        pass
+    base = time.perf_counter() - start
+    print(f"{'analyze_many()':<24} {count / base:>12,.0f} şifre/sn")
+
+    start = time.perf_counter()
+    for i in range(0, count, batch_size):
+        vector.analyze_batch(corpus[i:i + batch_size])
+    fast = time.perf_counter() - start
+    print(f"{'VectorAnalyzer':<24} {count / fast:>12,.0f} şifre/sn  (parti={batch_size})")
+    print(f"hızlanma: {base / fast:.2f}x")
+
+
+if __name__ == "__main__":
+    main()
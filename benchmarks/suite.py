@@ -0,0 +1,358 @@
+"""
+Performans gerileme takımı.
+
+Her ölçüm deterministik sentetik veriyle çalışır ve işlem başına süreyi
+(mikrosaniye, tekrarların en iyisi) raporlar. Sonuçlar JSON olarak
+kaydedilip taban çizgisi (baseline) olarak saklanabilir; karşılaştırma
+modunda herhangi bir ölçüm eşikten fazla yavaşlarsa çıkış kodu 1'dir.
+
+Kapsam:
+  analyze/len{8,16,64}/{lower,alnum,full,unicode}  AIAnalyzer.analyze
+  entropy/len{16,256,4096}                          _calculate_entropy
+  blocklist/{memory,index,filtered}/<boyut>         yaygın şifre sorgusu
+  vault/{insert,read}/{10K,100K}                    PasswordVault add_many / okuma
+  radar/paint                                       RadarChartWidget çizimi (offscreen Qt)
+
+Kullanım:
+    python -m benchmarks                                  # tümünü çalıştır
+    python -m benchmarks -k analyze --quick               # süzgeç, büyük ölçümler hariç
+    python -m benchmarks --save benchmarks/baseline.json  # taban çizgisini kaydet
+    python -m benchmarks --compare benchmarks/baseline.json --threshold 0.25
+    python -m benchmarks --compare old.json --results new.json   # çalıştırmadan
+"""
+
+import argparse
+import json
+import os
+import platform
+import random
+import string
+import sys
+import tempfile
+import time
+
+from benchmarks.bench_batch import make_corpus
+
+SCHEMA_VERSION = 1
+DEFAULT_THRESHOLD = 0.25
+# Mikrosaniyenin altındaki ölçümlerde zamanlayıcı gürültüsü oranı şişirir
+DEFAULT_MIN_DELTA_US = 0.25
+DEFAULT_REPEAT = 5
+
+_ALPHABETS = {
+    "lower": string.ascii_lowercase,
+    "alnum": string.ascii_letters + string.digits,
+    "full": string.ascii_letters + string.digits + "!@#$%^&*(),.?\":{}|<>",
+    "unicode": "abcçdefgğhıijklmnoöprsştuüvyzABCÇDEFGĞHIİJKLMNOÖPRSŞTUÜVYZ0123456789!?ßéÄ",
+}
+
+
+def make_passwords(count, length, alphabet, seed):
+    rng = random.Random(seed)
+    return ["".join(rng.choice(alphabet) for _ in range(length)) for _ in range(count)]
+
+
+def best_of(func, repeat, setup=None):
+    """func'ı repeat kez çalıştırır; (en iyi, medyan) saniye döner."""
+    samples = []
+    for _ in range(repeat):
+        state = setup() if setup is not None else None
+        start = time.perf_counter()
+        func(state) if setup is not None else func()
+        samples.append(time.perf_counter() - start)
+    samples.sort()
+    return samples[0], samples[len(samples) // 2]
+
+
+class Case:
+    """Tek ölçüm: run(repeat) -> (en iyi sn, medyan sn, işlem sayısı)."""
+
+    def __init__(self, name, run, large=False):
+        self.name = name
+        self.run = run
+        self.large = large
+
+
+class Skip(Exception):
+    """Ölçüm bu ortamda çalıştırılamaz (ör. isteğe bağlı bağımlılık yok)."""
+
+
+def _analyze_case(length, mix):
+    def run(repeat):
+        from ai_analyzer import AIAnalyzer
+        analyzer = AIAnalyzer()
+        passwords = make_passwords(2000, length, _ALPHABETS[mix], seed=length)
+        analyze = analyzer.analyze
+
+        def loop():
+            for password in passwords:
+                analyze(password)
+        return best_of(loop, repeat) + (len(passwords),)
+    return Case(f"analyze/len{length}/{mix}", run)
+
+
+def _entropy_case(length):
+    def run(repeat):
+        from ai_analyzer import AIAnalyzer
+        entropy = AIAnalyzer()._calculate_entropy
+        count = max(20, 40_000 // length)
+        passwords = make_passwords(count, length, _ALPHABETS["full"], seed=length + 1)
+
+        def loop():
+            for password in passwords:
+                entropy(password)
+        return best_of(loop, repeat) + (count,)
+    return Case(f"entropy/len{length}", run)
+
+
+def _blocklist_queries(entries, count=20_000, seed=3):
+    """Yarısı listede olan, yarısı olmayan deterministik sorgular."""
+    rng = random.Random(seed)
+    hits = [entries[rng.randrange(len(entries))] for _ in range(count // 2)]
+    return hits + make_corpus(count - len(hits), seed=seed)
+
+
+def _blocklist_case(kind, size, label, large=False):
+    def run(repeat):
+        from blocklist import MemoryBlocklist, build_filter, build_index, open_blocklist
+        entries = make_corpus(size, seed=11)
+        queries = _blocklist_queries(entries)
+        with tempfile.TemporaryDirectory() as tmp:
+            if kind == "memory":
+                blocklist = MemoryBlocklist(entries)
+            else:
+                wordlist = os.path.join(tmp, "words.txt")
+                index = os.path.join(tmp, "words.idx")
+                with open(wordlist, "w", encoding="utf-8") as f:
+                    f.write("\n".join(entries))
+                build_index(wordlist, index)
+                if kind == "filtered":
+                    build_filter(index)
+                blocklist = open_blocklist(index, use_filter=kind == "filtered")
+            try:
+                def loop():
+                    for password in queries:
+                        password in blocklist
+                return best_of(loop, repeat) + (len(queries),)
+            finally:
+                blocklist.close()
+    return Case(f"blocklist/{kind}/{label}", run, large)
+
+
+def _vault_entries(count):
+    return [(f"service{i % 5000}.example", f"user{i}", f"Parola_{i:06d}!") for i in range(count)]
+
+
+def _vault_case(op, count, label, large=False):
+    def run(repeat):
+        from vault import PasswordVault
+        entries = _vault_entries(count)
+        with tempfile.TemporaryDirectory() as tmp:
+            if op == "insert":
+                paths = iter(range(repeat))
+
+                def setup():
+                    return PasswordVault(os.path.join(tmp, f"insert{next(paths)}.db"))
+
+                def insert(vault):
+                    vault.add_many(entries)
+                    vault.close()
+                return best_of(insert, repeat, setup) + (count,)
+            with PasswordVault(os.path.join(tmp, "read.db")) as vault:
+                vault.add_many(entries)
+
+                def read():
+                    for _ in vault.get_passwords():
+                        pass
+                return best_of(read, repeat) + (count,)
+    return Case(f"vault/{op}/{label}", run, large)
+
+
+def _radar_case():
+    def run(repeat):
+        os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+        try:
+            from PySide6.QtGui import QImage
+            from PySide6.QtWidgets import QApplication
+        except ImportError:
+            raise Skip("PySide6 kurulu değil") from None
+        app = QApplication.instance() or QApplication([])
+        from ui_components import RadarChartWidget
+        widget = RadarChartWidget()
+        image = QImage(widget.size(), QImage.Format_ARGB32_Premultiplied)
+        widget.render(image)  # statik katmanı ısıt
+        frames = 500
+        target = [0.9, 0.75, 0.6, 0.8, 1.0]
+
+        def loop():
+            for i in range(frames):
+                # Animasyon karesi: değerler değişir, tek çizim yapılır
+                widget.set_values([t * (i % 100) / 100 for t in target])
+                widget.render(image)
+        result = best_of(loop, repeat) + (frames,)
+        app.processEvents()
+        return result
+    return Case("radar/paint", run)
+
+
+def build_cases():
+    cases = [_analyze_case(length, mix) for length in (8, 16, 64) for mix in _ALPHABETS]
+    cases += [_entropy_case(length) for length in (16, 256, 4096)]
+    cases += [
+        _blocklist_case("memory", 1_000, "1K"),
+        _blocklist_case("memory", 100_000, "100K"),
+        _blocklist_case("index", 100_000, "100K"),
+        _blocklist_case("index", 1_000_000, "1M", large=True),
+        _blocklist_case("filtered", 1_000_000, "1M", large=True),
+        _vault_case("insert", 10_000, "10K"),
+        _vault_case("read", 10_000, "10K"),
+        _vault_case("insert", 100_000, "100K", large=True),
+        _vault_case("read", 100_000, "100K", large=True),
+        _radar_case(),
+    ]
+    return cases
+
+
+def run_cases(cases, repeat=DEFAULT_REPEAT, out=sys.stdout):
+    """Ölçümleri çalıştırır ve sonuç belgesini (sözlük) döner."""
+    results = {}
+    for case in cases:
+        try:
+            best, median, ops = case.run(repeat)
+        except Skip as exc:
+            results[case.name] = {"skipped": str(exc)}
+            out.write(f"{case.name:<32} atlandı: {exc}\n")
+            continue
+        results[case.name] = {
+            "us_per_op": round(best / ops * 1e6, 4),
+            "median_us_per_op": round(median / ops * 1e6, 4),
+            "ops": ops,
+            "repeat": repeat,
+        }
+        out.write(f"{case.name:<32} {best / ops * 1e6:>12.3f} µs/işlem\n")
+        out.flush()
+    return {
+        "schema": SCHEMA_VERSION,
+        "meta": {
+            "python": platform.python_version(),
+            "implementation": platform.python_implementation(),
+            "platform": platform.platform(),
+            "machine": platform.machine(),
+            "cpus": os.cpu_count(),
+            "created": time.strftime("%Y-%m-%dT%H:%M:%S"),
+        },
+        "results": results,
+    }
+
+
+def compare(baseline, current, threshold=DEFAULT_THRESHOLD, min_delta_us=DEFAULT_MIN_DELTA_US,
+            out=sys.stdout, excluded=()):
+    """
+    İki sonuç belgesini karşılaştırır; eşikten fazla yavaşlayan ölçümlerin
+    adlarını döner. Oran = güncel / taban (1.30 -> %30 daha yavaş); işlem
+    başına farkı min_delta_us'tan küçük olanlar gerileme sayılmaz.
+
+    Tabanda ölçülmüş olup güncel çalıştırmada bulunmayan veya atlanan
+    ölçümler de başarısız sayılır ve döner (çalışmayı bırakan bir ölçüm
+    kapıyı yeşile çevirmemeli); yalnızca excluded içindekiler (-k/--quick
+    ile seçim dışı bırakılanlar) hariç tutulur.
+    """
+    regressions = []
+    base_results = baseline["results"]
+    current_results = current["results"]
+    missing = []
+    for name, base in base_results.items():
+        if "us_per_op" not in base or name in excluded:
+            continue
+        result = current_results.get(name)
+        if result is None or "us_per_op" not in result:
+            missing.append(name)
+    out.write(f"{'ölçüm':<32} {'taban µs':>12} {'güncel µs':>12} {'oran':>7}\n")
+    for name, result in current_results.items():
+        if name in missing:
+            continue
+        base = base_results.get(name)
+        if base is None or "us_per_op" not in base or "us_per_op" not in result:
+            out.write(f"{name:<32} {'-':>12} {result.get('us_per_op', '-'):>12} {'yok':>7}\n")
+            continue
+        ratio = result["us_per_op"] / base["us_per_op"] if base["us_per_op"] else 1.0
+        flag = ""
+        if ratio > 1 + threshold and result["us_per_op"] - base["us_per_op"] > min_delta_us:
+            regressions.append(name)
+            flag = "  GERİLEME"
+        out.write(f"{name:<32} {base['us_per_op']:>12.3f} {result['us_per_op']:>12.3f} "
+                  f"{ratio:>7.2f}{flag}\n")
+    for name in missing:
+        result = current_results.get(name)
+        reason = f"atlandı: {result['skipped']}" if result and "skipped" in result else "çalışmadı"
+        out.write(f"{name:<32} {base_results[name]['us_per_op']:>12.3f} {'-':>12} "
+                  f"{'yok':>7}  EKSİK ({reason})\n")
+    if regressions:
+        out.write(f"{len(regressions)} ölçüm %{threshold * 100:.0f} eşiğinden fazla yavaşladı\n")
+    if missing:
+        out.write(f"{len(missing)} taban ölçümü bu çalıştırmada ölçülmedi\n")
+    return regressions + missing
+
+
+def _load(path):
+    with open(path, encoding="utf-8") as f:
+        document = json.load(f)
+    if document.get("schema") != SCHEMA_VERSION:
+        raise ValueError(f"{path}: desteklenmeyen sonuç şeması")
+    return document
+
+
+def _save(document, path):
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(document, f, ensure_ascii=False, indent=2, sort_keys=True)
+        f.write("\n")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(
+        prog="python -m benchmarks",
+        description="LockSense performans takımı ve gerileme kontrolü.")
+    parser.add_argument("-k", "--filter", action="append", default=None,
+                        help="yalnızca adında bu metin geçen ölçümler (tekrarlanabilir)")
+    parser.add_argument("--quick", action="store_true", help="büyük (1M / 100K) ölçümleri atla")
+    parser.add_argument("--repeat", type=int, default=DEFAULT_REPEAT)
+    parser.add_argument("--save", metavar="JSON", help="sonuçları dosyaya yaz (taban çizgisi)")
+    parser.add_argument("--compare", metavar="JSON", help="taban çizgisiyle karşılaştır")
+    parser.add_argument("--results", metavar="JSON",
+                        help="çalıştırmak yerine bu sonuç dosyasını karşılaştır")
+    parser.add_argument("--threshold", type=float, default=DEFAULT_THRESHOLD,
+                        help="izin verilen yavaşlama oranı (varsayılan 0.25 = %%25)")
+    parser.add_argument("--min-delta", type=float, default=DEFAULT_MIN_DELTA_US, metavar="US",
+                        help="bundan küçük mutlak farklar (µs/işlem) gerileme sayılmaz")
+    parser.add_argument("--list", action="store_true", help="ölçüm adlarını listele")
+    args = parser.parse_args(argv)
+
+    cases = build_cases()
+    all_names = {case.name for case in cases}
+    if args.filter:
+        cases = [case for case in cases if any(text in case.name for text in args.filter)]
+    if args.quick:
+        cases = [case for case in cases if not case.large]
+    if args.list:
+        for case in cases:
+            print(case.name + ("  (büyük)" if case.large else ""))
+        return 0
+
+    try:
+        baseline = _load(args.compare) if args.compare else None
+        if args.results:
+            current = _load(args.results)
+        else:
+            current = run_cases(cases, args.repeat)
+    except (OSError, ValueError) as exc:
+        parser.error(str(exc))
+    if args.save:
+        _save(current, args.save)
+    if baseline is not None:
+        names = {case.name for case in cases}
+        if args.results and (args.filter or args.quick):
+            current = {**current, "results": {name: result for name, result in current["results"].items()
+                                              if name in names}}
+        return 1 if compare(baseline, current, args.threshold, args.min_delta,
+                            excluded=all_names - names) else 0
+    return 0
@@ -0,0 +1,518 @@
+"""
+Yaygın/sızdırılmış şifre kara listeleri.
+
+İki uygulama aynı arayüzü sunar (`password in blocklist`):
+  - MemoryBlocklist: küçük listeler için bellekte frozenset.
+  - HashIndexBlocklist: bir kelime listesinden bir kez inşa edilen,
+    sıralı 64-bit hash dizisi. Dosya mmap ile açılır, aramalar ikili arama
+    (O(log n)) ile yapılır ve kayıt başına Python nesnesi oluşturulmaz.
+
+İsteğe bağlı olarak dizinin yanına (`<dizin>.bloom`) bir Bloom filtresi
+yazılır. FilteredBlocklist önce filtreye bakar; tam arama yalnızca filtre
+isabetlerinde çalışır. Filtre yalnızca istenirse (use_filter=True) ve
+başlığındaki kayıt sayısı ile dizin özeti eşleşirse kullanılır; sıcak
+önbellekte dizin araması filtreden hızlıdır, filtre soğuk/büyük dizinler içindir.
+
+Kayıtlar küçük harfe çevrilerek saklanır; analizör de aynı normalizasyonu
+kullanır.
+"""
+
+import os
+import sys
+import math
+import mmap
+import bisect
+import struct
+import hashlib
+from array import array
+
+MAGIC = b"LSBL"
+VERSION = 1
+# magic (4) + sürüm (2) + ayrılmış (2) + kayıt sayısı (8)
+HEADER = struct.Struct("<4sHHQ")
+
+BLOOM_MAGIC = b"LSBF"
+BLOOM_VERSION = 2
+# magic (4) + sürüm (2) + hash sayısı k (2) + bit sayısı m (8) + kayıt sayısı n (8)
+# + hedef FPR (8) + dizin kayıt sayısı (8) + dizin özeti (16)
+BLOOM_HEADER = struct.Struct("<4sHHQQdQ16s")
+# Dizin özeti için örneklenen kayıt sayısı (ilk ve son kayıt dahil)
+DIGEST_SAMPLES = 4096
+BLOOM_SUFFIX = ".bloom"
+DEFAULT_FPR = 0.01
+
+_MASK64 = (1 << 64) - 1
+
+# Harici sıralamada bir parçadaki hash sayısı (sıralama sırasında ~100 MB)
+DEFAULT_CHUNK_SIZE = 2_000_000
+
+
+def password_hash(password: str) -> int:
+    """Normalize edilmiş şifrenin 64-bit BLAKE2b hash değerini döner."""
+    data = password.lower().encode("utf-8", "surrogateescape")
+    return int.from_bytes(hashlib.blake2b(data, digest_size=8).digest(), "little")
+
+
+class MemoryBlocklist:
+    """Bellek içi kara liste (varsayılan COMMON_PASSWORDS için)."""
+
+    def __init__(self, passwords=()):
+        self._entries = frozenset(p.lower() for p in passwords)
+
+    def __contains__(self, password):
+        return password.lower() in self._entries
+
+    def __len__(self):
+        return len(self._entries)
+
+    def close(self):
+        pass
+
+
+class HashIndexBlocklist:
+    """
+    mmap ile açılan sıralı hash dizisi üzerinde kara liste.
+    Dosya biçimi: HEADER + küçükten büyüğe sıralı, tekrarsız uint64 (little-endian).
+    """
+
+    def __init__(self, path):
+        self.path = path
+        self._file = open(path, "rb")
+        try:
+            header = self._file.read(HEADER.size)
+            if len(header) < HEADER.size:
+                raise ValueError(f"Geçersiz kara liste dosyası: {path}")
+            magic, version, _, count = HEADER.unpack(header)
+            if magic != MAGIC or version != VERSION:
+                raise ValueError(f"Desteklenmeyen kara liste dosyası: {path}")
+            self._count = count
+            if count:
+                self._mmap = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+                if len(self._mmap) != HEADER.size + count * 8:
+                    raise ValueError(f"Kara liste dosyası kesilmiş: {path}")
+                view = memoryview(self._mmap)[HEADER.size:]
+                if sys.byteorder == "little":
+                    self._hashes = view.cast("Q")
+                else:
+                    self._hashes = _LittleEndianView(view, count)
+            else:
+                self._mmap = None
+                self._hashes = ()
+        except Exception:
+            self._file.close()
+            raise
+
+    def __contains__(self, password):
+        return self.contains_hash(password_hash(password))
+
+    def contains_hash(self, value):
+        """Önceden hesaplanmış hash için ikili arama yapar."""
+        hashes = self._hashes
+        i = bisect.bisect_left(hashes, value)
+        return i < self._count and hashes[i] == value
+
+    def __len__(self):
+        return self._count
+
+    def iter_hashes(self):
+        """Dizideki hash değerlerini sırayla döner."""
+        return iter(self._hashes)
+
+    def digest(self):
+        """
+        Kayıt sayısı ve eşit aralıklı DIGEST_SAMPLES kaydın 128-bit özeti.
+        Dizinin tamamını okumaz; filtrenin bu dizinden üretildiğini doğrular.
+        """
+        count = self._count
+        h = hashlib.blake2b(count.to_bytes(8, "little"), digest_size=16)
+        if count:
+            hashes = self._hashes
+            step = max(1, (count - 1) // (DIGEST_SAMPLES - 1))
+            positions = list(range(0, count, step))
+            if positions[-1] != count - 1:
+                positions.append(count - 1)
+            h.update(array("Q", (hashes[i] for i in positions)).tobytes())
+        return h.digest()
+
+    def close(self):
+        if self._mmap is not None:
+            if isinstance(self._hashes, memoryview):
+                self._hashes.release()
+            self._hashes = ()
+            self._mmap.close()
+            self._mmap = None
+        self._file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+class _LittleEndianView:
+    """Big-endian sistemler için dizinin struct tabanlı okuma görünümü."""
+
+    def __init__(self, view, count):
+        self._view = view
+        self._count = count
+
+    def __len__(self):
+        return self._count
+
+    def __getitem__(self, i):
+        if not 0 <= i < self._count:
+            raise IndexError(i)
+        return struct.unpack_from("<Q", self._view, i * 8)[0]
+
+
+class BloomFilter:
+    """
+    Olasılıksal üyelik filtresi. k konum, tek bir 64-bit hash'ten
+    çift hash (Kirsch-Mitzenmacher) yöntemiyle türetilir.
+    """
+
+    def __init__(self, bits, num_bits, num_hashes, count, target_fpr,
+                 index_count=0, index_digest=bytes(16)):
+        self._bits = bits
+        self.num_bits = num_bits
+        self.num_hashes = num_hashes
+        self.count = count
+        self.target_fpr = target_fpr
+        # Filtrenin üretildiği dizin (open_blocklist eşleşmeyi denetler)
+        self.index_count = index_count
+        self.index_digest = index_digest
+
+    def matches(self, index):
+        """Filtre bu dizinden mi üretildi? Değilse yanlış negatif verebilir."""
+        return self.index_count == len(index) and self.index_digest == index.digest()
+
+    @classmethod
+    def for_capacity(cls, count, fpr=DEFAULT_FPR):
+        """count kayıt ve hedef yanlış pozitif oranı için boş filtre oluşturur."""
+        if not 0 < fpr < 1:
+            raise ValueError("fpr 0 ile 1 arasında olmalı")
+        count = max(1, count)
+        num_bits = max(8, math.ceil(-count * math.log(fpr) / (math.log(2) ** 2)))
+        num_hashes = max(1, round(num_bits / count * math.log(2)))
+        return cls(bytearray((num_bits + 7) // 8), num_bits, num_hashes, 0, fpr)
+
+    def add_hash(self, value):
+        bits = self._bits
+        m = self.num_bits
+        step = _mix64(value)
+        for i in range(self.num_hashes):
+            pos = (value + i * step) % m
+            bits[pos >> 3] |= 1 << (pos & 7)
+        self.count += 1
+
+    def contains_hash(self, value):
+        bits = self._bits
+        m = self.num_bits
+        step = _mix64(value)
+        for i in range(self.num_hashes):
+            pos = (value + i * step) % m
+            if not bits[pos >> 3] & (1 << (pos & 7)):
+                return False
+        return True
+
+    def __contains__(self, password):
+        return self.contains_hash(password_hash(password))
+
+    @property
+    def memory_bytes(self):
+        return len(self._bits)
+
+    @property
+    def expected_fpr(self):
+        """Doluluk oranından hesaplanan teorik yanlış pozitif oranı."""
+        if not self.count:
+            return 0.0
+        k, m, n = self.num_hashes, self.num_bits, self.count
+        return (1 - math.exp(-k * n / m)) ** k
+
+    def measure_fpr(self, exclude=None, samples=100_000, seed=0):
+        """
+        Rastgele 64-bit değerlerle yanlış pozitif oranını ölçer.
+        exclude verilirse (contains_hash destekleyen dizin) gerçek üyeler sayılmaz.
+        """
+        import random
+
+        rng = random.Random(seed)
+        positives = negatives = 0
+        for _ in range(samples):
+            value = rng.getrandbits(64)
+            if exclude is not None and exclude.contains_hash(value):
+                continue
+            negatives += 1
+            if self.contains_hash(value):
+                positives += 1
+        return positives / negatives if negatives else 0.0
+
+    def save(self, path):
+        tmp_path = path + ".tmp"
+        with open(tmp_path, "wb") as f:
+            f.write(BLOOM_HEADER.pack(BLOOM_MAGIC, BLOOM_VERSION, self.num_hashes,
+                                      self.num_bits, self.count, self.target_fpr,
+                                      self.index_count, self.index_digest))
+            f.write(self._bits)
+        os.replace(tmp_path, path)
+
+    @classmethod
+    def load(cls, path):
+        with open(path, "rb") as f:
+            header = f.read(BLOOM_HEADER.size)
+            if len(header) < BLOOM_HEADER.size:
+                raise ValueError(f"Geçersiz Bloom filtresi: {path}")
+            (magic, version, num_hashes, num_bits, count, fpr,
+             index_count, index_digest) = BLOOM_HEADER.unpack(header)
+            if magic != BLOOM_MAGIC or version != BLOOM_VERSION:
+                raise ValueError(f"Desteklenmeyen Bloom filtresi: {path}")
+            # Filtre küçüktür ve her sorguda okunur; belleğe tamamen alınır
+            bits = f.read()
+        if len(bits) != (num_bits + 7) // 8:
+            raise ValueError(f"Bloom filtresi kesilmiş: {path}")
+        return cls(bits, num_bits, num_hashes, count, fpr, index_count, index_digest)
+
+
+class FilteredBlocklist:
+    """
+    Bloom filtresi + tam dizin. Negatiflerin çoğu filtrede elenir;
+    dizin araması yalnızca filtre isabetlerinde yapılır.
+    """
+
+    def __init__(self, index, bloom):
+        self.index = index
+        self.bloom = bloom
+        self.queries = 0
+        self.filter_hits = 0
+        self.exact_hits = 0
+
+    def __contains__(self, password):
+        return self.contains_hash(password_hash(password))
+
+    def contains_hash(self, value):
+        self.queries += 1
+        if not self.bloom.contains_hash(value):
+            return False
+        self.filter_hits += 1
+        if self.index.contains_hash(value):
+            self.exact_hits += 1
+            return True
+        return False
+
+    def __len__(self):
+        return len(self.index)
+
+    def stats(self, measure_samples=0):
+        """
+        Bellek kullanımı ve FPR istatistikleri.
+        observed_fpr çalışma sırasındaki sorgulardan hesaplanır;
+        measure_samples > 0 ise rastgele örneklerle measured_fpr de ölçülür.
+        """
+        negatives = self.queries - self.exact_hits
+        stats = {
+            "entries": len(self.index),
+            "filter_bytes": self.bloom.memory_bytes,
+            "index_bytes": len(self.index) * 8,
+            "bits_per_entry": self.bloom.num_bits / max(1, len(self.index)),
+            "hashes": self.bloom.num_hashes,
+            "target_fpr": self.bloom.target_fpr,
+            "expected_fpr": self.bloom.expected_fpr,
+            "queries": self.queries,
+            "filter_hits": self.filter_hits,
+            "exact_hits": self.exact_hits,
+            "observed_fpr": (self.filter_hits - self.exact_hits) / negatives if negatives else 0.0,
+        }
+        if measure_samples:
+            stats["measured_fpr"] = self.bloom.measure_fpr(self.index, measure_samples)
+        return stats
+
+    def close(self):
+        self.index.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+def _mix64(value):
+    """splitmix64 sonlandırıcısı; ikinci hash adımını üretir (tek sayı)."""
+    value = (value ^ (value >> 30)) * 0xBF58476D1CE4E5B9 & _MASK64
+    value = (value ^ (value >> 27)) * 0x94D049BB133111EB & _MASK64
+    return (value ^ (value >> 31)) | 1
+
+
+def _open_wordlist(path):
+    if path.endswith(".gz"):
+        import gzip
+        return gzip.open(path, "rb")
+    return open(path, "rb")
+
+
+def _write_run(hashes, directory):
+    """Sıralanmış hash parçasını geçici dosyaya yazar."""
+    import tempfile
+
+    run = array("Q", sorted(hashes))
+    if sys.byteorder != "little":
+        run.byteswap()
+    fd, path = tempfile.mkstemp(suffix=".run", dir=directory)
+    with os.fdopen(fd, "wb") as f:
+        run.tofile(f)
+    return path
+
+
+def _read_run(path, block=65536):
+    with open(path, "rb") as f:
+        while True:
+            data = f.read(block * 8)
+            if not data:
+                return
+            values = array("Q")
+            values.frombytes(data)
+            if sys.byteorder != "little":
+                values.byteswap()
+            yield from values
+
+
+def build_index(wordlist_path, index_path, chunk_size=DEFAULT_CHUNK_SIZE):
+    """
+    Satır başına bir şifre içeren (isteğe bağlı .gz) kelime listesinden
+    hash dizini oluşturur. Büyük listeler parça parça sıralanıp birleştirilir
+    (harici sıralama), bu yüzden bellek kullanımı chunk_size ile sınırlıdır.
+    Yazılan tekrarsız kayıt sayısını döner.
+    """
+    import heapq
+
+    directory = os.path.dirname(os.path.abspath(index_path))
+    runs = []
+    try:
+        chunk = array("Q")
+        with _open_wordlist(wordlist_path) as f:
+            for line in f:
+                word = line.rstrip(b"\r\n")
+                if not word:
+                    continue
+                chunk.append(password_hash(word.decode("utf-8", "surrogateescape")))
+                if len(chunk) >= chunk_size:
+                    runs.append(_write_run(chunk, directory))
+                    chunk = array("Q")
+        if chunk:
+            runs.append(_write_run(chunk, directory))
+
+        tmp_path = index_path + ".tmp"
+        count = 0
+        with open(tmp_path, "wb") as out:
+            out.write(HEADER.pack(MAGIC, VERSION, 0, 0))
+            buffer = array("Q")
+            last = None
+            for value in heapq.merge(*(_read_run(p) for p in runs)):
+                if value == last:
+                    continue
+                last = value
+                buffer.append(value)
+                if len(buffer) >= 65536:
+                    count += _flush(buffer, out)
+            count += _flush(buffer, out)
+            out.seek(0)
+            out.write(HEADER.pack(MAGIC, VERSION, 0, count))
+        os.replace(tmp_path, index_path)
+        # Eski dizinin filtresi yeni dizinle uyumsuz olur (yanlış negatif riski)
+        if os.path.exists(index_path + BLOOM_SUFFIX):
+            os.remove(index_path + BLOOM_SUFFIX)
+        return count
+    finally:
+        for path in runs:
+            os.remove(path)
+
+
+def _flush(buffer, out):
+    count = len(buffer)
+    if sys.byteorder != "little":
+        buffer.byteswap()
+    buffer.tofile(out)
+    del buffer[:]
+    return count
+
+
+def build_filter(index_path, fpr=DEFAULT_FPR):
+    """Dizindeki hash'lerden `<dizin>.bloom` filtresini oluşturur ve döner."""
+    with HashIndexBlocklist(index_path) as index:
+        bloom = BloomFilter.for_capacity(len(index), fpr)
+        add = bloom.add_hash
+        for value in index.iter_hashes():
+            add(value)
+        bloom.index_count = len(index)
+        bloom.index_digest = index.digest()
+    bloom.save(index_path + BLOOM_SUFFIX)
+    return bloom
+
+
+def open_blocklist(path, use_filter=False):
+    """
+    Dizin dosyasını açar. use_filter açıksa ve yanında bu dizinden üretilmiş
+    `.bloom` filtresi varsa filtreli kara liste döner. Eski sürüm veya dizinle
+    eşleşmeyen (dizin değiştirilmiş/kopyalanmış) filtre yok sayılır.
+    """
+    index = HashIndexBlocklist(path)
+    bloom_path = path + BLOOM_SUFFIX
+    if use_filter and os.path.exists(bloom_path):
+        try:
+            bloom = BloomFilter.load(bloom_path)
+        except ValueError:
+            return index
+        except Exception:
+            index.close()
+            raise
+        if bloom.matches(index):
+            return FilteredBlocklist(index, bloom)
+    return index
+
+
+def main(argv=None):
+    import argparse
+
+    parser = argparse.ArgumentParser(
+        prog="python -m blocklist",
+        description="Kelime listesinden LockSense kara liste dizini oluşturur.")
+    sub = parser.add_subparsers(dest="command", required=True)
+    build = sub.add_parser("build", help="dizin oluştur")
+    build.add_argument("wordlist")
+    build.add_argument("index")
+    build.add_argument("--chunk-size", type=int, default=DEFAULT_CHUNK_SIZE)
+    build.add_argument("--filter-fpr", type=float, default=None,
+                       help="Bloom filtresi de oluştur (hedef yanlış pozitif oranı, ör. 0.01)")
+    stats = sub.add_parser("stats", help="filtre istatistikleri")
+    stats.add_argument("index")
+    stats.add_argument("--samples", type=int, default=100_000)
+    check = sub.add_parser("check", help="şifre dizinde mi?")
+    check.add_argument("index")
+    check.add_argument("password")
+    args = parser.parse_args(argv)
+
+    if args.command == "build":
+        count = build_index(args.wordlist, args.index, args.chunk_size)
+        print(f"{count} kayıt yazıldı: {args.index}")
+        if args.filter_fpr is not None:
+            bloom = build_filter(args.index, args.filter_fpr)
+            print(f"Bloom filtresi: {bloom.memory_bytes} bayt, k={bloom.num_hashes}")
+        return 0
+    if args.command == "stats":
+        with open_blocklist(args.index, use_filter=True) as blocklist:
+            if not isinstance(blocklist, FilteredBlocklist):
+                print("Bu dizin için geçerli Bloom filtresi yok (yeniden oluşturun).")
+                return 1
+            for key, value in blocklist.stats(args.samples).items():
+                print(f"{key}: {value}")
+        return 0
+    with open_blocklist(args.index, use_filter=True) as blocklist:
+        found = args.password in blocklist
+    print("bulundu" if found else "bulunamadı")
+    return 0 if found else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,62 @@
+"""
+Tek geçişte karakter sınıflandırıcı.
+
+Şifre bir kez Counter ile sayılır; benzersiz karakterler önceden hesaplanmış
+kod noktası tablosundan sınıf bitlerine çevrilir. Büyük/küçük harf ve rakam
+Unicode kategorilerine göre belirlenir (Lu/Lt, Ll, Nd): Türkçe `Ş`, `ı` ve
+Almanca `ß` gibi harfler de sayılır. Özel karakterler
+PasswordRules.SPECIAL_CHARACTERS kümesidir.
+"""
+
+import unicodedata
+from collections import Counter
+
+from password_rules import PasswordRules
+
+UPPER, LOWER, DIGIT, SPECIAL = 1, 2, 4, 8
+
+# Latin-1 ve Latin Genişletilmiş-A/B (Türkçe, Almanca vb.) için tablo
+TABLE_SIZE = 0x250
+# Tablo dışındaki kod noktaları için önbellek sınırı
+MAX_EXTRA = 65536
+
+_SPECIAL = frozenset(PasswordRules.SPECIAL_CHARACTERS)
+_CATEGORY_FLAGS = {"Lu": UPPER, "Lt": UPPER, "Ll": LOWER, "Nd": DIGIT}
+
+
+def _compute_flags(char):
+    flags = _CATEGORY_FLAGS.get(unicodedata.category(char), 0)
+    if char in _SPECIAL:
+        flags |= SPECIAL
+    return flags
+
+
+_TABLE = bytes(_compute_flags(chr(code)) for code in range(TABLE_SIZE))
+_EXTRA = {}
+
+
+def char_flags(char):
+    """Tek karakterin sınıf bitlerini döner."""
+    code = ord(char)
+    if code < TABLE_SIZE:
+        return _TABLE[code]
+    flags = _EXTRA.get(char)
+    if flags is None:
+        flags = _compute_flags(char)
+        if len(_EXTRA) < MAX_EXTRA:
+            _EXTRA[char] = flags
+    return flags
+
+
+def scan(text):
+    """
+    Metni tek geçişte tarar; (sınıf bitleri, karakter sayıları) döner.
+    Sayılar ilk görülme sırasındadır; len(counts) benzersiz karakter sayısıdır.
+    """
+    counts = Counter(text)
+    flags = 0
+    table = _TABLE
+    for char in counts:
+        code = ord(char)
+        flags |= table[code] if code < TABLE_SIZE else char_flags(char)
+    return flags, counts
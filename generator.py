@@ -0,0 +1,354 @@
+"""
+Güvenli toplu şifre ve parola cümlesi (diceware) üretici.
+
+Rastgelelik os.urandom'dan büyük tamponlarla (varsayılan 64 KiB) okunur;
+her şifre için ayrı sistem çağrısı yapılmaz. Baytlar alfabeye reddetmeli
+örnekleme ile eşlenir: alfabe boyutunun katı olmayan üst aralıktaki baytlar
+atılır, böylece `b % n` eğilimsizdir. ASCII alfabelerde eşleme ve atma tek
+bir bytes.translate çağrısıyla C hızında yapılır.
+
+Politika kısıtları da reddetmeyle sağlanır: gerekli sınıflardan biri eksik
+olan şifre bütünüyle atılır ve yeniden çekilir. Böylece sonuç, kısıtları
+sağlayan şifreler arasında düzgün dağılır (sınıf başına bir karakter
+ekleyip karıştırmak bu dağılımı bozar). min_score verilirse her şifre
+AIAnalyzer ile puanlanır; eşiğin altındakiler (ör. kara listede olanlar)
+atılır.
+
+Kullanım:
+    python -m generator --count 1000 --length 20 --no-ambiguous
+    python -m generator --passphrase --words 6 --min-score 70
+"""
+
+import math
+import os
+import string
+import sys
+import threading
+from itertools import combinations
+
+from char_classes import UPPER, LOWER, DIGIT, SPECIAL
+from password_rules import PasswordRules
+from policy import Policy
+
+# os.urandom okuma boyutu
+BUFFER_SIZE = 1 << 16
+DEFAULT_LENGTH = 16
+DEFAULT_WORDS = 6
+
+CLASS_ALPHABETS = {
+    "upper": string.ascii_uppercase,
+    "lower": string.ascii_lowercase,
+    "digit": string.digits,
+    "special": PasswordRules.SPECIAL_CHARACTERS,
+}
+CLASS_FLAGS = {"upper": UPPER, "lower": LOWER, "digit": DIGIT, "special": SPECIAL}
+
+# Birbirine karışan karakterler (exclude_ambiguous=True ile çıkarılır)
+AMBIGUOUS = "Il1|O0o"
+
+# Yerleşik kelime listesi: telaffuz edilebilir ünsüz-ünlü-ünsüz-ünlü
+# kelimeler (16 * 5 * 16 * 5 = 6400 kelime, kelime başına ~12.6 bit)
+_CONSONANTS = "bcdfgklmnprstvyz"
+_VOWELS = "aeiou"
+WORDLIST = tuple(c1 + v1 + c2 + v2 for c1 in _CONSONANTS for v1 in _VOWELS
+                 for c2 in _CONSONANTS for v2 in _VOWELS)
+
+# Bu kadar ardışık turda hiç şifre kabul edilmezse min_score ulaşılamaz sayılır
+_MAX_EMPTY_ROUNDS = 64
+
+
+class RandomPool:
+    """
+    os.urandom'dan büyük parçalar halinde okunan bayt havuzu.
+    Okunan baytlar bir kez verilir; fork sonrası alt süreç havuzu atar
+    (ebeveynle aynı baytları kullanmamak için). İş parçacığı güvenlidir.
+    """
+
+    def __init__(self, size=BUFFER_SIZE):
+        self.size = size
+        self._buffer = b""
+        self._offset = 0
+        self._pid = os.getpid()
+        self._lock = threading.Lock()
+
+    def read(self, count):
+        with self._lock:
+            if self._pid != os.getpid():
+                self._buffer, self._offset, self._pid = b"", 0, os.getpid()
+            end = self._offset + count
+            if end > len(self._buffer):
+                self._buffer = os.urandom(max(self.size, count))
+                self._offset, end = 0, count
+            data = self._buffer[self._offset:end]
+            self._offset = end
+            return data
+
+    def indices(self, n, count):
+        """[0, n) aralığında count adet eğilimsiz tamsayı (reddetmeli örnekleme)."""
+        if n < 1:
+            raise ValueError("n pozitif olmalı")
+        width, code = (1, "B") if n <= 1 << 8 else (2, "H") if n <= 1 << 16 else (4, "I")
+        space = 1 << (8 * width)
+        limit = space - space % n
+        out = []
+        while len(out) < count:
+            need = count - len(out)
+            raw = self.read(width * (need * space // limit + 8))
+            out.extend(value % n for value in memoryview(raw).cast(code) if value < limit)
+        del out[count:]
+        return out
+
+
+_DEFAULT_POOL = RandomPool()
+
+
+def _filter_scores(generator, candidates):
+    """min_score verilmişse AIAnalyzer puanı eşiğin altındaki adayları atar."""
+    min_score = generator.min_score
+    if min_score is None or not candidates:
+        return candidates
+    results = generator.analyzer.analyze_many(candidates)
+    return [candidate for candidate, result in zip(candidates, results)
+            if result["score"] >= min_score]
+
+
+class PasswordGenerator:
+    """
+    Politikaya göre rastgele şifre üretici.
+
+    policy verilirse uzunluk en az desired_length olur ve puan getiren
+    (class_points > 0) her karakter sınıfı zorunlu tutulur. classes ile
+    zorunlu sınıflar ("upper", "lower", "digit", "special") açıkça verilebilir.
+    Alfabe ASCII olmalıdır.
+    """
+
+    def __init__(self, policy=None, length=None, classes=None, exclude_ambiguous=False,
+                 exclude="", min_score=None, analyzer=None, pool=None):
+        self.policy = policy if policy is not None else (
+            analyzer.policy if analyzer is not None else Policy())
+        if classes is None:
+            classes = [name for name in CLASS_ALPHABETS if self.policy.class_points[name] > 0]
+        unknown = set(classes) - set(CLASS_ALPHABETS)
+        if unknown:
+            raise ValueError(f"Bilinmeyen karakter sınıfları: {', '.join(sorted(unknown))}")
+        if not classes:
+            raise ValueError("En az bir karakter sınıfı gerekli")
+        self.length = length if length is not None else max(DEFAULT_LENGTH, self.policy.desired_length)
+
+        removed = set(exclude) | (set(AMBIGUOUS) if exclude_ambiguous else set())
+        self.classes = {}
+        for name in CLASS_ALPHABETS:
+            if name in classes:
+                chars = "".join(char for char in CLASS_ALPHABETS[name] if char not in removed)
+                if not chars:
+                    raise ValueError(f"Çıkarılan karakterlerden sonra sınıf boş: {name}")
+                self.classes[name] = chars
+        if self.length < len(self.classes):
+            raise ValueError("Uzunluk zorunlu sınıf sayısından küçük olamaz")
+        self.alphabet = "".join(self.classes.values())
+        self._class_sets = [frozenset(chars) for chars in self.classes.values()]
+
+        # Bayt -> karakter tablosu; limit ve üzeri baytlar silinir
+        n = len(self.alphabet)
+        limit = 256 - 256 % n
+        self._table = bytes(ord(self.alphabet[b % n]) if b < limit else 0 for b in range(256))
+        self._delete = bytes(range(limit, 256))
+        self._accept = limit / 256
+        self._pool = pool if pool is not None else _DEFAULT_POOL
+
+        self.min_score = min_score
+        self.analyzer = analyzer
+        if min_score is not None:
+            flags = sum(CLASS_FLAGS[name] for name in self.classes)
+            best = self.policy.evaluate(self.length, flags, False)[0]
+            if best < min_score:
+                raise ValueError(f"Bu ayarlarla en yüksek puan {best}; min_score {min_score} ulaşılamaz")
+            if self.analyzer is None:
+                from ai_analyzer import AIAnalyzer
+                self.analyzer = AIAnalyzer(policy=self.policy)
+
+    @property
+    def bits(self):
+        """Kısıtları sağlayan şifre sayısının log2 değeri (içerme-dışlama ile)."""
+        sizes = [len(chars) for chars in self.classes.values()]
+        total = 0
+        for k in range(len(sizes) + 1):
+            for missing in combinations(sizes, k):
+                total += (-1) ** k * (len(self.alphabet) - sum(missing)) ** self.length
+        return math.log2(total)
+
+    def _candidates(self, count):
+        """Sınıf kısıtlarını sağlayan en fazla count adet aday şifre."""
+        length = self.length
+        need = count * length
+        chars = []
+        have = 0
+        while have < need:
+            raw = self._pool.read(int((need - have) / self._accept) + 16)
+            chunk = raw.translate(self._table, self._delete).decode("ascii")
+            chars.append(chunk)
+            have += len(chunk)
+        stream = "".join(chars)
+        class_sets = self._class_sets
+        out = []
+        for start in range(0, need, length):
+            password = stream[start:start + length]
+            for chars in class_sets:
+                if chars.isdisjoint(password):
+                    break
+            else:
+                out.append(password)
+        return out
+
+    def generate_many(self, count):
+        """count adet şifre listesi döner."""
+        out = []
+        empty_rounds = 0
+        while len(out) < count:
+            need = count - len(out)
+            candidates = self._candidates(need + need // 8 + 1)
+            batch = _filter_scores(self, candidates)
+            # Sınıf reddi her turda aday bırakmayabilir; yalnızca puan reddi sayılır
+            empty_rounds = empty_rounds + 1 if candidates and not batch else 0
+            if empty_rounds >= _MAX_EMPTY_ROUNDS:
+                raise ValueError(f"min_score {self.min_score} sağlanamıyor")
+            out.extend(batch[:need])
+        return out
+
+    def generate(self):
+        return self.generate_many(1)[0]
+
+
+def load_wordlist(path):
+    """
+    Kelime listesi dosyası okur: satır başına bir kelime veya diceware
+    biçimi ("11111<TAB>kelime"; son sütun kullanılır). Tekrarlar atılır.
+    """
+    words = []
+    seen = set()
+    with open(path, encoding="utf-8") as f:
+        for line in f:
+            parts = line.split()
+            if parts and parts[-1] not in seen:
+                seen.add(parts[-1])
+                words.append(parts[-1])
+    if len(words) < 2:
+        raise ValueError(f"Kelime listesi çok kısa: {path}")
+    return words
+
+
+class PassphraseGenerator:
+    """
+    Diceware parola cümlesi üretici: kelimeler listeden eğilimsiz seçilir.
+    capitalize ile kelimeler büyük harfle başlar; suffix ile sona rastgele
+    bir rakam ve özel karakter eklenir (politika sınıflarını karşılamak için).
+    """
+
+    def __init__(self, words=DEFAULT_WORDS, separator="-", wordlist=None, capitalize=True,
+                 suffix=True, min_score=None, analyzer=None, policy=None, pool=None):
+        if words < 1:
+            raise ValueError("En az bir kelime gerekli")
+        self.words = words
+        self.separator = separator
+        self.wordlist = tuple(wordlist) if wordlist is not None else WORDLIST
+        if len(set(self.wordlist)) != len(self.wordlist):
+            raise ValueError("Kelime listesi tekrar içeriyor")
+        self.capitalize = capitalize
+        self.suffix = suffix
+        self._pool = pool if pool is not None else _DEFAULT_POOL
+        self.min_score = min_score
+        self.analyzer = analyzer
+        if min_score is not None and analyzer is None:
+            from ai_analyzer import AIAnalyzer
+            self.analyzer = AIAnalyzer(policy=policy)
+
+    @property
+    def bits(self):
+        bits = self.words * math.log2(len(self.wordlist))
+        if self.suffix:
+            bits += math.log2(len(string.digits) * len(PasswordRules.SPECIAL_CHARACTERS))
+        return bits
+
+    def _candidates(self, count):
+        pool = self._pool
+        wordlist = self.wordlist
+        words = self.words
+        choices = pool.indices(len(wordlist), count * words)
+        if self.capitalize:
+            picked = [wordlist[i].capitalize() for i in choices]
+        else:
+            picked = [wordlist[i] for i in choices]
+        join = self.separator.join
+        out = [join(picked[start:start + words]) for start in range(0, len(picked), words)]
+        if self.suffix:
+            digits = pool.indices(len(string.digits), count)
+            specials = pool.indices(len(PasswordRules.SPECIAL_CHARACTERS), count)
+            out = [f"{phrase}{string.digits[d]}{PasswordRules.SPECIAL_CHARACTERS[s]}"
+                   for phrase, d, s in zip(out, digits, specials)]
+        return out
+
+    def generate_many(self, count):
+        """count adet parola cümlesi listesi döner."""
+        out = []
+        empty_rounds = 0
+        while len(out) < count:
+            need = count - len(out)
+            batch = _filter_scores(self, self._candidates(need))
+            empty_rounds = 0 if batch else empty_rounds + 1
+            if empty_rounds >= _MAX_EMPTY_ROUNDS:
+                raise ValueError(f"min_score {self.min_score} sağlanamıyor")
+            out.extend(batch)
+        return out
+
+    def generate(self):
+        return self.generate_many(1)[0]
+
+
+def main(argv=None):
+    import argparse
+
+    parser = argparse.ArgumentParser(
+        prog="python -m generator",
+        description="Politikaya uygun rastgele şifre veya parola cümlesi üretir.")
+    parser.add_argument("-n", "--count", type=int, default=1)
+    parser.add_argument("--length", type=int, default=None)
+    parser.add_argument("--no-ambiguous", action="store_true",
+                        help=f"karışan karakterleri çıkar ({AMBIGUOUS})")
+    parser.add_argument("--exclude", default="", help="çıkarılacak karakterler")
+    parser.add_argument("--classes", default=None,
+                        help="zorunlu sınıflar, virgülle (upper,lower,digit,special)")
+    parser.add_argument("--min-score", type=int, default=None)
+    parser.add_argument("--policy", default=None, help="politika dosyası (.toml veya .json)")
+    parser.add_argument("--policy-name", default=None)
+    parser.add_argument("--passphrase", action="store_true", help="diceware parola cümlesi üret")
+    parser.add_argument("--words", type=int, default=DEFAULT_WORDS)
+    parser.add_argument("--separator", default="-")
+    parser.add_argument("--wordlist", default=None, help="kelime listesi dosyası")
+    parser.add_argument("--bits", action="store_true", help="entropiyi stderr'e yaz")
+    args = parser.parse_args(argv)
+
+    try:
+        policy = None
+        if args.policy:
+            from policy import load_policy
+            policy = load_policy(args.policy, args.policy_name)
+        if args.passphrase:
+            wordlist = load_wordlist(args.wordlist) if args.wordlist else None
+            generator = PassphraseGenerator(args.words, args.separator, wordlist,
+                                            min_score=args.min_score, policy=policy)
+        else:
+            classes = args.classes.split(",") if args.classes else None
+            generator = PasswordGenerator(policy, args.length, classes, args.no_ambiguous,
+                                          args.exclude, args.min_score)
+    except (OSError, ValueError) as exc:
+        parser.error(str(exc))
+
+    if args.bits:
+        sys.stderr.write(f"{generator.bits:.1f} bit\n")
+    sys.stdout.write("\n".join(generator.generate_many(args.count)))
+    sys.stdout.write("\n")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
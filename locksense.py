@@ -0,0 +1,139 @@
+"""
+LockSense başsız (headless) komut satırı arayüzü.
+
+PySide6 yüklemeden çalışır; CI işleri, cron denetimleri ve ekransız
+konteynerler için tasarlanmıştır. Yalnızca ai_analyzer, password_rules ve
+translations modüllerini içe aktarır.
+
+Kullanım:
+    python -m locksense 'Parola1!' 'qwerty'
+    echo 'Parola1!' | python -m locksense --format csv
+    python -m locksense -f passwords.txt --min-score 55
+"""
+
+import sys
+import json
+import argparse
+
+from ai_analyzer import AIAnalyzer
+from password_rules import PasswordRules
+
+# Soğuk başlatma bütçesi (benchmarks/bench_cli_startup.py ile ölçülür)
+STARTUP_BUDGET_MS = 150
+
+CSV_FIELDS = [
+    "index", "score", "status", "entropy",
+    "check_length", "check_upper", "check_lower", "check_digit", "check_special", "check_common",
+]
+
+
+def iter_passwords(args, stdin=None):
+    """Argümanlardan, dosyalardan ve stdin'den şifreleri sırayla üretir."""
+    stdin = stdin if stdin is not None else sys.stdin
+    sources = list(args.passwords)
+    read_stdin = "-" in sources or (not sources and not args.file and not stdin.isatty())
+    for password in sources:
+        if password != "-":
+            yield password
+    for path in args.file or ():
+        with open(path, encoding="utf-8", errors="surrogateescape") as f:
+            for line in f:
+                line = line.rstrip("\r\n")
+                if line:
+                    yield line
+    if read_stdin:
+        for line in stdin:
+            line = line.rstrip("\r\n")
+            if line:
+                yield line
+
+
+def write_json(results, out):
+    out.write("[")
+    for i, result in enumerate(results):
+        if i:
+            out.write(",")
+        out.write("\n  ")
+        out.write(json.dumps(result, ensure_ascii=False))
+    out.write("\n]\n")
+
+
+def write_jsonl(results, out):
+    for result in results:
+        out.write(json.dumps(result, ensure_ascii=False))
+        out.write("\n")
+
+
+def write_csv(results, out):
+    import csv
+
+    writer = csv.writer(out)
+    writer.writerow(CSV_FIELDS)
+    for result in results:
+        checks = result["checks"]
+        writer.writerow([
+            result["index"], result["score"], result["status"], result.get("entropy", 0.0),
+            checks["length"], checks["upper"], checks["lower"],
+            checks["digit"], checks["special"], checks["common"],
+        ])
+
+
+WRITERS = {"json": write_json, "jsonl": write_jsonl, "csv": write_csv}
+
+
+def build_parser():
+    parser = argparse.ArgumentParser(
+        prog="python -m locksense",
+        description="LockSense şifre analizi (arayüzsüz).")
+    parser.add_argument("passwords", nargs="*",
+                        help="analiz edilecek şifreler ('-' stdin'i okur)")
+    parser.add_argument("-f", "--file", action="append",
+                        help="satır başına bir şifre içeren dosya (tekrarlanabilir)")
+    parser.add_argument("--format", choices=sorted(WRITERS), default="json")
+    parser.add_argument("--lang", default="en", choices=["tr", "en", "de"])
+    parser.add_argument("--blocklist", default=None, help="kara liste dizin dosyası")
+    parser.add_argument("--policy", default=None,
+                        help="puanlama politikası dosyası (.toml veya .json)")
+    parser.add_argument("--policy-name", default=None,
+                        help="dosyada birden çok politika varsa kullanılacak ad")
+    parser.add_argument("--min-score", type=int, default=None,
+                        help="herhangi bir şifre bu puanın altındaysa çıkış kodu 1")
+    parser.add_argument("--version", action="store_true",
+                        help="sürümü yaz ve çık (başlatma süresi ölçümü için)")
+    return parser
+
+
+def main(argv=None, stdin=None, stdout=None):
+    parser = build_parser()
+    args = parser.parse_args(argv)
+    out = stdout if stdout is not None else sys.stdout
+    if args.version:
+        out.write("locksense 1.0\n")
+        return 0
+
+    blocklist = PasswordRules.load_blocklist(args.blocklist) if args.blocklist else None
+    policy = None
+    if args.policy:
+        from policy import load_policy
+        try:
+            policy = load_policy(args.policy, args.policy_name)
+        except (OSError, ValueError) as exc:
+            parser.error(str(exc))
+    analyzer = AIAnalyzer(args.lang, blocklist=blocklist, policy=policy)
+    lowest = [None]
+
+    def results():
+        passwords = iter_passwords(args, stdin)
+        for index, result in enumerate(analyzer.analyze_many(passwords)):
+            if lowest[0] is None or result["score"] < lowest[0]:
+                lowest[0] = result["score"]
+            yield {"index": index, **result}
+
+    WRITERS[args.format](results(), out)
+    if args.min_score is not None and lowest[0] is not None and lowest[0] < args.min_score:
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,22 +1,166 @@
+"""
+LockSense masaüstü giriş noktası (kademeli başlatma).
+
+1. Yalnızca QApplication ve dil seçici içe aktarılır; seçici hemen gösterilir.
+2. Seçici ilk kez çizildikten sonra, kullanıcı dil seçerken olay döngüsünün
+   boş turlarında ui modülü içe aktarılır ve ana pencere varsayılan dille
+   gizli olarak kurulur (her adım ayrı bir turda; seçici yanıt vermeye
+   devam eder).
+3. Dil seçilince pencere set_language ile çevrilir ve gösterilir. Kurulum
+   bitmemişse kalan adımlar o anda çalıştırılır.
+
+Başlatma profili:
+    python main.py --profile-startup            # veya LOCKSENSE_PROFILE=1
+    python main.py --profile-startup --auto-select en   # ölçüp çıkar
+Aşama süreleri (main.py başlangıcından itibaren ms) stderr'e JSON olarak
+yazılır; yorumlayıcının kendi açılış süresi dahil değildir.
+"""
+
+import os
 import sys
+import time
+
+_START = time.perf_counter()
+
+from PySide6.QtCore import QEvent, QObject, QTimer
 from PySide6.QtWidgets import QApplication
-from ui import LockSenseUI
 from language_selector import LanguageSelector
 
-def main():
-    app = QApplication(sys.argv)
-    app.setStyle("Fusion")
-    
-    main_window = None
+# Pencere önceden bu dille kurulur; seçimden sonra çevrilir
+DEFAULT_LANG = "en"
+
+
+class StartupProfile:
+    """Başlatma aşamalarının zaman damgaları."""
+
+    def __init__(self, enabled):
+        self.enabled = enabled
+        self.marks = {}
+
+    def mark(self, name):
+        self.marks[name] = round((time.perf_counter() - _START) * 1000, 1)
+
+    def report(self):
+        import json
+        sys.stderr.write(f"[LockSense] startup {json.dumps(self.marks)}\n")
+        sys.stderr.flush()
+
+
+class _FirstPaint(QObject):
+    """Widget'ın ilk Paint olayından sonra callback'i bir kez çağırır."""
+
+    def __init__(self, widget, callback):
+        super().__init__(widget)
+        self._widget = widget
+        self._callback = callback
+        widget.installEventFilter(self)
+
+    def eventFilter(self, obj, event):
+        if obj is self._widget and event.type() == QEvent.Paint:
+            self._widget.removeEventFilter(self)
+            # Çizim bittikten sonraki ilk turda
+            QTimer.singleShot(0, self._callback)
+        return False
+
 
-    def on_language_selected(lang):
-        nonlocal main_window
-        main_window = LockSenseUI(lang=lang)
-        main_window.show()
+class StagedStartup:
+    """Dil seçicisini gösterir ve ana pencereyi boşta önceden kurar."""
+
+    def __init__(self, app, profile, prebuild=True, auto_select=None):
+        self.app = app
+        self.profile = profile
+        self.prebuild = prebuild
+        self.auto_select = auto_select
+        self.window = None
+        self._ui = None
+        self._steps = [("ui_import", self._import_ui), ("window_build", self._build_window)]
+        self.selector = LanguageSelector(on_selected=self.on_language_selected)
+
+    def start(self):
+        _FirstPaint(self.selector, self._on_selector_painted)
+        self.selector.show()
+        self.profile.mark("selector_shown")
+
+    def _on_selector_painted(self):
+        self.profile.mark("selector_first_paint")
+        if self.prebuild:
+            QTimer.singleShot(0, self._run_next_step)
+        elif self.auto_select:
+            self.selector.select(self.auto_select)
+
+    def _run_step(self):
+        name, step = self._steps.pop(0)
+        step()
+        self.profile.mark(name)
+
+    def _run_next_step(self):
+        if self._steps:
+            self._run_step()
+        if self._steps:
+            QTimer.singleShot(0, self._run_next_step)
+        else:
+            self.profile.mark("prebuilt")
+            if self.auto_select:
+                self.selector.select(self.auto_select)
+
+    def _import_ui(self):
+        import ui
+        self._ui = ui
+
+    def _build_window(self):
+        self.window = self._ui.LockSenseUI(lang=DEFAULT_LANG)
+
+    def on_language_selected(self, lang):
+        self.profile.mark("language_selected")
+        while self._steps:
+            self._run_step()
+        self.window.set_language(lang)
+        _FirstPaint(self.window, self._on_window_painted)
+        self.window.show()
+
+    def _on_window_painted(self):
+        profile = self.profile
+        profile.mark("window_first_paint")
+        if profile.enabled:
+            marks = profile.marks
+            marks["selected_to_paint"] = round(
+                marks["window_first_paint"] - marks["language_selected"], 1)
+            profile.report()
+        if self.auto_select:
+            self.window.close()
+            self.app.quit()
+
+
+def parse_args(argv):
+    """LockSense seçeneklerini ayrıştırır; tanınmayanlar (Qt'nin kendi seçenekleri) geri döner."""
+    import argparse
+    from translations import TRANSLATIONS
+
+    parser = argparse.ArgumentParser(prog="main.py", description="LockSense masaüstü uygulaması.",
+                                     allow_abbrev=False)
+    parser.add_argument("--profile-startup", action="store_true",
+                        help="başlatma aşama sürelerini stderr'e yaz")
+    parser.add_argument("--auto-select", choices=sorted(TRANSLATIONS), metavar="LANG",
+                        help="dili otomatik seç, ilk çizimden sonra çık "
+                             f"({', '.join(sorted(TRANSLATIONS))})")
+    parser.add_argument("--no-prebuild", action="store_true",
+                        help="ana pencereyi seçimden önce kurma")
+    return parser.parse_known_args(argv)
+
+
+def main(argv=None):
+    argv = list(sys.argv if argv is None else argv)
+    args, qt_args = parse_args(argv[1:])
+    profile = StartupProfile(args.profile_startup or os.environ.get("LOCKSENSE_PROFILE") == "1")
+    profile.mark("imports")
+
+    app = QApplication(argv[:1] + qt_args)
+    app.setStyle("Fusion")
+    profile.mark("app_created")
 
-    selector = LanguageSelector(on_selected=on_language_selected)
-    selector.show()
-    
+    startup = StagedStartup(app, profile, prebuild=not args.no_prebuild,
+                            auto_select=args.auto_select)
+    startup.start()
     sys.exit(app.exec())
 
 if __name__ == "__main__":
@@ -1,4 +1,6 @@
+import os
 import re
+from blocklist import MemoryBlocklist, open_blocklist
 
 class PasswordRules:
     """
@@ -9,11 +11,15 @@ class PasswordRules:
     MIN_LENGTH = 8
     DESIRED_LENGTH = 12
     
-    # Karakter setleri kontrolleri için Regex desenleri
+    # Özel karakter kümesi (char_classes tablosu da bunu kullanır)
+    SPECIAL_CHARACTERS = '!@#$%^&*(),.?":{}|<>'
+
+    # Karakter setleri kontrolleri için Regex desenleri (yalnızca ASCII harfler).
+    # Analizör bunların yerine Unicode farkındalıklı char_classes.scan kullanır.
     HAS_UPPER = re.compile(r'[A-Z]')
     HAS_LOWER = re.compile(r'[a-z]')
     HAS_DIGIT = re.compile(r'\d')
-    HAS_SPECIAL = re.compile(r'[!@#$%^&*(),.?":{}|<>]')
+    HAS_SPECIAL = re.compile(f"[{re.escape(SPECIAL_CHARACTERS)}]")
     
     # En yaygın ve zayıf şifreler listesi (Yerel kontrol için)
     # Bu liste gerçek bir uygulamada çok daha geniş tutulabilir.
@@ -23,6 +29,24 @@ class PasswordRules:
         "şifre", "123123", "asdasd", "şifre123", "deneme"
     ]
 
+    # Büyük sızıntı listeleri için dizin dosyası (python -m blocklist build ...)
+    BLOCKLIST_ENV = "LOCKSENSE_BLOCKLIST"
+    # "1" ise dizinin Bloom filtresi de kullanılır (büyük/soğuk dizinler için)
+    BLOCKLIST_FILTER_ENV = "LOCKSENSE_BLOCKLIST_FILTER"
+
+    @staticmethod
+    def load_blocklist(path=None):
+        """
+        Yaygın şifre kara listesini yükler.
+        Dizin dosyası verilmezse LOCKSENSE_BLOCKLIST ortam değişkenine,
+        o da yoksa COMMON_PASSWORDS listesine düşer.
+        """
+        path = path or os.environ.get(PasswordRules.BLOCKLIST_ENV)
+        if path:
+            use_filter = os.environ.get(PasswordRules.BLOCKLIST_FILTER_ENV) == "1"
+            return open_blocklist(path, use_filter=use_filter)
+        return MemoryBlocklist(PasswordRules.COMMON_PASSWORDS)
+
     @staticmethod
     def get_rules_description():
         """Kuralların insan tarafından okunabilir açıklamasını döner."""
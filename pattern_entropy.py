@@ -0,0 +1,370 @@
+"""
+Desen farkındalıklı entropi tahmincisi.
+
+Shannon entropisi `Password2025!` veya `qwertyuiop` gibi şifreleri olduğundan
+güçlü gösterir. Bu modül şifreyi bilinen desenlere ayırır:
+  - sözlük kelimeleri (leetspeak varyantlarıyla, önceden derlenmiş trie)
+  - klavye yürüyüşleri (QWERTY, QWERTZ ve Türkçe-Q düzenleri)
+  - tekrarlar (`aaaa`, `abcabc`)
+  - diziler (`abcd`, `1357`, `zyx`)
+  - tarihler ve yıllar (`2025`, `14.02.1990`, `19900214`)
+ve dinamik programlama ile en az tahmin gerektiren ayrıştırmayı bulur.
+Kalan karakterler karakter sınıfının boyutuyla kaba kuvvet olarak sayılır.
+
+Sonuç bit cinsindendir: bits = log2(tahmin sayısı).
+"""
+
+import re
+import math
+import datetime
+from collections import namedtuple
+
+from password_rules import PasswordRules
+
+Match = namedtuple("Match", "pattern start end token bits")
+Estimate = namedtuple("Estimate", "bits sequence")
+
+# Yaygın kelimeler (sıra = yaklaşık sıklık); COMMON_PASSWORDS önce eklenir
+WORDS = """
+password qwerty dragon monkey letmein football baseball iloveyou admin welcome login master
+hello sunshine princess shadow superman summer winter spring autumn love secret freedom
+whatever trustno michael jordan hunter ranger buster soccer hockey killer george charlie
+andrew thomas daniel jessica pepper ginger flower orange banana cookie chocolate computer
+internet access server system default guest user test demo root office company business
+money angel batman tiger lion eagle falcon phoenix star moon sun sky blue red green black
+white silver golden diamond crystal magic power energy happy lucky family friend forever
+christmas birthday june july august october november december january february march april
+monday friday weekend music guitar piano dance party coffee pizza beach ocean river mountain
+apple google amazon facebook microsoft windows linux android samsung iphone
+sifre parola deneme merhaba istanbul ankara izmir bursa antalya galatasaray fenerbahce
+besiktas trabzonspor turkiye askim canim sevgilim annem babam kalem bilgisayar anahtar
+kartal aslan yildiz gunes deniz gokyuzu cicek kedi kopek dostum kardesim hayat mutluluk
+passwort hallo schatz sommer fruhling herbst fussball deutschland berlin muenchen hamburg
+liebe geheim schalke bayern dortmund blume sonne mond stern katze hund freund familie
+schule arbeit willkommen anmelden benutzer kennwort
+""".split()
+
+# Leetspeak: rakam/sembol -> olası harfler
+LEET = {
+    "4": "a", "@": "a", "8": "b", "(": "c", "3": "e", "6": "g", "9": "g",
+    "1": "il", "!": "i", "|": "il", "0": "o", "$": "s", "5": "s", "7": "t", "+": "t", "2": "z",
+}
+
+# Klavye düzenleri: (kaydırmasız satırlar, shift'li satırlar)
+LAYOUTS = {
+    "qwerty": (
+        ["`1234567890-=", "qwertyuiop[]\\", "asdfghjkl;'", "zxcvbnm,./"],
+        ["~!@#$%^&*()_+", "QWERTYUIOP{}|", 'ASDFGHJKL:"', "ZXCVBNM<>?"],
+    ),
+    "qwertz": (
+        ["^1234567890ß´", "qwertzuiopü+", "asdfghjklöä#", "<yxcvbnm,.-"],
+        ["°!\"§$%&/()=?`", "QWERTZUIOPÜ*", "ASDFGHJKLÖÄ'", ">YXCVBNM;:_"],
+    ),
+    "turkish_q": (
+        ["\"1234567890*-", "qwertyuıopğü,", "asdfghjklşi", "<zxcvbnmöç."],
+        ["é!'^+%&/()=?_", "QWERTYUIOPĞÜ;", "ASDFGHJKLŞİ", ">ZXCVBNMÖÇ:"],
+    ),
+}
+
+# Bir sonraki satırın sağa kayması (tuş genişliği cinsinden)
+_ROW_STAGGER = (0.0, 0.5, 0.75, 0.25)
+
+MIN_YEAR_SPACE = 20
+
+_BRUTE_CARDINALITY = {"lower": 26, "upper": 26, "digit": 10, "special": 33, "other": 100}
+
+_DATE_PATTERNS = [
+    # (regex, gün/ay/yıl grupları sırası)
+    (re.compile(r"(\d{1,2})([-/._ ]?)(\d{1,2})\2(\d{4}|\d{2})"), ("d", "m", "y")),
+    (re.compile(r"(\d{4})([-/._ ]?)(\d{1,2})\2(\d{1,2})"), ("y", "m", "d")),
+]
+_YEAR = re.compile(r"19\d\d|20\d\d")
+_REPEAT_CHAR = re.compile(r"(.)\1{2,}", re.S)
+_REPEAT_BLOCK = re.compile(r"(.{2,8}?)\1+", re.S)
+
+
+def _build_trie(words):
+    """Kelime -> sıra (rank) trie'si; düğümler dict, sonlar '' anahtarında."""
+    root = {}
+    for rank, word in enumerate(words, 1):
+        node = root
+        for char in word:
+            node = node.setdefault(char, {})
+        node.setdefault("", rank)
+    return root
+
+
+def _build_keyboard(rows, shifted):
+    """Tuş -> (x, y) koordinatları ve komşuluk kümeleri."""
+    coords = {}
+    for y, (row, shift_row) in enumerate(zip(rows, shifted)):
+        offset = sum(_ROW_STAGGER[1:y + 1])
+        for x, (key, shift_key) in enumerate(zip(row, shift_row)):
+            coords[key] = (x + offset, y)
+            coords.setdefault(shift_key, (x + offset, y))
+    neighbors = {}
+    for key, (x, y) in coords.items():
+        neighbors[key] = {other for other, (ox, oy) in coords.items()
+                          if other != key and (ox, oy) != (x, y)
+                          and abs(oy - y) <= 1 and abs(ox - x) <= 1.0}
+    keys = len({pos for pos in coords.values()})
+    degree = sum(len({coords[n] for n in ns}) for ns in neighbors.values()) / len(neighbors)
+    return coords, neighbors, keys, degree
+
+
+def _char_cardinality(char):
+    if "a" <= char <= "z":
+        return _BRUTE_CARDINALITY["lower"]
+    if "A" <= char <= "Z":
+        return _BRUTE_CARDINALITY["upper"]
+    if "0" <= char <= "9":
+        return _BRUTE_CARDINALITY["digit"]
+    if char.isascii():
+        return _BRUTE_CARDINALITY["special"]
+    return _BRUTE_CARDINALITY["other"]
+
+
+def _nck(n, k):
+    return math.comb(n, k) if 0 <= k <= n else 0
+
+
+class PatternEstimator:
+    """
+    Önceden derlenmiş sözlük trie'si ve klavye grafikleriyle desen tabanlı
+    tahmin sayısı hesaplayıcı. Örnek bir kez oluşturulup paylaşılmalıdır.
+    """
+
+    def __init__(self, words=None, layouts=None, max_length=256, reference_year=None):
+        if words is None:
+            words = list(PasswordRules.COMMON_PASSWORDS) + WORDS
+        self._trie = _build_trie(w.lower() for w in words if len(w) >= 3 or w.isdigit())
+        self._layouts = {name: _build_keyboard(*LAYOUTS[name]) for name in (layouts or LAYOUTS)}
+        # Çok uzun girdilerde yalnızca bu kadar karakter desen aramasına girer
+        self.max_length = max_length
+        # Yıl tahmin uzayı bu yıla uzaklıkla ölçülür (varsayılan: bu yıl)
+        self.reference_year = reference_year or datetime.date.today().year
+
+    def estimate(self, password):
+        """Şifre için en az tahmin gerektiren desen ayrıştırmasını döner."""
+        if not password:
+            return Estimate(0.0, [])
+        head = password[:self.max_length]
+        estimate = self._estimate(head, recursive=True)
+        if len(password) > len(head):
+            # Kuyruk kaba kuvvet sayılır (uzun parolalarda gecikmeyi sınırlar)
+            tail = sum(math.log2(_char_cardinality(c)) for c in password[len(head):])
+            return Estimate(estimate.bits + tail, estimate.sequence)
+        return estimate
+
+    def _estimate(self, password, recursive):
+        n = len(password)
+        matches = self._matches(password, recursive)
+
+        # best[k]: ilk k karakter için (bit, önceki konum, eşleşme)
+        ends = {}
+        for match in matches:
+            ends.setdefault(match.end, []).append(match)
+        best_bits = [0.0] + [math.inf] * n
+        back = [None] * (n + 1)
+        for k in range(1, n + 1):
+            char = password[k - 1]
+            bits = best_bits[k - 1] + math.log2(_char_cardinality(char))
+            choice = None
+            for match in ends.get(k, ()):
+                # Her desen seçimi için +1 bit (desen türü bilgisi)
+                candidate = best_bits[match.start] + match.bits + 1
+                if candidate < bits:
+                    bits, choice = candidate, match
+            best_bits[k] = bits
+            back[k] = choice
+
+        sequence = []
+        k = n
+        brute_end = None
+        while k > 0:
+            match = back[k]
+            if match is None:
+                if brute_end is None:
+                    brute_end = k
+                k -= 1
+                continue
+            if brute_end is not None:
+                sequence.append(self._brute(password, k, brute_end))
+                brute_end = None
+            sequence.append(match)
+            k = match.start
+        if brute_end is not None:
+            sequence.append(self._brute(password, 0, brute_end))
+        sequence.reverse()
+        return Estimate(best_bits[n], sequence)
+
+    @staticmethod
+    def _brute(password, start, end):
+        token = password[start:end]
+        bits = sum(math.log2(_char_cardinality(c)) for c in token)
+        return Match("bruteforce", start, end, token, bits)
+
+    def _matches(self, password, recursive):
+        matches = []
+        matches.extend(self._dictionary(password))
+        matches.extend(self._keyboard(password))
+        matches.extend(self._sequences(password))
+        matches.extend(self._dates(password))
+        matches.extend(self._repeats(password, recursive))
+        return matches
+
+    def _dictionary(self, password):
+        """Trie üzerinde her başlangıçtan leetspeak dallanmalı arama."""
+        lower = password.lower()
+        n = len(lower)
+        trie = self._trie
+        found = {}
+        for i in range(n):
+            # (düğüm, konum, leet sayısı)
+            stack = [(trie, i, 0)]
+            while stack:
+                node, j, leet = stack.pop()
+                if j > i + 2 and "" in node:
+                    key = (i, j)
+                    rank = node[""]
+                    previous = found.get(key)
+                    if previous is None or (rank, leet) < previous:
+                        found[key] = (rank, leet)
+                if j >= n:
+                    continue
+                char = lower[j]
+                child = node.get(char)
+                if child is not None:
+                    stack.append((child, j + 1, leet))
+                for sub in LEET.get(char, ""):
+                    child = node.get(sub)
+                    if child is not None:
+                        stack.append((child, j + 1, leet + 1))
+        matches = []
+        for (i, j), (rank, leet) in found.items():
+            token = password[i:j]
+            guesses = rank * self._uppercase_variations(token) * (2 ** min(leet, 8) if leet else 1)
+            matches.append(Match("dictionary", i, j, token, math.log2(guesses)))
+        return matches
+
+    @staticmethod
+    def _uppercase_variations(token):
+        upper = sum(1 for c in token if c.isupper())
+        if not upper:
+            return 1
+        lower = sum(1 for c in token if c.islower())
+        if not lower or (upper == 1 and token[0].isupper()) or (upper == 1 and token[-1].isupper()):
+            return 2
+        return sum(_nck(upper + lower, k) for k in range(1, min(upper, lower) + 1))
+
+    def _keyboard(self, password):
+        matches = []
+        n = len(password)
+        for name, (coords, neighbors, keys, degree) in self._layouts.items():
+            i = 0
+            while i < n - 2:
+                j = i + 1
+                turns = 0
+                direction = None
+                while j < n and password[j] in neighbors.get(password[j - 1], ()):
+                    (x0, y0), (x1, y1) = coords[password[j - 1]], coords[password[j]]
+                    step = (round(x1 - x0), y1 - y0)
+                    if step != direction:
+                        turns += 1
+                        direction = step
+                    j += 1
+                if j - i >= 3:
+                    token = password[i:j]
+                    matches.append(Match("keyboard", i, j, token,
+                                         math.log2(self._walk_guesses(len(token), turns, keys, degree)
+                                                   * self._shift_variations(token))))
+                    i = j - 1
+                else:
+                    i += 1
+        return matches
+
+    @staticmethod
+    def _walk_guesses(length, turns, keys, degree):
+        guesses = 0
+        for i in range(2, length + 1):
+            for j in range(1, min(turns, i - 1) + 1):
+                guesses += _nck(i - 1, j - 1) * keys * degree ** j
+        return max(guesses, 1)
+
+    @staticmethod
+    def _shift_variations(token):
+        shifted = sum(1 for c in token if c.isupper() or (not c.isalnum() and c in "~!@#$%^&*()_+{}|:\"<>?"))
+        if not shifted or shifted == len(token):
+            return 1 if not shifted else 2
+        return sum(_nck(len(token), k) for k in range(1, min(shifted, len(token) - shifted) + 1))
+
+    @staticmethod
+    def _sequences(password):
+        matches = []
+        n = len(password)
+        i = 0
+        while i < n - 2:
+            delta = ord(password[i + 1]) - ord(password[i])
+            j = i + 1
+            if 1 <= abs(delta) <= 5:
+                while j < n and ord(password[j]) - ord(password[j - 1]) == delta:
+                    j += 1
+            if j - i >= 3:
+                token = password[i:j]
+                first = token[0]
+                if first in "aAzZ019":
+                    base = 4
+                elif first.isdigit():
+                    base = 10
+                else:
+                    base = 26
+                guesses = base * len(token) * (2 if delta < 0 else 1) * abs(delta)
+                matches.append(Match("sequence", i, j, token, math.log2(guesses)))
+                i = j - 1
+            else:
+                i += 1
+        return matches
+
+    def _year_space(self, year):
+        return max(abs(year - self.reference_year), MIN_YEAR_SPACE)
+
+    def _dates(self, password):
+        matches = []
+        for m in _YEAR.finditer(password):
+            year = int(m.group())
+            matches.append(Match("date", m.start(), m.end(), m.group(),
+                                 math.log2(self._year_space(year))))
+        n = len(password)
+        for start in range(n):
+            if not password[start].isdigit():
+                continue
+            for regex, order in _DATE_PATTERNS:
+                m = regex.match(password, start)
+                if not m:
+                    continue
+                parts = dict(zip(order, (m.group(1), m.group(3), m.group(4))))
+                day, month, year = int(parts["d"]), int(parts["m"]), int(parts["y"])
+                if len(parts["y"]) == 2:
+                    year += 1900 if year > 50 else 2000
+                if not (1 <= day <= 31 and 1 <= month <= 12 and 1900 <= year <= 2099):
+                    # gg/aa yer değişimi (ABD biçimi)
+                    if not (1 <= month <= 31 and 1 <= day <= 12 and 1900 <= year <= 2099):
+                        continue
+                guesses = 365 * self._year_space(year) * (4 if m.group(2) else 1)
+                matches.append(Match("date", m.start(), m.end(), m.group(), math.log2(guesses)))
+        return matches
+
+    def _repeats(self, password, recursive):
+        matches = []
+        for m in _REPEAT_CHAR.finditer(password):
+            token = m.group()
+            guesses = _char_cardinality(token[0]) * len(token)
+            matches.append(Match("repeat", m.start(), m.end(), token, math.log2(guesses)))
+        if recursive:
+            for m in _REPEAT_BLOCK.finditer(password):
+                base = m.group(1)
+                count = len(m.group()) // len(base)
+                base_bits = self._estimate(base, recursive=False).bits
+                matches.append(Match("repeat", m.start(), m.end(), m.group(),
+                                     base_bits + math.log2(count)))
+        return matches
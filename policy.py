@@ -0,0 +1,234 @@
+"""
+Deklaratif puanlama politikaları.
+
+Politika TOML veya JSON olarak tanımlanır ve bir kez derlenir: karakter
+sınıfı puanları 16 girdilik bir tabloya (sınıf bitleri -> puan, öneri
+maskesi) dönüştürülür, değerlendirme birkaç karşılaştırma ve tablo
+okumasından ibarettir. Verilmeyen alanlar varsayılanlardan gelir;
+varsayılan politika AIAnalyzer'ın önceki sabit ağırlıklarıyla aynıdır.
+
+Örnek (tenant.toml):
+
+    [[policy]]
+    name = "banka"
+    min_length = 12
+    desired_length = 16
+    strong_threshold = 80
+
+    [policy.class_points]
+    special = 15
+
+PolicySet birden çok politikayı aynı şifre özellikleri üzerinde tek
+geçişte değerlendirir (özellikler şifre başına bir kez çıkarılır).
+"""
+
+import json
+
+from char_classes import UPPER, LOWER, DIGIT, SPECIAL, scan
+from password_rules import PasswordRules
+
+CLASS_BITS = {"upper": UPPER, "lower": LOWER, "digit": DIGIT, "special": SPECIAL}
+
+# Eksik sınıflar için öneri maskesi bitleri (bkz. analysis_result.SUGGESTION_BITS)
+_MISSING_MASK = {UPPER: 4, LOWER: 8, DIGIT: 16, SPECIAL: 32}
+
+MAX_SCORE = 100
+
+DEFAULTS = {
+    "name": "default",
+    "min_length": PasswordRules.MIN_LENGTH,
+    "desired_length": PasswordRules.DESIRED_LENGTH,
+    "min_length_points": 15,
+    "desired_length_points": 30,
+    "class_points": {"upper": 10, "lower": 10, "digit": 10, "special": 10},
+    "common_penalty": 50,
+    "medium_threshold": 40,
+    "strong_threshold": 75,
+}
+
+
+class Policy:
+    """Derlenmiş puanlama politikası."""
+
+    def __init__(self, spec=None):
+        spec = dict(spec or {})
+        unknown = set(spec) - set(DEFAULTS)
+        if unknown:
+            raise ValueError(f"Bilinmeyen politika alanları: {', '.join(sorted(unknown))}")
+        class_points = dict(DEFAULTS["class_points"])
+        class_points.update(spec.pop("class_points", None) or {})
+        unknown = set(class_points) - set(CLASS_BITS)
+        if unknown:
+            raise ValueError(f"Bilinmeyen karakter sınıfları: {', '.join(sorted(unknown))}")
+        values = {**DEFAULTS, **spec}
+
+        self.name = str(values["name"])
+        self.min_length = self._int(values, "min_length")
+        self.desired_length = self._int(values, "desired_length")
+        self.min_length_points = self._int(values, "min_length_points")
+        self.desired_length_points = self._int(values, "desired_length_points")
+        self.class_points = {key: self._int(class_points, key) for key in CLASS_BITS}
+        self.common_penalty = self._int(values, "common_penalty")
+        self.medium_threshold = self._int(values, "medium_threshold")
+        self.strong_threshold = self._int(values, "strong_threshold")
+        if not 0 < self.min_length <= self.desired_length:
+            raise ValueError("Politika: 0 < min_length <= desired_length olmalı")
+        if not 0 <= self.medium_threshold <= self.strong_threshold:
+            raise ValueError("Politika: 0 <= medium_threshold <= strong_threshold olmalı")
+
+        # Sınıf bitleri (0-15) -> (puan, eksik sınıf maskesi)
+        self.class_table = tuple(
+            (sum(points for key, points in self.class_points.items() if flags & CLASS_BITS[key]),
+             sum(mask for bit, mask in _MISSING_MASK.items() if not flags & bit))
+            for flags in range(16)
+        )
+        self.evaluate = self._compile()
+
+    @staticmethod
+    def _int(values, key):
+        value = values[key]
+        if isinstance(value, bool) or not isinstance(value, int):
+            raise ValueError(f"Politika alanı tam sayı olmalı: {key}")
+        return value
+
+    def _compile(self):
+        """Politika sabitlerini kapanışa gömen değerlendirme işlevini üretir."""
+        min_length, desired_length = self.min_length, self.desired_length
+        min_points, desired_points = self.min_length_points, self.desired_length_points
+        class_table = self.class_table
+        penalty = self.common_penalty
+        medium, strong = self.medium_threshold, self.strong_threshold
+
+        def evaluate(length, flags, is_common):
+            """(uzunluk, sınıf bitleri, yaygın mı) -> (puan, durum anahtarı, öneri maskesi)."""
+            points, mask = class_table[flags & 15]
+            if length >= desired_length:
+                score = desired_points + points
+            elif length >= min_length:
+                score = min_points + points
+                mask |= 1
+            else:
+                score = points
+                mask |= 2
+            if is_common:
+                score -= penalty
+                mask |= 64
+            score = max(0, min(MAX_SCORE, score))
+            if score < medium:
+                status = "weak"
+            elif score < strong:
+                status = "medium"
+            else:
+                status = "strong"
+            if score == MAX_SCORE:
+                mask = 128
+            return score, status, mask
+
+        return evaluate
+
+    def status(self, score):
+        """Puan için durum anahtarını döner (weak/medium/strong)."""
+        if score < self.medium_threshold:
+            return "weak"
+        if score < self.strong_threshold:
+            return "medium"
+        return "strong"
+
+    def to_dict(self):
+        return {
+            "name": self.name,
+            "min_length": self.min_length,
+            "desired_length": self.desired_length,
+            "min_length_points": self.min_length_points,
+            "desired_length_points": self.desired_length_points,
+            "class_points": dict(self.class_points),
+            "common_penalty": self.common_penalty,
+            "medium_threshold": self.medium_threshold,
+            "strong_threshold": self.strong_threshold,
+        }
+
+    def digest(self):
+        """Politika içeriğinin kısa özeti (ad hariç); sürümleme için."""
+        import hashlib
+        values = self.to_dict()
+        del values["name"]
+        data = json.dumps(values, sort_keys=True).encode("utf-8")
+        return hashlib.blake2b(data, digest_size=8).hexdigest()
+
+    def __repr__(self):
+        return f"Policy({self.name!r})"
+
+
+class PolicySet:
+    """
+    Birden çok politikayı aynı özellikler üzerinde değerlendirir.
+    Uzunluk, sınıf bitleri ve kara liste kontrolü şifre başına bir kez
+    hesaplanır; politika başına maliyet yalnızca derlenmiş değerlendirmedir.
+    """
+
+    def __init__(self, policies):
+        self.policies = list(policies)
+        names = [policy.name for policy in self.policies]
+        if len(set(names)) != len(names):
+            raise ValueError("Politika adları benzersiz olmalı")
+        self._evaluators = tuple(policy.evaluate for policy in self.policies)
+
+    @property
+    def names(self):
+        return [policy.name for policy in self.policies]
+
+    def evaluate(self, length, flags, is_common):
+        """Her politika için (puan, durum anahtarı, öneri maskesi) listesi döner."""
+        return [evaluate(length, flags, is_common) for evaluate in self._evaluators]
+
+    def score_many(self, passwords, blocklist=None):
+        """
+        Her şifre için politika sırasıyla (puan, durum anahtarı) demetleri üretir.
+        Boş şifreler (0, "ready") olarak döner.
+        """
+        if blocklist is None:
+            blocklist = PasswordRules.load_blocklist()
+        evaluators = self._evaluators
+        empty = tuple((0, "ready") for _ in evaluators)
+        for password in passwords:
+            if not password:
+                yield empty
+                continue
+            flags = scan(password)[0]
+            length = len(password)
+            is_common = password in blocklist
+            yield tuple(evaluate(length, flags, is_common)[:2] for evaluate in evaluators)
+
+
+def _read_specs(path):
+    if str(path).endswith(".toml"):
+        import tomllib
+        with open(path, "rb") as f:
+            data = tomllib.load(f)
+    else:
+        with open(path, encoding="utf-8") as f:
+            data = json.load(f)
+    if isinstance(data, dict) and "policy" in data:
+        data = data["policy"]
+    return data if isinstance(data, list) else [data]
+
+
+def load_policies(path):
+    """TOML veya JSON dosyasındaki tüm politikaları derleyip liste olarak döner."""
+    return [Policy(spec) for spec in _read_specs(path)]
+
+
+def load_policy(path, name=None):
+    """
+    Dosyadan tek politika yükler. Dosyada birden çok politika varsa
+    name ile seçilmelidir.
+    """
+    policies = load_policies(path)
+    if name is not None:
+        for policy in policies:
+            if policy.name == name:
+                return policy
+        raise ValueError(f"Politika bulunamadı: {name}")
+    if len(policies) != 1:
+        raise ValueError(f"{path} birden çok politika içeriyor; ad belirtin")
+    return policies[0]
@@ -0,0 +1,350 @@
+"""
+Büyük denetimler için akış tabanlı rapor hattı.
+
+Girdi tembel okunur (düz metin, CSV sütunu, .gz veya .zst), AIAnalyzer'a
+üreteçlerle beslenir ve sonuçlar JSONL, CSV veya Parquet olarak parça parça
+yazılır. Bellek kullanımı girdi boyutundan bağımsızdır.
+
+Her kayıt, girdideki (açılmış akıştaki) satırın bayt konumunu `offset`
+alanında taşır. Kesintiden sonra --resume ile çıktıdaki son tam kayıttan
+devam edilir; yarım kalmış son satır atılır. Parquet dosyalarına ekleme
+yapılamadığından devam çıktısı ayrı parça dosyalarına yazılır
+(`report.parquet`, `report.<offset>.parquet`; bkz. parquet_parts).
+
+Kullanım:
+    python -m report_pipeline dump.txt.gz -o report.jsonl
+    python -m report_pipeline users.csv --column password -o report.csv --format csv
+    python -m report_pipeline dump.txt.zst -o report.jsonl --resume
+"""
+
+import io
+import os
+import re
+import sys
+import csv
+import json
+import argparse
+import itertools
+
+from ai_analyzer import AIAnalyzer
+
+CHECK_KEYS = ("length", "upper", "lower", "digit", "special", "common")
+METRIC_KEYS = ("length", "variety", "entropy", "uniqueness", "safety")
+
+FLAT_FIELDS = (["offset", "score", "status", "entropy"]
+               + [f"check_{k}" for k in CHECK_KEYS]
+               + [f"metric_{k}" for k in METRIC_KEYS])
+
+
+def open_input(path):
+    """Uzantıya göre düz, gzip veya zstd akışını ikili modda açar."""
+    if path.endswith(".gz"):
+        import gzip
+        return gzip.open(path, "rb")
+    if path.endswith(".zst"):
+        try:
+            import zstandard
+        except ImportError:
+            raise ImportError(".zst girdileri için zstandard gerekli: pip install zstandard")
+        reader = zstandard.ZstdDecompressor().stream_reader(open(path, "rb"), closefd=True)
+        # readline() desteği için tamponlu okuyucu
+        return io.BufferedReader(reader)
+    return open(path, "rb")
+
+
+def _skip_to(f, pos, target):
+    """Akışı target konumuna taşır; aranamayan akışlarda okuyup atar."""
+    if f.seekable():
+        f.seek(target)
+        return
+    while pos < target:
+        chunk = f.read(min(1 << 20, target - pos))
+        if not chunk:
+            break
+        pos += len(chunk)
+
+
+def _lines(f, pos):
+    """İkili akıştan (bayt konumu, satır) üretir."""
+    readline = f.readline
+    while True:
+        line = readline()
+        if not line:
+            return
+        yield pos, line
+        pos += len(line)
+
+
+def read_passwords(path, column=None, start_offset=0, delimiter=","):
+    """
+    Girdiden (bayt konumu, şifre) çiftlerini tembel olarak üretir.
+    column verilirse girdi CSV kabul edilir: sütun adı (başlık satırı gerekir)
+    veya 0 tabanlı indeks. Alan içinde satır sonu olan CSV kayıtları desteklenmez.
+    """
+    with open_input(path) as f:
+        index = None
+        pos = 0
+        if column is not None:
+            if isinstance(column, int) or str(column).isdigit():
+                index = int(column)
+            else:
+                header = f.readline()
+                pos = len(header)
+                names = next(csv.reader([header.decode("utf-8-sig", "replace")], delimiter=delimiter))
+                if column not in names:
+                    raise ValueError(f"CSV başlığında '{column}' sütunu yok")
+                index = names.index(column)
+        if start_offset > pos:
+            # Sıkıştırılmış akışlarda ileri arama açarak ilerler
+            _skip_to(f, pos, start_offset)
+            pos = start_offset
+        for offset, line in _lines(f, pos):
+            text = line.rstrip(b"\r\n").decode("utf-8", "surrogateescape")
+            if index is not None:
+                fields = next(csv.reader([text], delimiter=delimiter), [])
+                text = fields[index] if index < len(fields) else ""
+            if text:
+                yield offset, text
+
+
+def flatten(offset, result):
+    """Sonucu CSV/sütunlu çıktı için düz satıra çevirir."""
+    checks = result["checks"]
+    metrics = result.get("metrics", {})
+    return ([offset, result["score"], result["status"], result.get("entropy", 0.0)]
+            + [checks[k] for k in CHECK_KEYS]
+            + [metrics.get(k, 0.0) for k in METRIC_KEYS])
+
+
+class JsonlWriter:
+    def __init__(self, path, append=False):
+        self._file = open(path, "a" if append else "w", encoding="utf-8", newline="\n")
+
+    def write(self, offset, result):
+        self._file.write(json.dumps({"offset": offset, **result}, ensure_ascii=False))
+        self._file.write("\n")
+
+    def close(self):
+        self._file.close()
+
+
+class CsvWriter:
+    def __init__(self, path, append=False):
+        exists = append and os.path.exists(path) and os.path.getsize(path) > 0
+        self._file = open(path, "a" if append else "w", encoding="utf-8", newline="")
+        self._writer = csv.writer(self._file, lineterminator="\n")
+        if not exists:
+            self._writer.writerow(FLAT_FIELDS)
+
+    def write(self, offset, result):
+        self._writer.writerow(flatten(offset, result))
+
+    def close(self):
+        self._file.close()
+
+
+class ParquetWriter:
+    """
+    Sütunlu Parquet çıktısı (pyarrow gerekir). Satırlar row_group_size
+    kadar sütunlarda biriktirilip satır grubu olarak yazılır.
+    Parquet dosyalarına ekleme yapılamadığından devam modunda
+    (resume_offset verilirse) yeni bir parça dosyası
+    (`<ad>.<resume_offset>.parquet`) açılır.
+    """
+
+    def __init__(self, path, append=False, row_group_size=65536, resume_offset=None):
+        try:
+            import pyarrow as pa
+            import pyarrow.parquet as pq
+        except ImportError:
+            raise ImportError("Parquet çıktısı için pyarrow gerekli: pip install pyarrow")
+        if append and resume_offset is not None:
+            path = _part_path(path, resume_offset)
+        self.path = path
+        self._pa = pa
+        self._schema = pa.schema(
+            [("offset", pa.int64()), ("score", pa.int16()), ("status", pa.string()),
+             ("entropy", pa.float64())]
+            + [(f"check_{k}", pa.bool_()) for k in CHECK_KEYS]
+            + [(f"metric_{k}", pa.float64()) for k in METRIC_KEYS])
+        self._writer = pq.ParquetWriter(path, self._schema)
+        self._row_group_size = row_group_size
+        self._columns = [[] for _ in FLAT_FIELDS]
+
+    def write(self, offset, result):
+        for column, value in zip(self._columns, flatten(offset, result)):
+            column.append(value)
+        if len(self._columns[0]) >= self._row_group_size:
+            self._flush()
+
+    def _flush(self):
+        if self._columns[0]:
+            self._writer.write_table(
+                self._pa.Table.from_arrays(self._columns, schema=self._schema))
+            self._columns = [[] for _ in FLAT_FIELDS]
+
+    def close(self):
+        self._flush()
+        self._writer.close()
+
+
+WRITERS = {"jsonl": JsonlWriter, "csv": CsvWriter, "parquet": ParquetWriter}
+
+
+def _part_path(path, offset):
+    stem, ext = os.path.splitext(path)
+    return f"{stem}.{offset}{ext or '.parquet'}"
+
+
+def parquet_parts(path):
+    """
+    Parquet çıktısının dosyalarını (ana dosya ve devam parçaları) kayıt
+    sırasıyla döner; örn. pyarrow.parquet.read_table(parquet_parts(path)).
+    """
+    stem, ext = os.path.splitext(path)
+    directory = os.path.dirname(path) or "."
+    pattern = re.compile(re.escape(os.path.basename(stem)) + r"\.(\d+)"
+                         + re.escape(ext or ".parquet") + "$")
+    parts = []
+    for name in os.listdir(directory):
+        match = pattern.match(name)
+        if match:
+            parts.append((int(match.group(1)), os.path.join(directory, name)))
+    files = [path] if os.path.exists(path) else []
+    return files + [part for _, part in sorted(parts)]
+
+
+def _parquet_resume_offset(path):
+    """
+    Parquet parçalarındaki en büyük kayıt konumunu döner (kayıt yoksa None).
+    Kesintide alt bilgisi (footer) yazılamamış, okunamayan parçalar silinir;
+    yarım JSONL/CSV satırının kesilmesinin karşılığıdır.
+    """
+    try:
+        import pyarrow.parquet as pq
+    except ImportError:
+        raise ImportError("Parquet çıktısı için pyarrow gerekli: pip install pyarrow")
+    last = None
+    for part in parquet_parts(path):
+        try:
+            parquet = pq.ParquetFile(part)
+        except Exception:
+            os.remove(part)
+            continue
+        with parquet:
+            if not parquet.metadata.num_rows:
+                continue
+            # Kayıtlar konuma göre artan sırada yazılır; son satır grubu yeterli
+            group = parquet.metadata.num_row_groups - 1
+            while not parquet.metadata.row_group(group).num_rows:
+                group -= 1
+            offsets = parquet.read_row_group(group, columns=["offset"]).column(0)
+            value = offsets[len(offsets) - 1].as_py()
+        last = value if last is None else max(last, value)
+    return last
+
+
+def _rfind_newline(f, end, block=65536):
+    """[0, end) aralığındaki son satır sonunun konumunu döner (yoksa -1)."""
+    while end > 0:
+        start = max(0, end - block)
+        f.seek(start)
+        cut = f.read(end - start).rfind(b"\n")
+        if cut != -1:
+            return start + cut
+        end = start
+    return -1
+
+
+def resume_offset(path, fmt):
+    """
+    Çıktıdaki son tam kaydın girdi konumunu döner (kayıt yoksa None).
+    Yarım yazılmış son satır dosyadan kesilir; Parquet'te okunamayan
+    parça dosyaları silinir.
+    """
+    if fmt == "parquet":
+        return _parquet_resume_offset(path)
+    if not os.path.exists(path):
+        return None
+    with open(path, "rb+") as f:
+        end = _rfind_newline(f, f.seek(0, os.SEEK_END))
+        f.truncate(end + 1)
+        if end == -1:
+            return None
+        start = _rfind_newline(f, end) + 1
+        f.seek(start)
+        last = f.read(end - start)
+    if fmt == "jsonl":
+        return json.loads(last)["offset"]
+    value = next(csv.reader([last.decode("utf-8")]))[0]
+    # Yalnızca başlık satırı varsa kayıt yoktur
+    return int(value) if value.isdigit() else None
+
+
+def run_pipeline(input_path, output_path, fmt="jsonl", column=None, resume=False,
+                 start_offset=0, analyzer=None, lang="en", delimiter=","):
+    """
+    Girdiyi analiz edip çıktıya akıtır; yazılan kayıt sayısını döner.
+    resume=True ise çıktıdaki son kayıttan sonra devam edilir.
+    """
+    analyzer = analyzer if analyzer is not None else AIAnalyzer(lang)
+    last = resume_offset(output_path, fmt) if resume else None
+    if last is not None:
+        start_offset = last
+
+    records = read_passwords(input_path, column, start_offset, delimiter)
+    if last is not None:
+        # Son yazılan kayıt yeniden okunur; atlanır
+        records = ((o, p) for o, p in records if o > last)
+
+    if fmt == "parquet":
+        if not resume:
+            # Önceki çalıştırmanın devam parçaları yeni çıktıya karışmamalı
+            for part in parquet_parts(output_path):
+                if part != output_path:
+                    os.remove(part)
+        # Kayıt yoksa ana dosya (yeniden) yazılır, varsa yeni parça açılır
+        writer = ParquetWriter(output_path, append=last is not None, resume_offset=last)
+    else:
+        writer = WRITERS[fmt](output_path, append=resume)
+
+    # tee yalnızca bir kayıtlık gecikmeyi tamponlar; bellek sabit kalır
+    records, pending = itertools.tee(records)
+    count = 0
+    try:
+        results = analyzer.analyze_many(password for _, password in pending)
+        for (offset, _), result in zip(records, results):
+            writer.write(offset, result)
+            count += 1
+    finally:
+        writer.close()
+    return count
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(
+        prog="python -m report_pipeline",
+        description="Şifre dökümünü akış halinde analiz edip rapor yazar.")
+    parser.add_argument("input", help="düz metin, CSV, .gz veya .zst girdi")
+    parser.add_argument("-o", "--output", required=True)
+    parser.add_argument("--format", choices=sorted(WRITERS), default=None,
+                        help="varsayılan: çıktı uzantısından")
+    parser.add_argument("--column", default=None, help="CSV girdide şifre sütunu (ad veya indeks)")
+    parser.add_argument("--delimiter", default=",")
+    parser.add_argument("--resume", action="store_true", help="kesintiden sonra devam et")
+    parser.add_argument("--start-offset", type=int, default=0, help="girdide başlangıç bayt konumu")
+    parser.add_argument("--lang", default="en", choices=["tr", "en", "de"])
+    args = parser.parse_args(argv)
+
+    fmt = args.format
+    if fmt is None:
+        ext = os.path.splitext(args.output)[1].lstrip(".").lower()
+        fmt = ext if ext in WRITERS else "jsonl"
+    count = run_pipeline(args.input, args.output, fmt, args.column, args.resume,
+                         args.start_offset, lang=args.lang, delimiter=args.delimiter)
+    print(f"{count} kayıt yazıldı: {args.output}", file=sys.stderr)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,397 @@
+"""
+Yerel puanlama servisi (asyncio, HTTP/1.1 + JSON).
+
+Kayıt formları, şifre değiştirme kancaları ve hesap açma betikleri kendi
+AIAnalyzer örneklerini gömmek yerine bu servise bağlanır: kara liste ve
+analizör süreçte bir kez yüklenir ve sıcak kalır.
+
+Eşzamanlı istekler mikro partilerde birleştirilir (MicroBatcher): ilk
+istekten sonra olay döngüsüne bir tur (veya max_delay) verilir, bu sürede
+kuyruğa giren tüm istekler tek analyze_many çağrısıyla puanlanır.
+Bağlantılar kalıcıdır (keep-alive); ardışık gönderilen (pipelined) istekler
+birlikte partiye girer ve yanıtlar istek sırasıyla yazılır.
+
+Uç noktalar:
+    POST /analyze   {"password": "...", "lang": "tr"}  -> analiz sonucu
+                    {"passwords": ["...", ...]}        -> sonuç listesi
+    GET  /health    durum, analizör sürümü ve parti istatistikleri
+
+Şifreler günlüğe yazılmaz. Varsayılan olarak yalnızca 127.0.0.1 dinlenir;
+Unix soketi yalnızca sahibi tarafından erişilebilir (0600) oluşturulur.
+
+Kullanım:
+    python -m service --port 8765
+    python -m service --unix /run/locksense.sock --policy tenant.toml
+"""
+
+import asyncio
+import json
+import os
+import socket
+import stat
+import sys
+
+from ai_analyzer import AIAnalyzer
+from translations import TRANSLATIONS
+
+DEFAULT_PORT = 8765
+MAX_BATCH = 64
+# Bağlantı başına yanıtı beklenen en fazla ardışık istek
+PIPELINE_DEPTH = 32
+MAX_BODY = 1 << 20
+MAX_HEADERS = 64
+
+_REASONS = {200: "OK", 400: "Bad Request", 404: "Not Found", 405: "Method Not Allowed",
+            413: "Payload Too Large", 431: "Request Header Fields Too Large",
+            500: "Internal Server Error", 501: "Not Implemented"}
+
+
+class _HTTPError(Exception):
+    def __init__(self, status, message):
+        super().__init__(message)
+        self.status = status
+
+
+class MicroBatcher:
+    """
+    Eşzamanlı analiz isteklerini partilere toplayıp analyze_many ile puanlar.
+    max_delay=0 ise ilk istekten sonra yalnızca bir döngü turu beklenir.
+    """
+
+    def __init__(self, analyzer, max_batch=MAX_BATCH, max_delay=0.0):
+        self.analyzer = analyzer
+        self.max_batch = max_batch
+        self.max_delay = max_delay
+        self.batches = 0
+        self.requests = 0
+        self.largest = 0
+        self._queue = None
+        self._task = None
+
+    def start(self):
+        self._queue = asyncio.Queue()
+        self._task = asyncio.get_running_loop().create_task(self._run())
+
+    async def stop(self):
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+    def submit(self, password, lang=None):
+        """Şifreyi kuyruğa ekler; sonucu verecek Future döner."""
+        future = asyncio.get_running_loop().create_future()
+        self._queue.put_nowait((password, lang, future))
+        return future
+
+    async def _run(self):
+        queue = self._queue
+        while True:
+            batch = [await queue.get()]
+            # Diğer bağlantıların okunmuş isteklerini kuyruğa eklemesine izin ver
+            await asyncio.sleep(self.max_delay)
+            while len(batch) < self.max_batch and not queue.empty():
+                batch.append(queue.get_nowait())
+            self._process(batch)
+
+    def _process(self, batch):
+        self.batches += 1
+        self.requests += len(batch)
+        self.largest = max(self.largest, len(batch))
+        groups = {}
+        for password, lang, future in batch:
+            groups.setdefault(lang, []).append((password, future))
+        for lang, items in groups.items():
+            try:
+                results = list(self.analyzer.analyze_many([password for password, _ in items], lang))
+            except Exception as exc:
+                for _, future in items:
+                    if not future.done():
+                        future.set_exception(exc)
+                continue
+            for (_, future), result in zip(items, results):
+                if not future.done():
+                    future.set_result(result)
+
+    def stats(self):
+        return {
+            "requests": self.requests,
+            "batches": self.batches,
+            "mean_batch": round(self.requests / self.batches, 2) if self.batches else 0.0,
+            "largest_batch": self.largest,
+        }
+
+
+async def _read_request(reader):
+    """Bir HTTP/1.1 isteği okur: (yöntem, yol, sürüm, başlıklar, gövde) veya None (EOF)."""
+    line = await reader.readline()
+    if not line:
+        return None
+    if not line.endswith(b"\n"):
+        raise asyncio.IncompleteReadError(line, None)
+    try:
+        method, target, version = line.decode("latin-1").rstrip("\r\n").split(" ")
+    except ValueError:
+        raise _HTTPError(400, "Geçersiz istek satırı") from None
+    headers = {}
+    while True:
+        line = await reader.readline()
+        if line in (b"\r\n", b"\n"):
+            break
+        if not line:
+            raise asyncio.IncompleteReadError(line, None)
+        if len(headers) >= MAX_HEADERS:
+            raise _HTTPError(431, "Çok fazla başlık")
+        name, _, value = line.decode("latin-1").partition(":")
+        headers[name.strip().lower()] = value.strip()
+    if "transfer-encoding" in headers:
+        raise _HTTPError(501, "Transfer-Encoding desteklenmiyor; Content-Length kullanın")
+    try:
+        length = int(headers.get("content-length", 0))
+    except ValueError:
+        raise _HTTPError(400, "Geçersiz Content-Length") from None
+    if length < 0:
+        raise _HTTPError(400, "Geçersiz Content-Length")
+    if length > MAX_BODY:
+        raise _HTTPError(413, "Gövde çok büyük")
+    body = await reader.readexactly(length) if length else b""
+    return method, target.split("?", 1)[0], version, headers, body
+
+
+def _keep_alive(version, headers):
+    connection = headers.get("connection", "").lower()
+    if version == "HTTP/1.0":
+        return connection == "keep-alive"
+    return connection != "close"
+
+
+def _response(status, payload, keep_alive):
+    body = json.dumps(payload, ensure_ascii=False).encode("utf-8")
+    head = (f"HTTP/1.1 {status} {_REASONS[status]}\r\n"
+            "Content-Type: application/json; charset=utf-8\r\n"
+            f"Content-Length: {len(body)}\r\n"
+            f"Connection: {'keep-alive' if keep_alive else 'close'}\r\n\r\n")
+    return head.encode("latin-1") + body
+
+
+def _bind_unix(path):
+    """
+    Unix soketini yalnızca sahibine açık olarak bağlar. Yolda eski bir soket
+    varsa silinir; soket olmayan bir dosya asla silinmez (FileExistsError).
+    """
+    try:
+        mode = os.lstat(path).st_mode
+    except FileNotFoundError:
+        pass
+    else:
+        if not stat.S_ISSOCK(mode):
+            raise FileExistsError(f"{path} mevcut ve bir soket değil")
+        os.unlink(path)
+    sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    try:
+        # umask süreç genelidir: yalnızca bind süresince (await olmadan) değişir
+        old_umask = os.umask(0o177)
+        try:
+            sock.bind(path)
+        finally:
+            os.umask(old_umask)
+        os.chmod(path, 0o600)
+    except BaseException:
+        sock.close()
+        raise
+    return sock
+
+
+class ScoringService:
+    """Tek sıcak AIAnalyzer üzerinde HTTP/JSON puanlama servisi."""
+
+    def __init__(self, analyzer=None, max_batch=MAX_BATCH, max_delay=0.0):
+        self.analyzer = analyzer if analyzer is not None else AIAnalyzer()
+        self.batcher = MicroBatcher(self.analyzer, max_batch, max_delay)
+        self.connections = 0
+        self._server = None
+
+    async def start(self, host="127.0.0.1", port=DEFAULT_PORT, path=None):
+        """Dinlemeye başlar; asyncio sunucusunu döner."""
+        if path is not None:
+            sock = _bind_unix(path)
+            self.batcher.start()
+            self._server = await asyncio.start_unix_server(self._handle, sock=sock)
+        else:
+            self.batcher.start()
+            self._server = await asyncio.start_server(self._handle, host, port)
+        return self._server
+
+    async def stop(self):
+        if self._server is not None:
+            self._server.close()
+            await self._server.wait_closed()
+            self._server = None
+        await self.batcher.stop()
+
+    async def _handle(self, reader, writer):
+        self.connections += 1
+        pending = asyncio.Queue(PIPELINE_DEPTH)
+        responder = asyncio.get_running_loop().create_task(self._respond(pending, writer))
+        try:
+            while not responder.done():
+                try:
+                    request = await _read_request(reader)
+                except _HTTPError as exc:
+                    await pending.put((_done(exc.status, {"error": str(exc)}), False))
+                    break
+                except (asyncio.IncompleteReadError, asyncio.LimitOverrunError,
+                        ValueError, ConnectionError):
+                    break
+                if request is None:
+                    break
+                method, path, version, headers, body = request
+                keep_alive = _keep_alive(version, headers)
+                task = asyncio.ensure_future(self._dispatch(method, path, body))
+                await pending.put((task, keep_alive))
+                if not keep_alive:
+                    break
+        finally:
+            await pending.put(None)
+            await responder
+            self.connections -= 1
+            writer.close()
+            try:
+                await writer.wait_closed()
+            except ConnectionError:
+                pass
+
+    async def _respond(self, pending, writer):
+        """Yanıtları istek sırasıyla yazar (pipelining)."""
+        while True:
+            item = await pending.get()
+            if item is None:
+                return
+            task, keep_alive = item
+            try:
+                status, payload = await task
+                response = _response(status, payload, keep_alive)
+            except Exception:
+                response = _response(500, {"error": "İç hata"}, keep_alive)
+            try:
+                writer.write(response)
+                # Sıradaki yanıt hazırsa bekletmeden arka arkaya yaz
+                if pending.empty():
+                    await writer.drain()
+            except ConnectionError:
+                # Okuyucu devam ederse kuyruğu boşalt
+                while (await pending.get()) is not None:
+                    pass
+                return
+            if not keep_alive:
+                await writer.drain()
+                return
+
+    async def _dispatch(self, method, path, body):
+        try:
+            if path == "/analyze":
+                if method != "POST":
+                    raise _HTTPError(405, "POST kullanın")
+                return 200, await self._analyze(body)
+            if path == "/health":
+                if method != "GET":
+                    raise _HTTPError(405, "GET kullanın")
+                return 200, self.health()
+            raise _HTTPError(404, "Bulunamadı")
+        except _HTTPError as exc:
+            return exc.status, {"error": str(exc)}
+
+    async def _analyze(self, body):
+        try:
+            request = json.loads(body)
+        except (ValueError, UnicodeDecodeError):
+            raise _HTTPError(400, "Geçersiz JSON") from None
+        if not isinstance(request, dict):
+            raise _HTTPError(400, "JSON nesnesi bekleniyor")
+        lang = request.get("lang")
+        if lang is not None and lang not in TRANSLATIONS:
+            raise _HTTPError(400, f"Desteklenmeyen dil: {lang}")
+        submit = self.batcher.submit
+        if "passwords" in request:
+            passwords = request["passwords"]
+            if not isinstance(passwords, list) or not all(isinstance(p, str) for p in passwords):
+                raise _HTTPError(400, "passwords metin listesi olmalı")
+            results = await asyncio.gather(*(submit(p, lang) for p in passwords))
+            return [result.to_dict() for result in results]
+        password = request.get("password")
+        if not isinstance(password, str):
+            raise _HTTPError(400, "password alanı gerekli")
+        return (await submit(password, lang)).to_dict()
+
+    def health(self):
+        return {"status": "ok", "version": self.analyzer.version,
+                "connections": self.connections, **self.batcher.stats()}
+
+
+def _done(status, payload):
+    future = asyncio.get_running_loop().create_future()
+    future.set_result((status, payload))
+    return future
+
+
+async def serve(service, host="127.0.0.1", port=DEFAULT_PORT, path=None, ready=None):
+    """Servisi başlatır ve iptal edilene kadar çalıştırır."""
+    server = await service.start(host, port, path)
+    if ready is not None:
+        ready(server)
+    try:
+        await server.serve_forever()
+    finally:
+        await service.stop()
+
+
+def main(argv=None):
+    import argparse
+
+    parser = argparse.ArgumentParser(
+        prog="python -m service",
+        description="LockSense yerel puanlama servisi (HTTP/JSON).")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=DEFAULT_PORT)
+    parser.add_argument("--unix", default=None, help="TCP yerine Unix soketi yolu")
+    parser.add_argument("--lang", default="en", choices=sorted(TRANSLATIONS))
+    parser.add_argument("--blocklist", default=None, help="kara liste dizin dosyası")
+    parser.add_argument("--policy", default=None, help="politika dosyası (.toml veya .json)")
+    parser.add_argument("--policy-name", default=None)
+    parser.add_argument("--max-batch", type=int, default=MAX_BATCH)
+    parser.add_argument("--max-delay-ms", type=float, default=0.0,
+                        help="parti toplamak için ilk istekten sonra bekleme")
+    args = parser.parse_args(argv)
+
+    blocklist = None
+    policy = None
+    try:
+        if args.blocklist:
+            from password_rules import PasswordRules
+            blocklist = PasswordRules.load_blocklist(args.blocklist)
+        if args.policy:
+            from policy import load_policy
+            policy = load_policy(args.policy, args.policy_name)
+    except (OSError, ValueError) as exc:
+        parser.error(str(exc))
+    service = ScoringService(AIAnalyzer(args.lang, blocklist=blocklist, policy=policy),
+                             args.max_batch, args.max_delay_ms / 1000)
+
+    def ready(server):
+        address = server.sockets[0].getsockname()
+        where = address if isinstance(address, str) else f"{address[0]}:{address[1]}"
+        sys.stdout.write(f"listening {where}\n")
+        sys.stdout.flush()
+
+    try:
+        asyncio.run(serve(service, args.host, args.port, args.unix, ready))
+    except KeyboardInterrupt:
+        pass
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,353 @@
+"""
+Şifre tekrar kullanımı ve yakın kopya tespiti.
+
+AIAnalyzer şifreleri tek tek puanlar; `Summer2024!` ile `Summer2025!`
+arasındaki ilişkiyi göremez. SimilarityIndex bir şifre kümesi üzerinde
+üç aşamada çalışır ve sonuçları birleşim-bul (union-find) kümelerinde toplar:
+
+  1. exact:   anahtarlı BLAKE2b özeti ile birebir tekrar
+  2. variant: normalleştirme (küçük harf, leetspeak -> harf, rakam
+              dizileri -> '#') sonrası anahtarlı özeti aynı olan şifreler
+  3. near:    normalleştirilmiş biçimlerin karakter 3-gramları üzerinde
+              MinHash + LSH bantlama ile aday çiftler bulunur ve sıralı
+              anahtarlı 3-gram dizileriyle düzenleme uzaklığı
+              (<= max_distance) doğrulanır
+
+Dizin şifreleri ve normal biçimleri saklamaz: girdi başına kimlik ve özet,
+benzersiz normal biçim başına uzunluk ve 3-gramlarının anahtarlı 32 bit
+hash dizisi tutulur. Hash'ler anahtarsız tahminlerle karşılaştırılamaz;
+ancak aynı 3-gram her biçimde aynı hash'i aldığından çok büyük kümelerde
+3-gram sıklığı çözümlemesi teorik olarak mümkündür. Aday üretimi kova başına
+sınırlıdır (max_bucket_pairs); toplam maliyet benzersiz normal biçim
+sayısıyla yaklaşık doğrusal büyür, bellek girdi sayısıyla doğrusaldır.
+
+Kullanım:
+    python -m similarity passwords.txt --min-size 3
+"""
+
+import hashlib
+import os
+import sys
+import zlib
+from array import array
+from collections import namedtuple
+
+from pattern_entropy import LEET
+
+Cluster = namedtuple("Cluster", "ids kinds")
+
+# Leetspeak karakteri -> ilk harf karşılığı
+_DELEET = {ord(char): letters[0] for char, letters in LEET.items() if not char.isdigit()}
+_DELEET_DIGITS = {char: letters[0] for char, letters in LEET.items() if char.isdigit()}
+_MASK64 = (1 << 64) - 1
+# 3-gram dizisinde biçimin iki yanına eklenen dolgu karakteri
+_PAD = "\0"
+# Bağlantı türleri (küme raporunda en güçlüsü önce)
+KINDS = ("exact", "variant", "near")
+
+
+def normalize(password):
+    """
+    Önemsiz varyantları aynı biçime indirger: küçük harf, leetspeak sembolleri
+    harfe; harfler arasındaki tek rakam (`p4ss`) harfe, diğer rakam dizileri
+    (`2024`) tek '#' karakterine.
+    """
+    lowered = password.lower().translate(_DELEET)
+    out = []
+    n = len(lowered)
+    i = 0
+    while i < n:
+        char = lowered[i]
+        if not char.isdigit():
+            out.append(char)
+            i += 1
+            continue
+        j = i + 1
+        while j < n and lowered[j].isdigit():
+            j += 1
+        letter = _DELEET_DIGITS.get(char)
+        if (j == i + 1 and letter and i > 0 and j < n
+                and lowered[i - 1].isalpha() and lowered[j].isalpha()):
+            out.append(letter)
+        else:
+            out.append("#")
+        i = j
+    return "".join(out)
+
+
+def bounded_levenshtein(a, b, limit):
+    """
+    Düzenleme uzaklığını hesaplar; limit aşılırsa limit + 1 döner.
+    Yalnızca |i - j| <= limit bandı doldurulur: O(limit * len).
+    """
+    if abs(len(a) - len(b)) > limit:
+        return limit + 1
+    if len(a) > len(b):
+        a, b = b, a
+    big = limit + 1
+    previous = list(range(len(b) + 1))
+    for i in range(1, len(a) + 1):
+        lo = max(1, i - limit)
+        hi = min(len(b), i + limit)
+        current = [big] * (len(b) + 1)
+        if lo == 1:
+            current[0] = i
+        char = a[i - 1]
+        best = big
+        for j in range(lo, hi + 1):
+            cost = previous[j - 1] + (char != b[j - 1])
+            deletion = previous[j] + 1
+            insertion = current[j - 1] + 1
+            value = min(cost, deletion, insertion)
+            current[j] = value
+            if value < best:
+                best = value
+        if best > limit:
+            return big
+        previous = current
+    return min(previous[len(b)], big)
+
+
+class _UnionFind:
+    def __init__(self):
+        self.parent = []
+
+    def add(self):
+        self.parent.append(len(self.parent))
+        return len(self.parent) - 1
+
+    def find(self, x):
+        parent = self.parent
+        root = x
+        while parent[root] != root:
+            root = parent[root]
+        while parent[x] != root:
+            parent[x], x = root, parent[x]
+        return root
+
+    def union(self, a, b):
+        ra, rb = self.find(a), self.find(b)
+        if ra != rb:
+            if ra > rb:
+                ra, rb = rb, ra
+            self.parent[rb] = ra
+        return ra
+
+
+class SimilarityIndex:
+    """
+    Şifre kümesi için tekrar kullanım ve yakın kopya dizini.
+    Şifreler ve normal biçimleri saklanmaz: tekrar ve varyant için anahtarlı
+    özetler, yakın kopya için anahtarlı 3-gram hash dizileri tutulur.
+    """
+
+    def __init__(self, key=None, num_perm=24, bands=12, max_distance=1,
+                 shingle=3, max_bucket_pairs=32, seed=1):
+        if num_perm % bands:
+            raise ValueError("num_perm, bands değerine tam bölünmeli")
+        self.key = key if key is not None else os.urandom(32)
+        self.num_perm = num_perm
+        self.bands = bands
+        self.rows = num_perm // bands
+        self.max_distance = max_distance
+        self.shingle = shingle
+        self.max_bucket_pairs = max_bucket_pairs
+        # Çarp-kaydır (multiply-shift) hash aileleri için tek sayılı katsayılar;
+        # 3-gram hash'leri anahtarlı BLAKE2b ile üretilir
+        rng = hashlib.blake2b(seed.to_bytes(8, "little"), digest_size=64).digest()
+        coeffs = []
+        while len(coeffs) < 2 * num_perm:
+            rng = hashlib.blake2b(rng, digest_size=64).digest()
+            coeffs.extend(int.from_bytes(rng[i:i + 8], "little") | 1 for i in range(0, 64, 8))
+        self._perms = list(zip(coeffs[:num_perm], coeffs[num_perm:2 * num_perm]))
+
+        self.ids = []
+        self._uf = _UnionFind()
+        self._kinds = {}                # kök -> bağlantı türleri kümesi
+        self._by_digest = {}            # özet -> ilk girdi konumu
+        self._by_form = {}              # normal biçim özeti -> ilk girdi konumu
+        self._sketches = {}             # konum -> (uzunluk, anahtarlı 3-gram hash'leri)
+        self._buckets = [{} for _ in range(bands)]   # bant anahtarı -> konumlar
+        self.exact_duplicates = 0
+
+    def _digest(self, password, person=b"exact"):
+        return hashlib.blake2b(password.encode("utf-8", "surrogateescape"),
+                               key=self.key, person=person, digest_size=16).digest()
+
+    def _link(self, a, b, kind):
+        uf = self._uf
+        ra, rb = uf.find(a), uf.find(b)
+        kinds = self._kinds.pop(ra, set())
+        if rb != ra:
+            kinds |= self._kinds.pop(rb, set())
+        kinds.add(kind)
+        self._kinds[uf.union(ra, rb)] = kinds
+
+    def signature(self, form):
+        """Normal biçimin MinHash imzası (num_perm adet 32 bit değer)."""
+        return self._sketch(form)[1]
+
+    def _sketch(self, form):
+        """
+        (sıralı anahtarlı 3-gram hash'leri, MinHash imzası). Dizi, kenardaki
+        düzenlemeler de görülsün diye iki yanı `shingle` dolgu karakteriyle
+        uzatılmış biçimden; imza yalnızca biçimin kendi 3-gramlarından üretilir.
+        """
+        size = self.shingle
+        padded = _PAD * size + form + _PAD * size
+        shingles = [padded[i:i + size] for i in range(len(padded) - size + 1)]
+        keyed = {}
+        for shingle in shingles:
+            if shingle not in keyed:
+                keyed[shingle] = self._shingle_hash(shingle)
+        if len(form) <= size:
+            inner = [self._shingle_hash(form)]
+        else:
+            inner = [keyed[form[i:i + size]] for i in range(len(form) - size + 1)]
+        return ([keyed[shingle] for shingle in shingles],
+                [min(((a * h + b) & _MASK64) >> 32 for h in inner) for a, b in self._perms])
+
+    def _shingle_hash(self, shingle):
+        digest = hashlib.blake2b(shingle.encode("utf-8", "surrogateescape"), key=self.key,
+                                 person=b"shingle", digest_size=4).digest()
+        return int.from_bytes(digest, "little")
+
+    def _is_near(self, sketch, other):
+        """
+        İki biçim en fazla max_distance düzenleme uzaklığında mı?
+        Sıralı anahtarlı 3-gram dizilerinin ortak önek ve sonekinden, baştan
+        ve sondan birebir eşleşen karakter sayısı bulunur; geri kalan en fazla
+        max_distance karakterlik tek bir bölgeyse bağlanır. max_distance = 1
+        için Levenshtein ile aynıdır (hash çakışması hariç); daha büyük
+        değerlerde yalnızca bitişik düzenlemeler bulunur.
+        """
+        length, hashes = sketch
+        other_length, other_hashes = other
+        limit = self.max_distance
+        if abs(length - other_length) > limit:
+            return False
+        count = min(len(hashes), len(other_hashes))
+        prefix = 0
+        while prefix < count and hashes[prefix] == other_hashes[prefix]:
+            prefix += 1
+        suffix = 0
+        while suffix < count - prefix and hashes[-1 - suffix] == other_hashes[-1 - suffix]:
+            suffix += 1
+        # n ortak 3-gram, dolgu dahil n + shingle - 1 ortak karakter demektir;
+        # dolgu her iki yanda en az bir 3-gramı her zaman eşleştirir
+        extra = self.shingle - 1
+        matched = prefix + suffix + 2 * extra - 2 * self.shingle
+        return matched >= max(length, other_length) - limit
+
+    def add(self, item_id, password):
+        """Şifreyi ekler; girdinin iç konumunu döner."""
+        index = self._uf.add()
+        self.ids.append(item_id)
+
+        digest = self._digest(password)
+        first = self._by_digest.get(digest)
+        if first is not None:
+            self.exact_duplicates += 1
+            self._link(first, index, "exact")
+            return index
+        self._by_digest[digest] = index
+
+        form = normalize(password)
+        form_digest = self._digest(form, b"variant")
+        first = self._by_form.get(form_digest)
+        if first is not None:
+            self._link(first, index, "variant")
+            return index
+        self._by_form[form_digest] = index
+
+        # Yeni normal biçim: LSH kovalarındaki adaylarla karşılaştır
+        hashes, signature = self._sketch(form)
+        rows = self.rows
+        candidates = set()
+        for band, buckets in enumerate(self._buckets):
+            key = tuple(signature[band * rows:(band + 1) * rows])
+            bucket = buckets.get(key)
+            if bucket is None:
+                buckets[key] = [index]
+                continue
+            # Kova başına en son max_bucket_pairs üye ile karşılaştırılır
+            candidates.update(bucket)
+            bucket.append(index)
+            if len(bucket) > self.max_bucket_pairs:
+                del bucket[0]
+        sketch = (len(form), array("I", hashes))
+        self._sketches[index] = sketch
+        sketches = self._sketches
+        find = self._uf.find
+        for other in candidates:
+            if find(other) == find(index):
+                continue
+            if self._is_near(sketch, sketches[other]):
+                self._link(other, index, "near")
+        return index
+
+    def add_many(self, items):
+        """(kimlik, şifre) çiftlerini ekler; eklenen sayıyı döner."""
+        count = 0
+        add = self.add
+        for item_id, password in items:
+            add(item_id, password)
+            count += 1
+        return count
+
+    def clusters(self, min_size=2):
+        """Boyutu min_size ve üzeri kümeleri büyükten küçüğe döner."""
+        groups = {}
+        find = self._uf.find
+        for index in range(len(self.ids)):
+            groups.setdefault(find(index), []).append(index)
+        ids = self.ids
+        result = [
+            Cluster([ids[i] for i in members],
+                    [kind for kind in KINDS if kind in self._kinds.get(root, ())])
+            for root, members in groups.items() if len(members) >= min_size
+        ]
+        result.sort(key=lambda cluster: -len(cluster.ids))
+        return result
+
+    def report(self, min_size=2, top=10):
+        """Özet sözlük: girdi, benzersiz, küme sayıları ve en büyük kümeler."""
+        clusters = self.clusters(min_size)
+        by_kind = {kind: sum(1 for c in clusters if kind in c.kinds) for kind in KINDS}
+        return {
+            "entries": len(self.ids),
+            "unique": len(self._by_digest),
+            "unique_forms": len(self._by_form),
+            "exact_duplicates": self.exact_duplicates,
+            "clusters": len(clusters),
+            "clustered_entries": sum(len(c.ids) for c in clusters),
+            "clusters_by_kind": by_kind,
+            "largest": [{"size": len(c.ids), "kinds": c.kinds, "ids": c.ids[:20]}
+                        for c in clusters[:top]],
+        }
+
+
+def main(argv=None):
+    import argparse
+    import json
+
+    parser = argparse.ArgumentParser(
+        prog="python -m similarity",
+        description="Şifre listesinde tekrar kullanım ve yakın kopya kümelerini raporlar.")
+    parser.add_argument("path", help="satır başına bir şifre (satır numarası kimlik olur)")
+    parser.add_argument("--min-size", type=int, default=2)
+    parser.add_argument("--max-distance", type=int, default=1)
+    parser.add_argument("--top", type=int, default=10)
+    args = parser.parse_args(argv)
+
+    index = SimilarityIndex(max_distance=args.max_distance)
+    with open(args.path, encoding="utf-8", errors="surrogateescape") as f:
+        index.add_many((number, line.rstrip("\r\n"))
+                       for number, line in enumerate(f, 1) if line.strip())
+    json.dump(index.report(args.min_size, args.top), sys.stdout, ensure_ascii=False, indent=2)
+    sys.stdout.write("\n")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
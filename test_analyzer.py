@@ -1,5 +1,11 @@
 import unittest
 from ai_analyzer import AIAnalyzer
+from analysis_cache import AnalysisCache
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
 
 class TestAIAnalyzer(unittest.TestCase):
     def setUp(self):
@@ -10,6 +16,11 @@ class TestAIAnalyzer(unittest.TestCase):
         self.assertEqual(result['score'], 0)
         self.assertEqual(result['status'], "YOK")
 
+    def test_empty_password_metrics(self):
+        result = self.analyzer.analyze("")
+        self.assertEqual(set(result.metrics().values()), {0.0})
+        self.assertNotIn("metrics", result)
+
     def test_weak_password(self):
         result = self.analyzer.analyze("123456")
         self.assertLess(result['score'], 40)
@@ -37,5 +48,119 @@ class TestAIAnalyzer(unittest.TestCase):
         result_diff = self.analyzer.analyze("abcde")
         self.assertGreater(result_diff['entropy'], 0.0)
 
+    def test_analyze_many_matches_analyze(self):
+        passwords = ["", "123456", "Password123", "C0mplex!Passw0rd_2025", "aaaaa"]
+        batch = list(self.analyzer.analyze_many(passwords, lang="tr"))
+        single = [AIAnalyzer("tr").analyze(p) for p in passwords]
+        self.assertEqual(batch, single)
+        # Toplu analiz analizörün dilini değiştirmemeli
+        self.assertEqual(self.analyzer.lang, "en")
+
+    def test_compact_result_localizes_lazily(self):
+        import json
+        import pickle
+        result = self.analyzer.analyze("Parola12", lang="tr")
+        self.assertEqual(self.analyzer.lang, "en")
+        self.assertEqual((result.score, result.status_key, result.lang), (45, "medium", "tr"))
+        self.assertEqual(result["status"], "ORTA")
+        self.assertEqual(result.localized("de")["status"], "MITTEL")
+        self.assertEqual(result.localized("de").to_dict()["checks"], result["checks"])
+        self.assertEqual(pickle.loads(pickle.dumps(result)), result)
+        self.assertEqual(json.loads(json.dumps(result.to_dict())), result)
+        self.assertEqual(list(self.analyzer.analyze("")), ["score", "status", "suggestions", "checks"])
+
+    def test_cache_hits_and_eviction(self):
+        cache = AnalysisCache(max_entries=2)
+        analyzer = AIAnalyzer(cache=cache)
+        first = analyzer.analyze("Parola123")
+        self.assertIs(analyzer.analyze("Parola123"), first)
+        # Dil değişimi aynı kaydı kullanır, yalnızca görüntüleme dili değişir
+        self.assertEqual(analyzer.analyze("Parola123", lang="de")["status"], "MITTEL")
+        self.assertEqual(len(cache), 1)
+        analyzer.analyze("qwerty", lang="en")
+        analyzer.analyze("Summer2025!", lang="en")
+        stats = cache.stats()
+        self.assertEqual((stats["hits"], stats["misses"], stats["evictions"]), (2, 3, 1))
+        # Önbellek anahtarları düz metin içermez
+        self.assertNotIn(b"Parola123", b"".join(cache._entries))
+        key = cache.key("Parola123")
+        cache.clear()
+        self.assertEqual(len(cache), 0)
+        self.assertNotEqual(cache.key("Parola123"), key)
+
+    def test_session_uses_analyzer_cache(self):
+        cache = AnalysisCache(max_entries=16)
+        session = AIAnalyzer(cache=cache).session()
+        for text in ["P", "Pa", "Par", "Pa", "P", "Pa"]:
+            session.update(text)
+        stats = cache.stats()
+        self.assertEqual((stats["hits"], stats["misses"]), (3, 3))
+        # Önbellekten gelen sonuç oturumun dilinde görüntülenir
+        session.lang = "de"
+        result = session.update("Par")
+        self.assertEqual(cache.stats()["hits"], 4)
+        self.assertEqual(result.lang, "de")
+        self.assertEqual(result, AIAnalyzer("de").analyze("Par"))
+
+    def test_session_incremental_updates(self):
+        session = self.analyzer.session()
+        for text in ["P", "Pa", "Parola1", "Parola12", "Parola1", "Parola1!", "qwerty", "", "aaaaa"]:
+            result = session.update(text)
+            expected = self.analyzer.analyze(text)
+            self.assertEqual(result["score"], expected["score"])
+            self.assertEqual(result["checks"], expected["checks"])
+            self.assertEqual(result["suggestions"], expected["suggestions"])
+            if text:
+                self.assertAlmostEqual(result["entropy"], expected["entropy"], places=6)
+                for key, value in expected["metrics"].items():
+                    self.assertAlmostEqual(result["metrics"][key], value, places=9)
+        self.assertEqual(session.update("aaaaa")["entropy"], 0.0)
+
+    @unittest.skipUnless(numpy, "NumPy kurulu değil")
+    def test_vectorized_matches_analyze(self):
+        from vectorized import STATUS_KEYS, VectorAnalyzer
+        passwords = ["", "123456", "Password123", "C0mplex!Passw0rd_2025",
+                     "aaaaa", "Şifre_ıß٣", "ab\x00"]
+        columns = VectorAnalyzer(self.analyzer).analyze_batch(passwords)
+        for i, password in enumerate(passwords):
+            expected = self.analyzer.analyze(password)
+            self.assertEqual(columns["score"][i], expected["score"])
+            self.assertEqual(self.analyzer.texts[STATUS_KEYS[columns["status"][i]]],
+                             expected["status"])
+            for key, value in expected["checks"].items():
+                self.assertEqual(columns["check_" + key][i], value)
+            if password:
+                self.assertEqual(columns["entropy"][i], expected["entropy"])
+                for key, value in expected["metrics"].items():
+                    # Bit düzeyinde eşitlik
+                    self.assertEqual(float(columns["metric_" + key][i]).hex(), float(value).hex())
+
+    def test_unicode_character_classes(self):
+        checks = self.analyzer.analyze("ŞİFRE").get("checks")
+        self.assertTrue(checks["upper"])
+        self.assertFalse(checks["lower"])
+        checks = self.analyzer.analyze("ıslak straße ٣").get("checks")
+        self.assertEqual((checks["upper"], checks["lower"], checks["digit"], checks["special"]),
+                         (False, True, True, False))
+
+    def test_pattern_estimator(self):
+        from pattern_entropy import PatternEstimator
+        analyzer = AIAnalyzer(estimator=PatternEstimator())
+        weak = analyzer.analyze("Password2025!")
+        self.assertEqual(weak["patterns"], ["dictionary", "date", "bruteforce"])
+        self.assertLess(weak["guess_bits"], weak["entropy"])
+        self.assertLess(weak["metrics"]["entropy"], self.analyzer.analyze("Password2025!")["metrics"]["entropy"])
+        for password in ("qwertyuiop", "asdfghjklşi", "yxcvbnm"):
+            self.assertEqual(analyzer.analyze(password)["patterns"], ["keyboard"])
+        self.assertEqual(analyzer.analyze("P@ssw0rd")["patterns"], ["dictionary"])
+        self.assertEqual(analyzer.analyze("abcabcabc")["patterns"], ["repeat"])
+        # Desen içermeyen rastgele şifre kaba kuvvet olarak kalır
+        self.assertGreater(analyzer.analyze("xK9#mQ2$vL")["guess_bits"], 40)
+        self.assertNotIn("guess_bits", self.analyzer.analyze("Password2025!"))
+        # Yıl uzayı referans yılına göre ölçülür (varsayılan: bu yıl)
+        near = PatternEstimator(reference_year=2025).estimate("1990").bits
+        far = PatternEstimator(reference_year=2100).estimate("1990").bits
+        self.assertLess(near, far)
+
 if __name__ == "__main__":
     unittest.main()
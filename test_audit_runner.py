@@ -0,0 +1,75 @@
+import io
+import json
+import os
+import tempfile
+import unittest
+from ai_analyzer import AIAnalyzer
+from audit_runner import _read_span, audit_file, audit_file_jsonl, plan_chunks
+
+class TestAuditRunner(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.tmp.name, "passwords.txt")
+        self.lines = [b"qwerty", b"Summer2025!", b"", b"\xff\xfebozuk", "şifre123".encode(),
+                      b"C0mplex!Passw0rd#2025\r", b"x" * 40, b"123456"]
+        with open(self.path, "wb") as f:
+            # Son satırda satır sonu yok
+            f.write(b"\n".join(self.lines))
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def expected_texts(self):
+        # (bayt konumu, şifre); boş satırlar atlanır
+        texts, pos = [], 0
+        for line in self.lines:
+            text = line.rstrip(b"\r")
+            if text:
+                texts.append((pos, text.decode("utf-8", "surrogateescape")))
+            pos += len(line) + 1
+        return texts
+
+    def expected(self):
+        analyzer = AIAnalyzer("en")
+        return [(offset, analyzer.analyze(text)) for offset, text in self.expected_texts()]
+
+    def test_plan_chunks_align_to_lines(self):
+        size = os.path.getsize(self.path)
+        for chunk_bytes in (1, 7, 16, size, size * 2):
+            spans = plan_chunks(self.path, chunk_bytes)
+            self.assertEqual(spans[0][0], 0)
+            self.assertEqual(spans[-1][1], size)
+            with open(self.path, "rb") as f:
+                data = f.read()
+            for (_, end), (start, _) in zip(spans, spans[1:]):
+                self.assertEqual(end, start)
+                # Her parça bir satır sonundan hemen sonra başlar
+                self.assertEqual(data[start - 1:start], b"\n")
+        self.assertEqual(plan_chunks(self.path, size * 2), [(0, size)])
+
+    def test_read_span_keeps_lines_whole(self):
+        passwords = []
+        for span in plan_chunks(self.path, 5):
+            passwords += _read_span(self.path, span)[1]
+        self.assertEqual(passwords, [text for _, text in self.expected_texts()])
+        # Geçersiz UTF-8 kaybolmadan surrogateescape ile korunur
+        self.assertIn(b"\xff\xfebozuk", [p.encode("utf-8", "surrogateescape") for p in passwords])
+        self.assertEqual(passwords[-1], "123456")
+
+    def test_ordered_and_unordered_match_analyze(self):
+        expected = self.expected()
+        ordered = list(audit_file(self.path, workers=2, chunk_bytes=16))
+        self.assertEqual(ordered, expected)
+        unordered = list(audit_file(self.path, workers=2, chunk_bytes=16, ordered=False))
+        self.assertEqual(sorted(unordered, key=lambda item: item[0]), expected)
+
+    def test_jsonl_output(self):
+        out = io.BytesIO()
+        audit_file_jsonl(self.path, out, workers=1, chunk_bytes=16)
+        records = [json.loads(line) for line in out.getvalue().decode("utf-8").splitlines()]
+        expected = self.expected()
+        self.assertEqual([r["offset"] for r in records], [offset for offset, _ in expected])
+        self.assertEqual([r["score"] for r in records], [r["score"] for _, r in expected])
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,83 @@
+import os
+import tempfile
+import unittest
+from ai_analyzer import AIAnalyzer
+from blocklist import (FilteredBlocklist, MemoryBlocklist, build_filter,
+                       build_index, open_blocklist)
+
+class TestBlocklist(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.wordlist = os.path.join(self.tmp.name, "words.txt")
+        self.index = os.path.join(self.tmp.name, "words.idx")
+        with open(self.wordlist, "w", encoding="utf-8") as f:
+            f.write("Summer2025\nqwerty\nşifre123\nqwerty\n\n")
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def test_memory_blocklist(self):
+        blocklist = MemoryBlocklist(["Password"])
+        self.assertIn("PASSWORD", blocklist)
+        self.assertNotIn("password1", blocklist)
+
+    def test_build_and_lookup(self):
+        # Küçük parça boyutu harici sıralama birleştirmesini de sınar
+        count = build_index(self.wordlist, self.index, chunk_size=2)
+        self.assertEqual(count, 3)
+        with open_blocklist(self.index) as blocklist:
+            self.assertEqual(len(blocklist), 3)
+            self.assertIn("summer2025", blocklist)
+            self.assertIn("Şifre123", blocklist)
+            self.assertNotIn("Summer2024", blocklist)
+
+    def test_analyzer_uses_index(self):
+        build_index(self.wordlist, self.index)
+        with open_blocklist(self.index) as blocklist:
+            analyzer = AIAnalyzer(blocklist=blocklist)
+            result = analyzer.analyze("Summer2025")
+            self.assertFalse(result["checks"]["common"])
+            self.assertEqual(result["metrics"]["safety"], 0.0)
+            # Varsayılan listede olan ama dizinde olmayan şifre
+            self.assertTrue(analyzer.analyze("password")["checks"]["common"])
+
+    def test_bloom_filter_precheck(self):
+        build_index(self.wordlist, self.index)
+        build_filter(self.index, fpr=0.01)
+        with open_blocklist(self.index) as blocklist:
+            # Filtre isteğe bağlıdır
+            self.assertNotIsInstance(blocklist, FilteredBlocklist)
+        with open_blocklist(self.index, use_filter=True) as blocklist:
+            self.assertIsInstance(blocklist, FilteredBlocklist)
+            # Filtre yanlış negatif üretmemeli
+            for word in ("summer2025", "QWERTY", "şifre123"):
+                self.assertIn(word, blocklist)
+            self.assertNotIn("not-in-the-list", blocklist)
+            stats = blocklist.stats(measure_samples=2000)
+            self.assertEqual(stats["exact_hits"], 3)
+            self.assertGreater(stats["filter_bytes"], 0)
+            self.assertLess(stats["measured_fpr"], 0.1)
+
+    def test_rebuild_drops_stale_filter(self):
+        build_index(self.wordlist, self.index)
+        build_filter(self.index)
+        build_index(self.wordlist, self.index)
+        with open_blocklist(self.index, use_filter=True) as blocklist:
+            self.assertNotIsInstance(blocklist, FilteredBlocklist)
+
+    def test_mismatched_filter_is_ignored(self):
+        # Dizin build_index dışında değiştirilirse eski filtre kullanılmamalı
+        build_index(self.wordlist, self.index)
+        build_filter(self.index)
+        other_words = os.path.join(self.tmp.name, "other.txt")
+        other_index = os.path.join(self.tmp.name, "other.idx")
+        with open(other_words, "w", encoding="utf-8") as f:
+            f.write("letmein\ndragon\nmonkey\n")
+        build_index(other_words, other_index)
+        os.replace(other_index, self.index)
+        with open_blocklist(self.index, use_filter=True) as blocklist:
+            self.assertNotIsInstance(blocklist, FilteredBlocklist)
+            self.assertIn("dragon", blocklist)
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,32 @@
+import io
+import json
+import subprocess
+import sys
+import unittest
+import locksense
+
+class TestCLI(unittest.TestCase):
+    def run_cli(self, argv, stdin_text=""):
+        out = io.StringIO()
+        code = locksense.main(argv, stdin=io.StringIO(stdin_text), stdout=out)
+        return code, out.getvalue()
+
+    def test_json_output(self):
+        code, output = self.run_cli(["C0mplex!Passw0rd#2025", "123456"])
+        self.assertEqual(code, 0)
+        results = json.loads(output)
+        self.assertEqual([r["index"] for r in results], [0, 1])
+        self.assertGreater(results[0]["score"], results[1]["score"])
+
+    def test_stdin_csv_and_min_score(self):
+        code, output = self.run_cli(["--format", "csv", "--min-score", "40", "-"], "qwerty\n")
+        self.assertEqual(code, 1)
+        self.assertEqual(output.splitlines()[0].split(",")[:3], ["index", "score", "status"])
+
+    def test_does_not_import_qt(self):
+        code = "import sys, locksense; locksense.main(['x']); sys.exit('PySide6' in sys.modules)"
+        result = subprocess.run([sys.executable, "-c", code], capture_output=True)
+        self.assertEqual(result.returncode, 0)
+
+if __name__ == "__main__":
+    unittest.main()
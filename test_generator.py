@@ -0,0 +1,38 @@
+import unittest
+from ai_analyzer import AIAnalyzer
+from generator import AMBIGUOUS, PassphraseGenerator, PasswordGenerator, RandomPool
+from policy import Policy
+
+class TestGenerator(unittest.TestCase):
+    def test_policy_classes_and_exclusions(self):
+        policy = Policy({"desired_length": 20, "class_points": {"special": 0}})
+        generator = PasswordGenerator(policy, exclude_ambiguous=True, exclude="xyz")
+        passwords = generator.generate_many(2000)
+        self.assertEqual(len(passwords), 2000)
+        for password in passwords:
+            self.assertEqual(len(password), 20)
+            self.assertFalse(set(password) & set(AMBIGUOUS + "xyz"))
+            self.assertTrue(password.isalnum())
+            self.assertTrue(any(c.isupper() for c in password) and any(c.islower() for c in password)
+                            and any(c.isdigit() for c in password))
+
+    def test_min_score(self):
+        analyzer = AIAnalyzer()
+        for password in PasswordGenerator(min_score=70).generate_many(200):
+            self.assertEqual(analyzer.analyze(password)["score"], 70)
+        for phrase in PassphraseGenerator(words=4, min_score=70).generate_many(200):
+            self.assertEqual(len(phrase.split("-")), 4)
+            self.assertGreaterEqual(analyzer.analyze(phrase)["score"], 70)
+        with self.assertRaises(ValueError):
+            PasswordGenerator(length=8, min_score=70)
+        with self.assertRaises(ValueError):
+            PassphraseGenerator(capitalize=False, suffix=False, min_score=70).generate()
+
+    def test_unbiased_indices(self):
+        values = RandomPool().indices(3, 30000)
+        self.assertEqual(set(values), {0, 1, 2})
+        for value in range(3):
+            self.assertAlmostEqual(values.count(value) / 30000, 1 / 3, delta=0.02)
+
+if __name__ == "__main__":
+    unittest.main()
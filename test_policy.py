@@ -0,0 +1,78 @@
+import os
+import tempfile
+import unittest
+from ai_analyzer import AIAnalyzer
+from policy import Policy, PolicySet, load_policies, load_policy
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+POLICIES_TOML = """
+[[policy]]
+name = "banka"
+min_length = 12
+desired_length = 16
+strong_threshold = 60
+
+[policy.class_points]
+special = 20
+
+[[policy]]
+name = "gevsek"
+min_length = 6
+common_penalty = 0
+"""
+
+class TestPolicy(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.tmp.name, "policies.toml")
+        with open(self.path, "w", encoding="utf-8") as f:
+            f.write(POLICIES_TOML)
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def test_default_policy_matches_constants(self):
+        self.assertEqual(Policy().evaluate(12, 15, False), (70, "medium", 0))
+        self.assertEqual(Policy().evaluate(9, 3, True), (0, "weak", 1 | 16 | 32 | 64))
+
+    def test_load_and_evaluate(self):
+        bank, loose = load_policies(self.path)
+        self.assertEqual((bank.min_length, bank.class_points["special"], bank.class_points["upper"]),
+                         (12, 20, 10))
+        self.assertIs(load_policy(self.path, "gevsek").common_penalty, 0)
+        with self.assertRaises(ValueError):
+            load_policy(self.path)
+        with self.assertRaises(ValueError):
+            Policy({"min_lenght": 4})
+
+        result = AIAnalyzer(policy=bank).analyze("Parola_2025!")
+        self.assertEqual(result["score"], 15 + 40 + 10)
+        self.assertEqual(result["status"], "STRONG")
+        self.assertFalse(AIAnalyzer(policy=bank).analyze("Parola_25!")["checks"]["length"])
+
+    def test_policy_set_matches_analyzers(self):
+        policies = load_policies(self.path) + [Policy()]
+        passwords = ["", "123456", "Parola_2025!", "qwerty", "Şifre123", "abc"]
+        rows = list(PolicySet(policies).score_many(passwords))
+        for i, policy in enumerate(policies):
+            analyzer = AIAnalyzer(policy=policy)
+            for password, row in zip(passwords, rows):
+                self.assertEqual(row[i][0], analyzer.analyze(password)["score"])
+
+    @unittest.skipUnless(numpy, "NumPy kurulu değil")
+    def test_vectorized_respects_policy(self):
+        from vectorized import VectorAnalyzer
+        analyzer = AIAnalyzer(policy=load_policy(self.path, "banka"))
+        passwords = ["123456", "Parola_2025!", "Uzun_Parola_2025!", "qwerty"]
+        columns = VectorAnalyzer(analyzer).analyze_batch(passwords)
+        self.assertEqual(columns["score"].tolist(),
+                         [analyzer.analyze(p)["score"] for p in passwords])
+        self.assertEqual(columns["check_length"].tolist(),
+                         [analyzer.analyze(p)["checks"]["length"] for p in passwords])
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,84 @@
+import csv
+import json
+import os
+import tempfile
+import unittest
+from ai_analyzer import AIAnalyzer
+from report_pipeline import parquet_parts, run_pipeline
+
+class _Interrupted(Exception):
+    pass
+
+class _InterruptingAnalyzer(AIAnalyzer):
+    """limit kayıttan sonra kesinti benzetimi yapar."""
+
+    def __init__(self, limit):
+        super().__init__("en")
+        self.limit = limit
+
+    def analyze_many(self, passwords, lang=None, use_cache=False):
+        for i, result in enumerate(super().analyze_many(passwords, lang, use_cache)):
+            if i == self.limit:
+                raise _Interrupted
+            yield result
+
+class TestReportPipeline(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.input = os.path.join(self.tmp.name, "dump.txt")
+        with open(self.input, "w", encoding="utf-8") as f:
+            f.write("\n".join(f"Parola{i}!" for i in range(50)) + "\n\nqwerty\n")
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def path(self, name):
+        return os.path.join(self.tmp.name, name)
+
+    def interrupted_run(self, output, fmt, limit=20):
+        with self.assertRaises(_Interrupted):
+            run_pipeline(self.input, output, fmt, analyzer=_InterruptingAnalyzer(limit))
+
+    def test_jsonl_resume_drops_partial_line(self):
+        full, resumed = self.path("full.jsonl"), self.path("resumed.jsonl")
+        self.assertEqual(run_pipeline(self.input, full), 51)
+        self.interrupted_run(resumed, "jsonl")
+        with open(resumed, "a", encoding="utf-8") as f:
+            f.write('{"offset": 999, "sco')
+        self.assertEqual(run_pipeline(self.input, resumed, resume=True), 31)
+        with open(full, encoding="utf-8") as a, open(resumed, encoding="utf-8") as b:
+            self.assertEqual(a.read(), b.read())
+
+    def test_csv_resume(self):
+        full, resumed = self.path("full.csv"), self.path("resumed.csv")
+        run_pipeline(self.input, full, "csv")
+        self.interrupted_run(resumed, "csv")
+        with open(resumed, "a", encoding="utf-8") as f:
+            f.write("123,4")
+        run_pipeline(self.input, resumed, "csv", resume=True)
+        with open(full, encoding="utf-8") as a, open(resumed, encoding="utf-8") as b:
+            rows = list(csv.reader(b))
+            self.assertEqual(list(csv.reader(a)), rows)
+        self.assertEqual(rows[0][0], "offset")
+
+    def test_parquet_resume_writes_parts(self):
+        try:
+            import pyarrow.parquet as pq
+        except ImportError:
+            self.skipTest("pyarrow kurulu değil")
+        full, resumed = self.path("full.parquet"), self.path("resumed.parquet")
+        run_pipeline(self.input, full, "parquet")
+        self.interrupted_run(resumed, "parquet")
+        # Alt bilgisi yazılamamış (sert kesinti) parça silinmeli
+        with open(self.path("resumed.12345.parquet"), "wb") as f:
+            f.write(b"PAR1\x00\x00")
+        self.assertEqual(run_pipeline(self.input, resumed, "parquet", resume=True), 31)
+        parts = parquet_parts(resumed)
+        self.assertEqual(len(parts), 2)
+        self.assertEqual(pq.read_table(parts).to_pylist(), pq.read_table(full).to_pylist())
+        # Devam etmeyen yeni çalıştırma eski parçaları temizler
+        run_pipeline(self.input, resumed, "parquet")
+        self.assertEqual(parquet_parts(resumed), [resumed])
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,93 @@
+import asyncio
+import json
+import os
+import socket
+import tempfile
+import unittest
+from ai_analyzer import AIAnalyzer
+from service import ScoringService
+
+def _post(body):
+    data = json.dumps(body).encode("utf-8")
+    return b"POST /analyze HTTP/1.1\r\nContent-Length: %d\r\n\r\n%s" % (len(data), data)
+
+async def _read_response(reader):
+    status = int((await reader.readline()).split()[1])
+    headers = {}
+    while (line := await reader.readline()) != b"\r\n":
+        name, _, value = line.decode().partition(":")
+        headers[name.lower()] = value.strip()
+    return status, headers, json.loads(await reader.readexactly(int(headers["content-length"])))
+
+class TestService(unittest.TestCase):
+    def test_pipelined_requests_are_batched(self):
+        async def scenario():
+            service = ScoringService()
+            server = await service.start(port=0)
+            port = server.sockets[0].getsockname()[1]
+            reader, writer = await asyncio.open_connection("127.0.0.1", port)
+            passwords = [f"Parola_{i}!" for i in range(20)] + ["qwerty"]
+            # Tek yazımda ardışık istekler + hatalı JSON + çoklu istek
+            writer.write(b"".join(_post({"password": p}) for p in passwords)
+                         + b"POST /analyze HTTP/1.1\r\nContent-Length: 3\r\n\r\n{x}"
+                         + _post({"passwords": ["a", "Bb1!"], "lang": "tr"}))
+            responses = [await _read_response(reader) for _ in range(len(passwords) + 2)]
+            writer.write(b"GET /health HTTP/1.1\r\nConnection: close\r\n\r\n")
+            responses.append(await _read_response(reader))
+            self.assertEqual(await reader.read(), b"")
+            writer.close()
+            await service.stop()
+            return passwords, responses
+
+        passwords, responses = asyncio.run(scenario())
+        analyzer = AIAnalyzer()
+        for password, (status, headers, body) in zip(passwords, responses):
+            self.assertEqual((status, headers["connection"]), (200, "keep-alive"))
+            self.assertEqual(body, analyzer.analyze(password))
+        self.assertEqual(responses[-3][0], 400)
+        self.assertEqual(responses[-2][2], list(AIAnalyzer().analyze_many(["a", "Bb1!"], "tr")))
+        status, headers, health = responses[-1]
+        self.assertEqual(headers["connection"], "close")
+        self.assertEqual(health["requests"], len(passwords) + 2)
+        self.assertLess(health["batches"], health["requests"])
+
+    async def _unix_request(self, path):
+        service = ScoringService()
+        await service.start(path=path)
+        self.assertEqual(os.stat(path).st_mode & 0o777, 0o600)
+        reader, writer = await asyncio.open_unix_connection(path)
+        writer.write(_post({"password": "qwerty"}))
+        response = await _read_response(reader)
+        writer.close()
+        await service.stop()
+        return response
+
+    def test_unix_socket(self):
+        umask = os.umask(0o022)
+        os.umask(umask)
+        with tempfile.TemporaryDirectory() as tmp:
+            status, _, body = asyncio.run(self._unix_request(os.path.join(tmp, "ls.sock")))
+        # Süreç umask'ı değişmeden kalır
+        self.assertEqual(os.umask(umask), umask)
+        self.assertEqual(status, 200)
+        self.assertFalse(body["checks"]["common"])
+
+    def test_unix_path_only_replaces_sockets(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, "ls.sock")
+            with open(path, "w") as handle:
+                handle.write("veri")
+            with self.assertRaises(FileExistsError):
+                asyncio.run(ScoringService().start(path=path))
+            with open(path) as handle:
+                self.assertEqual(handle.read(), "veri")
+            # Eski (bağlı kalmış) soket dosyası ise yenisiyle değiştirilir
+            os.unlink(path)
+            stale = socket.socket(socket.AF_UNIX)
+            stale.bind(path)
+            stale.close()
+            _, _, body = asyncio.run(self._unix_request(path))
+            self.assertFalse(body["checks"]["common"])
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,40 @@
+import unittest
+from similarity import SimilarityIndex, bounded_levenshtein, normalize
+
+class TestSimilarity(unittest.TestCase):
+    def test_normalize_and_distance(self):
+        self.assertEqual(normalize("Summer2024!"), normalize("summer2025!"))
+        self.assertEqual(normalize("P@ssw0rd"), normalize("password"))
+        self.assertEqual(bounded_levenshtein("kitten", "sitting", 3), 3)
+        self.assertEqual(bounded_levenshtein("kitten", "sitting", 1), 2)
+
+    def test_clusters(self):
+        index = SimilarityIndex(key=b"k" * 32)
+        index.add_many([
+            (1, "Summer2024!"), (2, "Summer2025!"),
+            (3, "Kırmızı_Kalem"), (4, "Kırmızı_Kalem"),
+            (5, "correct horse battery"), (6, "correct horse batery"),
+            (7, "tamamen_farklı_bir_şey"),
+        ])
+        clusters = {tuple(sorted(c.ids)): c.kinds for c in index.clusters()}
+        self.assertEqual(clusters, {(1, 2): ["variant"], (3, 4): ["exact"], (5, 6): ["near"]})
+        report = index.report()
+        self.assertEqual((report["entries"], report["unique"], report["exact_duplicates"]), (7, 6, 1))
+        # Normal biçimler saklanmaz: yalnızca özetler, konumlar ve anahtarlı hash'ler
+        self.assertTrue(all(isinstance(key, bytes) for key in index._by_form))
+        for buckets in index._buckets:
+            self.assertTrue(all(isinstance(i, int) for bucket in buckets.values() for i in bucket))
+
+    def test_near_matches_edit_distance(self):
+        index = SimilarityIndex(key=b"k" * 32)
+        # Kenardaki düzenlemeler de bulunur
+        index.add_many([(1, "correct horse battery"), (2, "xorrect horse battery"),
+                        (3, "correct horse batterz"), (4, "cxrrect horse batterz")])
+        self.assertEqual([sorted(c.ids) for c in index.clusters()], [[1, 2, 3, 4]])
+        # İç konumlar 0 ve 3: iki düzenleme uzaklığında, doğrudan bağlanmaz
+        sketches = index._sketches
+        self.assertFalse(index._is_near(sketches[0], sketches[3]))
+        self.assertTrue(index._is_near(sketches[2], sketches[3]))
+
+if __name__ == "__main__":
+    unittest.main()
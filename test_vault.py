@@ -0,0 +1,143 @@
+import base64
+import os
+import sqlite3
+import tempfile
+import unittest
+from unittest import mock
+import vault_crypto
+from policy import Policy
+from ai_analyzer import AIAnalyzer
+from vault import PasswordVault
+from vault_audit import VaultAuditor
+
+class TestVault(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.tmp.name, "vault.db")
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def test_add_many_and_iterate(self):
+        entries = [(f"site{i}", f"user{i}", f"Şifre_{i}") for i in range(2500)]
+        with PasswordVault(self.path) as vault:
+            vault.add_password("mail", "ali", "parola")
+            self.assertEqual(vault.add_many(entries), 2500)
+            rows = vault.get_passwords()
+            self.assertNotIsInstance(rows, list)
+            self.assertEqual(list(rows), [("mail", "ali", "parola")] + entries)
+        # Kalıcı: yeniden açınca aynı veriler
+        with PasswordVault(self.path) as vault:
+            self.assertEqual(len(vault), 2501)
+
+    def test_add_many_is_atomic(self):
+        with PasswordVault(self.path) as vault:
+            with self.assertRaises(Exception):
+                vault.add_many([("a", "b", "c"), (None, "x", "y")])
+            self.assertEqual(len(vault), 0)
+
+    def test_search_and_pagination(self):
+        entries = [(f"Site{i % 40}.com", f"user{i}", f"p{i}") for i in range(800)]
+        with PasswordVault(self.path) as vault:
+            vault.add_many(entries)
+            page = vault.search("site7.COM")
+            self.assertEqual(len(page.entries), 20)
+            self.assertEqual({e.password for e in page.entries},
+                             {f"p{i}" for i in range(7, 800, 40)})
+
+            seen, cursor = [], None
+            while True:
+                page = vault.search("site1", mode="prefix", limit=9, cursor=cursor)
+                seen.extend(page.entries)
+                cursor = page.cursor
+                if cursor is None:
+                    break
+            self.assertEqual(len(seen), 11 * 20)
+            self.assertEqual(len({e.id for e in seen}), len(seen))
+
+            self.assertEqual(len(vault.search("r79", field="username", mode="fuzzy", limit=100).entries), 11)
+            self.assertEqual(len(vault.search("%", mode="fuzzy").entries), 0)
+
+    def test_migrates_existing_database(self):
+        conn = sqlite3.connect(self.path)
+        conn.execute("CREATE TABLE vault (id INTEGER PRIMARY KEY AUTOINCREMENT, "
+                     "service TEXT NOT NULL, username TEXT, password TEXT NOT NULL)")
+        conn.execute("INSERT INTO vault (service, username, password) VALUES (?, ?, ?)",
+                     ("github", "ali", base64.b64encode(b"gizli").decode()))
+        conn.commit()
+        conn.close()
+        with PasswordVault(self.path) as vault:
+            version = vault._conn.execute("PRAGMA user_version").fetchone()[0]
+            self.assertEqual(version, PasswordVault.SCHEMA_VERSION)
+            self.assertEqual(vault.search("git", mode="prefix").entries[0].password, "gizli")
+            self.assertEqual(vault.search("thu", mode="fuzzy").entries[0].username, "ali")
+
+    @unittest.skipUnless(vault_crypto.AESGCM, "cryptography kurulu değil")
+    def test_encryption_and_unlock(self):
+        # Testlerde düşük KDF maliyeti
+        with mock.patch.dict(vault_crypto.KDF_PARAMS, n=2 ** 10):
+            with PasswordVault(self.path) as vault:
+                vault.add_password("eski", "ali", "düz")
+                self.assertFalse(vault.is_encrypted)
+                vault.unlock("ana-parola")
+                self.assertTrue(vault.is_encrypted)
+                vault.add_many([("github", "ali", "gizli"), ("mail", None, "ş1fre")])
+                vault.decrypt_workers = 4
+                vault.add_many([(f"s{i}", "u", f"p{i}") for i in range(50)])
+                self.assertEqual([row[2] for row in vault.get_passwords()][3:],
+                                 [f"p{i}" for i in range(50)])
+                stored = [row[0] for row in vault._conn.execute("SELECT password FROM vault")]
+                self.assertTrue(all(value.startswith("v1:") for value in stored))
+                # Satırlar arasında şifreli değer taşınamaz (AAD)
+                with vault._conn:
+                    vault._conn.execute("UPDATE vault SET password = ? WHERE service = 'mail'",
+                                        (stored[1],))
+
+            with PasswordVault(self.path) as vault:
+                self.assertTrue(vault.is_encrypted)
+                with self.assertRaises(PermissionError):
+                    vault.add_password("x", "y", "z")
+                with self.assertRaises(ValueError):
+                    vault.unlock("yanlış")
+                vault.unlock("ana-parola")
+                self.assertEqual(vault.search("github").entries[0].password, "gizli")
+                vault.decrypt_workers = 2
+                self.assertEqual(vault.search("e", mode="fuzzy").entries[0].password, "düz")
+                with self.assertRaises(ValueError):
+                    vault.search("mail")
+                key = vault._cipher.key
+                vault.lock()
+                self.assertTrue(key.wiped)
+
+    def test_incremental_audit(self):
+        with PasswordVault(self.path) as vault:
+            vault.add_many([("a", "u", "qwerty"), ("b", "u", "Uzun_Parola_2025!"),
+                            ("c", "u", "Uzun_Parola_2025!"), ("d", "u", "kısa")])
+            # Eksik kayıtlar anahtar kümesiyle parça parça okunur
+            self.assertEqual([[e.id for e in batch] for batch in vault.audit_batches("v", batch_size=3)],
+                             [[1, 2, 3], [4]])
+            auditor = VaultAuditor(vault)
+            report = auditor.run()
+            self.assertEqual((report["total"], report["rescored"]), (4, 4))
+            self.assertEqual(report["breached_ids"], [1])
+            self.assertEqual(report["weak_ids"], [1, 4])
+            self.assertEqual((report["reused_groups"], report["reused_ids"]), (1, [2, 3]))
+
+            # Değişiklik yoksa hiçbir satır yeniden puanlanmaz
+            self.assertEqual(auditor.run()["rescored"], 0)
+            vault.add_password("e", "u", "qwerty")
+            with vault._conn:
+                vault._conn.execute("UPDATE vault SET password = ? WHERE id = 3",
+                                    (vault._encode("c", "u", "Baska_Parola_99"),))
+                vault._conn.execute("DELETE FROM vault WHERE id = 4")
+            report = auditor.run()
+            self.assertEqual((report["total"], report["rescored"]), (4, 2))
+            self.assertEqual(report["reused_ids"], [1, 5])
+
+            # Politika değişince kayıtlar eski sürüm sayılır
+            strict = VaultAuditor(vault, AIAnalyzer(policy=Policy({"min_length": 20, "desired_length": 24})))
+            self.assertEqual(strict.run()["rescored"], 4)
+            self.assertEqual(strict.run()["rescored"], 0)
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,166 @@
+"""
+LockSense tema ve stil motoru.
+
+Her tema için tüm stil sayfaları (stylesheet) bir kez üretilir ve
+önbellekte tutulur; arayüz her tuş vuruşunda metin birleştirmek yerine
+hazır dizgeleri kullanır. StyleCache ise bir widget'a en son uygulanan
+stili hatırlar ve aynı stil tekrar geldiğinde setStyleSheet çağrısını
+(Qt'nin stil ayrıştırma ve yeniden polish maliyetini) atlar.
+"""
+
+# Durum renkleri (update_ui)
+STATUS_COLORS = {
+    "weak": "#ef4444",     # Weak Red
+    "medium": "#eab308",   # Medium Yellow
+    "strong": "#22c55e",   # Strong Green
+    "empty": "#64748b",
+}
+
+PALETTES = {
+    True: {
+        "bg_color": "#0f172a",
+        "card_bg": "#1e293b",
+        "border_color": "#334155",
+        "text_main": "#f8fafc",
+        "text_sub": "#94a3b8",
+        "input_focus": "#38bdf8",
+        "req_pending": "#555",
+        "req_text_active": "#eee",
+        "req_text_inactive": "#777",
+    },
+    False: {
+        "bg_color": "#f8fafc",
+        "card_bg": "#ffffff",
+        "border_color": "#e2e8f0",
+        "text_main": "#0f172a",
+        "text_sub": "#64748b",
+        "input_focus": "#0284c7",
+        "req_pending": "#cbd5e1",
+        "req_text_active": "#334155",
+        "req_text_inactive": "#94a3b8",
+    },
+}
+
+REQ_SUCCESS_COLOR = "#2ecc71"
+
+
+class ThemeStyles:
+    """Bir tema için önceden derlenmiş stil sayfaları."""
+
+    def __init__(self, is_dark):
+        p = PALETTES[is_dark]
+        self.is_dark = is_dark
+        self.window = f"background-color: {p['bg_color']};"
+        self.container = self.window
+        self.title = f"color: {p['text_main']}; letter-spacing: 2px;"
+        self.subtitle = f"color: {p['text_sub']}; letter-spacing: 4px;"
+        self.password_input = f"""
+            QLineEdit {{
+                background-color: {p['card_bg']};
+                border: 2px solid {p['border_color']};
+                border-radius: 12px;
+                padding: 0 15px;
+                color: {p['text_main']};
+                font-size: 18px;
+            }}
+            QLineEdit:focus {{ border-color: {p['input_focus']}; }}
+        """
+        btn_style = f"color: {p['input_focus']}; background: transparent; border: none; font-weight: bold;"
+        self.btn_toggle = btn_style
+        self.btn_generate = btn_style.replace(p['input_focus'], p['text_sub'])
+        self.btn_theme = f"""
+            QPushButton {{
+                background-color: {p['card_bg']};
+                color: {p['text_main']};
+                border: 1px solid {p['border_color']};
+                border-radius: 6px;
+                font-size: 11px;
+            }}
+            QPushButton:hover {{ background-color: {p['border_color']}; }}
+        """
+        self.progress_bar = f"""
+            QProgressBar {{ background-color: {p['card_bg']}; border-radius: 3px; border: none; }}
+            QProgressBar::chunk {{ border-radius: 3px; }}
+        """
+        self.checks_frame = f"background-color: {p['card_bg']}; border-radius: 12px; border: 1px solid {p['border_color']};"
+        self.btn_copy = f"""
+            QPushButton {{
+                background-color: {p['text_main']};
+                color: {p['bg_color']};
+                border-radius: 8px;
+                font-weight: bold;
+            }}
+            QPushButton:hover {{ opacity: 0.8; }}
+        """
+        self.entropy_label = f"color: {p['text_sub']}; font-size: 11px;"
+
+        # Gereksinim öğeleri: (ikon stili, metin stili) işaretli / işaretsiz
+        self.requirement = {
+            True: (f"color: {REQ_SUCCESS_COLOR}; font-weight: bold;",
+                   f"color: {p['req_text_active']}; font-size: 13px;"),
+            False: (f"color: {p['req_pending']}; font-weight: bold;",
+                    f"color: {p['req_text_inactive']}; font-size: 13px;"),
+        }
+
+        # Durum etiketi ve ilerleme çubuğu, durum rengine göre
+        self.status_label = {
+            color: f"color: {color}; font-weight: bold; font-size: 14px;"
+            for color in STATUS_COLORS.values()
+        }
+        self.progress_status = {
+            color: f"""
+            QProgressBar {{
+                background-color: #1e293b;
+                border-radius: 3px;
+                border: none;
+            }}
+            QProgressBar::chunk {{
+                background-color: {color};
+                border-radius: 3px;
+            }}
+        """
+            for color in STATUS_COLORS.values()
+        }
+
+
+_STYLES = {}
+
+
+def get_styles(is_dark):
+    """Tema için derlenmiş stilleri döner (ilk çağrıda üretilir)."""
+    styles = _STYLES.get(is_dark)
+    if styles is None:
+        styles = _STYLES[is_dark] = ThemeStyles(is_dark)
+    return styles
+
+
+def status_color(score, is_empty, medium=40, strong=75):
+    """Puan için durum rengini döner (eşikler politikadan verilebilir)."""
+    if is_empty:
+        return STATUS_COLORS["empty"]
+    if score >= strong:
+        return STATUS_COLORS["strong"]
+    if score >= medium:
+        return STATUS_COLORS["medium"]
+    return STATUS_COLORS["weak"]
+
+
+class StyleCache:
+    """
+    Widget başına en son uygulanan stil sayfasını tutar; değişmeyen
+    stiller için setStyleSheet çağrılmaz.
+    """
+
+    def __init__(self):
+        self._applied = {}
+
+    def apply(self, widget, sheet):
+        key = id(widget)
+        if self._applied.get(key) is sheet:
+            return False
+        widget.setStyleSheet(sheet)
+        self._applied[key] = sheet
+        return True
+
+    def invalidate(self):
+        self._applied.clear()
@@ -1,6 +1,5 @@
 import sys
-import secrets
-import string
+import time
 from PySide6.QtWidgets import (QApplication, QMainWindow, QWidget, QVBoxLayout, 
                              QHBoxLayout, QLineEdit, QPushButton, QLabel, 
                              QProgressBar, QFrame, QScrollArea)
@@ -8,8 +7,13 @@ from PySide6.QtCore import Qt, QSize, QPropertyAnimation, QEasingCurve, QTimer
 from PySide6.QtGui import QFont, QColor, QPalette, QIcon, QClipboard
 
 from ai_analyzer import AIAnalyzer
+from analysis_cache import AnalysisCache
+from analysis_scheduler import AnalysisScheduler
+from generator import PasswordGenerator
+from pattern_entropy import PatternEstimator
 from ui_components import RadarChartWidget
 from translations import TRANSLATIONS
+from theme import StyleCache, get_styles, status_color
 
 
 class RequirementItem(QFrame):
@@ -31,22 +35,18 @@ class RequirementItem(QFrame):
         layout.addStretch()
         
         self.setStyleSheet("border: none;")
+        self._state = None
 
     def set_state(self, checked: bool, is_dark: bool):
-        # Renkleri temaya göre belirle
-        success_color = "#2ecc71"
-        pending_color = "#555" if is_dark else "#cbd5e1"
-        text_active = "#eee" if is_dark else "#334155"
-        text_inactive = "#777" if is_dark else "#94a3b8"
+        # Durum değişmediyse stil sayfaları yeniden uygulanmaz
+        if self._state == (checked, is_dark):
+            return
+        self._state = (checked, is_dark)
 
-        if checked:
-            self.icon_label.setText("●")
-            self.icon_label.setStyleSheet(f"color: {success_color}; font-weight: bold;")
-            self.text_label.setStyleSheet(f"color: {text_active}; font-size: 13px;")
-        else:
-            self.icon_label.setText("○")
-            self.icon_label.setStyleSheet(f"color: {pending_color}; font-weight: bold;")
-            self.text_label.setStyleSheet(f"color: {text_inactive}; font-size: 13px;")
+        icon_style, text_style = get_styles(is_dark).requirement[checked]
+        self.icon_label.setText("●" if checked else "○")
+        self.icon_label.setStyleSheet(icon_style)
+        self.text_label.setStyleSheet(text_style)
 
 class LockSenseUI(QMainWindow):
     """
@@ -58,8 +58,20 @@ class LockSenseUI(QMainWindow):
         super().__init__()
         self.lang = lang
         self.texts = TRANSLATIONS[lang]
-        self.analyzer = AIAnalyzer(lang)
+        # Geri silme/yeniden yazma ve tema değişiminde tekrar analiz önbellekten gelir
+        # Radar entropisi desen farkındalıklı tahminle sınırlanır (Password2025! gibi)
+        self.analyzer = AIAnalyzer(lang, cache=AnalysisCache(max_entries=512),
+                                   estimator=PatternEstimator())
+        # Tuş vuruşlarında artımlı analiz (sona ekleme/silme O(1))
+        self.session = self.analyzer.session()
+        # Analiz işçi iş parçacığında; yalnızca en güncel sonuç arayüze uygulanır
+        self.scheduler = AnalysisScheduler(self.session, parent=self)
+        self.scheduler.result_ready.connect(self.apply_result)
+        # Üretilen şifreler analizör politikasının tüm sınıflarını içerir
+        self.generator = PasswordGenerator(self.analyzer.policy)
         self.is_dark = True
+        # Widget başına son uygulanan stil (değişmeyen stiller atlanır)
+        self.styles = StyleCache()
         self.init_ui()
         
     def init_ui(self):
@@ -153,6 +165,10 @@ class LockSenseUI(QMainWindow):
         self.progress_bar.setValue(0)
         self.progress_bar.setTextVisible(False)
         self.progress_bar.setFixedHeight(6)
+        self.anim = QPropertyAnimation(self.progress_bar, b"value")
+        self.anim.setDuration(400)
+        self.anim.setEasingCurve(QEasingCurve.OutCubic)
+        self._progress_target = 0
         score_layout.addWidget(self.progress_bar)
         
         self.entropy_label = QLabel(f"{self.texts['entropy']}: 0.00 bits")
@@ -197,80 +213,78 @@ class LockSenseUI(QMainWindow):
         # Apply Initial Theme
         self.apply_theme()
 
+    def set_language(self, lang):
+        """
+        Arayüz dilini değiştirir. Pencere önceden (varsayılan dille) kurulup
+        dil seçildikten sonra bu yöntemle çevrilebilir.
+        """
+        if lang == self.lang:
+            return
+        self.lang = lang
+        self.texts = TRANSLATIONS[lang]
+        self.analyzer.set_language(lang)
+        self.session.lang = lang
+        self.retranslate()
+
+    def retranslate(self):
+        """Tüm widget metinlerini self.texts ile yeniden yazar."""
+        texts = self.texts
+        self.title.setText(texts["title"])
+        self.subtitle.setText(texts["subtitle"])
+        self.password_input.setPlaceholderText(texts["input_placeholder"])
+        self.btn_generate.setText(texts["generate"])
+        self.btn_toggle.setText(texts["hide"] if self.btn_toggle.isChecked() else texts["show"])
+        self.btn_copy.setText(texts["copy"])
+        self.radar_chart.labels = [
+            texts["chart_len"], texts["chart_var"],
+            texts["chart_ent"], texts["chart_uni"], texts["chart_saf"]
+        ]
+        self.radar_chart.update()
+        requirements = zip(
+            [self.req_len, self.req_up, self.req_lo, self.req_num, self.req_spec, self.req_safe],
+            ["req_len", "req_up", "req_lo", "req_num", "req_spec", "req_safe"])
+        for item, key in requirements:
+            item.text_label.setText(texts[key])
+        text = self.password_input.text()
+        if text:
+            # Durum ve entropi etiketleri yeni dilde yeniden uygulanır
+            self.scheduler.request(text, immediate=True)
+        else:
+            self.status_label.setText(texts["ready"])
+            self.entropy_label.setText(f"{texts['entropy']}: 0.00 bits")
+
     def toggle_theme(self):
         self.is_dark = not self.is_dark
         self.btn_theme.setText("Dark" if self.is_dark else "Light")
         self.apply_theme()
         # Repaint existing state
-        self.on_text_changed(self.password_input.text())
+        self.scheduler.request(self.password_input.text(), immediate=True)
 
     def apply_theme(self):
-        if self.is_dark:
-            bg_color = "#0f172a"
-            card_bg = "#1e293b"
-            border_color = "#334155"
-            text_main = "#f8fafc"
-            text_sub = "#94a3b8"
-            input_focus = "#38bdf8"
-        else:
-            bg_color = "#f8fafc"
-            card_bg = "#ffffff"
-            border_color = "#e2e8f0"
-            text_main = "#0f172a"
-            text_sub = "#64748b"
-            input_focus = "#0284c7"
+        styles = get_styles(self.is_dark)
 
-        self.setStyleSheet(f"background-color: {bg_color};")
-        self.container.setStyleSheet(f"background-color: {bg_color};")
-        
-        self.title.setStyleSheet(f"color: {text_main}; letter-spacing: 2px;")
-        self.subtitle.setStyleSheet(f"color: {text_sub}; letter-spacing: 4px;")
-        
-        self.password_input.setStyleSheet(f"""
-            QLineEdit {{
-                background-color: {card_bg};
-                border: 2px solid {border_color};
-                border-radius: 12px;
-                padding: 0 15px;
-                color: {text_main};
-                font-size: 18px;
-            }}
-            QLineEdit:focus {{ border-color: {input_focus}; }}
-        """)
-        
-        btn_style = f"color: {input_focus}; background: transparent; border: none; font-weight: bold;"
-        self.btn_toggle.setStyleSheet(btn_style)
-        self.btn_generate.setStyleSheet(btn_style.replace(input_focus, text_sub))
-        
-        self.btn_theme.setStyleSheet(f"""
-            QPushButton {{
-                background-color: {card_bg};
-                color: {text_main};
-                border: 1px solid {border_color};
-                border-radius: 6px;
-                font-size: 11px;
-            }}
-            QPushButton:hover {{ background-color: {border_color}; }}
-        """)
-        
-        self.progress_bar.setStyleSheet(f"""
-            QProgressBar {{ background-color: {card_bg}; border-radius: 3px; border: none; }}
-            QProgressBar::chunk {{ border-radius: 3px; }}
-        """)
-        
-        self.checks_frame.setStyleSheet(f"background-color: {card_bg}; border-radius: 12px; border: 1px solid {border_color};")
-        
-        self.btn_copy.setStyleSheet(f"""
-            QPushButton {{
-                background-color: {text_main};
-                color: {bg_color};
-                border-radius: 8px;
-                font-weight: bold;
-            }}
-            QPushButton:hover {{ opacity: 0.8; }}
-        """)
-        
-        self.entropy_label.setStyleSheet(f"color: {text_sub}; font-size: 11px;")
+        self.setStyleSheet(styles.window)
+        self.container.setStyleSheet(styles.container)
+        
+        self.title.setStyleSheet(styles.title)
+        self.subtitle.setStyleSheet(styles.subtitle)
+        
+        self.password_input.setStyleSheet(styles.password_input)
+        
+        self.btn_toggle.setStyleSheet(styles.btn_toggle)
+        self.btn_generate.setStyleSheet(styles.btn_generate)
+        
+        self.btn_theme.setStyleSheet(styles.btn_theme)
+        
+        # Durum stilleri değişeceği için son uygulanan durum unutulur
+        self.styles.invalidate()
+        self.progress_bar.setStyleSheet(styles.progress_bar)
+        
+        self.checks_frame.setStyleSheet(styles.checks_frame)
+        
+        self.btn_copy.setStyleSheet(styles.btn_copy)
+        
+        self.entropy_label.setStyleSheet(styles.entropy_label)
         
         self.radar_chart.set_theme(self.is_dark)
 
@@ -283,9 +297,7 @@ class LockSenseUI(QMainWindow):
             self.btn_toggle.setText(self.texts["show"])
 
     def generate_password(self):
-        alphabet = string.ascii_letters + string.digits + "!@#$%^&*"
-        pwd = ''.join(secrets.choice(alphabet) for _ in range(16))
-        self.password_input.setText(pwd)
+        self.password_input.setText(self.generator.generate())
 
     def copy_to_clipboard(self):
         cb = QApplication.clipboard()
@@ -296,50 +308,40 @@ class LockSenseUI(QMainWindow):
         QTimer.singleShot(1500, lambda: self.btn_copy.setText(old_text))
 
     def on_text_changed(self, text):
-        result = self.analyzer.analyze(text, lang=self.lang)
+        self.scheduler.request(text)
+
+    def apply_result(self, result):
+        start = time.perf_counter()
         self.update_ui(result)
+        self.scheduler.record_frame((time.perf_counter() - start) * 1000)
+
+    def closeEvent(self, event):
+        self.scheduler.shutdown()
+        super().closeEvent(event)
 
     def update_ui(self, result):
         score = result['score']
         status = result['status']
         checks = result['checks']
+        styles = get_styles(self.is_dark)
+        is_empty = not self.password_input.text()
         
         # Update labels
-        self.status_label.setText(status)
-        
-        # Color Logic
-        color = "#ef4444" # Weak Red
-        if score >= 75:
-            color = "#22c55e" # Strong Green
-        elif score >= 40:
-            color = "#eab308" # Medium Yellow
-        
-        if not self.password_input.text():
-            color = "#64748b"
-            self.status_label.setText("READY TO ANALYZE")
-            
-        self.status_label.setStyleSheet(f"color: {color}; font-weight: bold; font-size: 14px;")
-        
-        # Animate Progress Bar
-        self.anim = QPropertyAnimation(self.progress_bar, b"value")
-        self.anim.setDuration(400)
-        self.anim.setStartValue(self.progress_bar.value())
-        self.anim.setEndValue(score)
-        self.anim.setEasingCurve(QEasingCurve.OutCubic)
-        self.anim.start()
-        
-        # Update Progress Bar Color
-        self.progress_bar.setStyleSheet(f"""
-            QProgressBar {{
-                background-color: #1e293b;
-                border-radius: 3px;
-                border: none;
-            }}
-            QProgressBar::chunk {{
-                background-color: {color};
-                border-radius: 3px;
-            }}
-        """)
+        self.status_label.setText("READY TO ANALYZE" if is_empty else status)
+        
+        # Color Logic (yalnızca renk değiştiğinde yeniden stillenir)
+        policy = self.analyzer.policy
+        color = status_color(score, is_empty, policy.medium_threshold, policy.strong_threshold)
+        self.styles.apply(self.status_label, styles.status_label[color])
+        self.styles.apply(self.progress_bar, styles.progress_status[color])
+        
+        # Animate Progress Bar (hedef değişmediyse yeni animasyon yok)
+        if score != self._progress_target:
+            self._progress_target = score
+            self.anim.stop()
+            self.anim.setStartValue(self.progress_bar.value())
+            self.anim.setEndValue(score)
+            self.anim.start()
         
         # Update Checklist
         self.req_len.set_state(checks['length'], self.is_dark)
@@ -1,31 +1,64 @@
 import math
 from PySide6.QtWidgets import QWidget
-from PySide6.QtCore import Qt, QPointF, QPropertyAnimation, Property, QEasingCurve, QObject
-from PySide6.QtGui import QPainter, QPolygonF, QColor, QPen, QBrush, QFont
+from PySide6.QtCore import Qt, QPointF, QVariantAnimation, Property, QEasingCurve
+from PySide6.QtGui import QPainter, QPolygonF, QColor, QPen, QBrush, QFont, QPixmap
+
+# Beş eksenin birim vektörleri (üstten başlayarak 72° aralıklarla)
+_AXES = [(math.cos(math.radians(i * 72 - 90)), math.sin(math.radians(i * 72 - 90)))
+         for i in range(5)]
+
+
+def _value_property(index):
+    """v1..v5 için tek bir değeri okuyan/yazan Qt Property üretir."""
+    return Property(float,
+                    lambda self: self._values[index],
+                    lambda self, v: self._set_value(index, v))
+
 
 class RadarChartWidget(QWidget):
     """
     Animasyonlu ve profesyonel Radar Grafik bileşeni.
     Veri değişimlerinde pürüzsüz geçişler sağlar.
+    Tek animasyon tüm eksenleri sürer (kare başına tek yeniden çizim);
+    ağ ve etiketler önbelleğe alınmış bir QPixmap katmanından çizilir.
     """
-    
+
     def __init__(self, parent=None):
         super().__init__(parent)
         self.setFixedSize(260, 260) # Boyutu sabitleyip dengelemek daha güvenli
-        
+
         # Animasyon için saklanan değerler
-        self._v1 = 0.0
-        self._v2 = 0.0
-        self._v3 = 0.0
-        self._v4 = 0.0
-        self._v5 = 0.0
-        
-        self.labels = ["Length", "Variety", "Entropy", "Uniques", "Safety"]
-        
+        self._values = [0.0] * 5
+        self._start = [0.0] * 5
+        self._target = [0.0] * 5
+
+        self._labels = ["Length", "Variety", "Entropy", "Uniques", "Safety"]
+
         # Tema Renkleri (Varsayılan Dark)
         self.grid_color = QColor("#334155")
         self.label_color = QColor("#94a3b8")
 
+        # Statik katman (ağ + etiketler); tema, boyut veya etiket değişiminde yenilenir
+        self._static_layer = None
+
+        # 0 -> 1 ilerleme; her adımda beş değer birlikte enterpole edilir
+        self._anim = QVariantAnimation(self)
+        self._anim.setDuration(400)
+        self._anim.setStartValue(0.0)
+        self._anim.setEndValue(1.0)
+        self._anim.setEasingCurve(QEasingCurve.OutQuad)
+        self._anim.valueChanged.connect(self._on_tick)
+
+    @property
+    def labels(self):
+        return self._labels
+
+    @labels.setter
+    def labels(self, labels):
+        self._labels = list(labels)
+        self._static_layer = None
+        self.update()
+
     def set_theme(self, is_dark):
         """Tema renklerini günceller."""
         if is_dark:
@@ -34,75 +67,92 @@ class RadarChartWidget(QWidget):
         else:
             self.grid_color = QColor("#cbd5e1")
             self.label_color = QColor("#475569")
+        self._static_layer = None
         self.update()
 
-    # Animasyon için Property tanımları
-    def get_v1(self): return self._v1
-    def set_v1(self, v): self._v1 = v; self.update()
-    v1 = Property(float, get_v1, set_v1)
-
-    def get_v2(self): return self._v2
-    def set_v2(self, v): self._v2 = v; self.update()
-    v2 = Property(float, get_v2, set_v2)
-
-    def get_v3(self): return self._v3
-    def set_v3(self, v): self._v3 = v; self.update()
-    v3 = Property(float, get_v3, set_v3)
-
-    def get_v4(self): return self._v4
-    def set_v4(self, v): self._v4 = v; self.update()
-    v4 = Property(float, get_v4, set_v4)
+    # Animasyon için Property tanımları (geriye dönük uyumluluk)
+    def _set_value(self, index, value):
+        self._values[index] = value
+        self.update()
 
-    def get_v5(self): return self._v5
-    def set_v5(self, v): self._v5 = v; self.update()
-    v5 = Property(float, get_v5, set_v5)
+    v1 = _value_property(0)
+    v2 = _value_property(1)
+    v3 = _value_property(2)
+    v4 = _value_property(3)
+    v5 = _value_property(4)
 
     def animate_to(self, metrics):
         """Tüm değerleri aynı anda hedef metriklere taşıyan animasyonu başlatır."""
-        duration = 400
         targets = [
-            metrics.get("length", 0),
-            metrics.get("variety", 0),
-            metrics.get("entropy", 0),
-            metrics.get("uniqueness", 0),
-            metrics.get("safety", 0)
+            float(metrics.get("length", 0)),
+            float(metrics.get("variety", 0)),
+            float(metrics.get("entropy", 0)),
+            float(metrics.get("uniqueness", 0)),
+            float(metrics.get("safety", 0))
         ]
-        
-        props = [b"v1", b"v2", b"v3", b"v4", b"v5"]
-        
-        for i, target in enumerate(targets):
-            anim = QPropertyAnimation(self, props[i])
-            anim.setDuration(duration)
-            anim.setEndValue(float(target))
-            anim.setEasingCurve(QEasingCurve.OutQuad)
-            anim.start()
+        if targets == self._target and (targets == self._values
+                                        or self._anim.state() == QVariantAnimation.Running):
+            return
+
+        self._anim.stop()
+        self._start = list(self._values)
+        self._target = targets
+        self._anim.start()
+
+    def set_values(self, values):
+        """Beş değeri animasyonsuz, doğrudan ayarlar (anlık görüntü ve ölçüm için)."""
+        self._anim.stop()
+        self._values = [float(value) for value in values]
+        self._start = list(self._values)
+        self._target = list(self._values)
+        self.update()
+
+    def _on_tick(self, progress):
+        start, target = self._start, self._target
+        self._values = [s + (t - s) * progress for s, t in zip(start, target)]
+        self.update()
+
+    def resizeEvent(self, event):
+        self._static_layer = None
+        super().resizeEvent(event)
 
     def paintEvent(self, event):
         painter = QPainter(self)
         painter.setRenderHint(QPainter.Antialiasing)
-        
+
         rect = self.contentsRect()
-        center = rect.center()
+        center = QPointF(rect.center())
         radius = 80 # Grafik alanı yarıçapı
-        
-        # 1. Arkaplan Ağını Çiz
-        self._draw_grid(painter, center, radius)
-        
+
+        # 1. Arkaplan Ağı ve Etiketler (önbellekten)
+        if self._static_layer is None:
+            self._static_layer = self._render_static_layer(center, radius)
+        painter.drawPixmap(0, 0, self._static_layer)
+
         # 2. Veri Poligonunu Çiz
         self._draw_data_polygon(painter, center, radius)
-        
-        # 3. Etiketleri Çiz
+
+    def _render_static_layer(self, center, radius):
+        ratio = self.devicePixelRatioF()
+        pixmap = QPixmap(round(self.width() * ratio), round(self.height() * ratio))
+        pixmap.setDevicePixelRatio(ratio)
+        pixmap.fill(Qt.transparent)
+        painter = QPainter(pixmap)
+        painter.setRenderHint(QPainter.Antialiasing)
+        self._draw_grid(painter, center, radius)
         self._draw_labels(painter, center, radius)
+        painter.end()
+        return pixmap
 
     def _draw_grid(self, painter, center, radius):
         pen = QPen(self.grid_color, 1)
         painter.setPen(pen)
-        
+
         for i in range(1, 5):
             r = radius * (i / 4)
             poly = self._get_poly(center, r)
             painter.drawPolygon(poly)
-            
+
         # Eksen çizgileri
         outer_poly = self._get_poly(center, radius)
         painter.setPen(QPen(QColor("#334155"), 1, Qt.DotLine))
@@ -110,18 +160,13 @@ class RadarChartWidget(QWidget):
             painter.drawLine(center, outer_poly[i])
 
     def _draw_data_polygon(self, painter, center, radius):
-        values = [self._v1, self._v2, self._v3, self._v4, self._v5]
+        values = self._values
         if not any(values): return
-        
-        poly = QPolygonF()
-        for i, v in enumerate(values):
-            angle = math.radians(i * 72 - 90)
-            p = QPointF(
-                center.x() + radius * v * math.cos(angle),
-                center.y() + radius * v * math.sin(angle)
-            )
-            poly.append(p)
-            
+
+        cx, cy = center.x(), center.y()
+        poly = QPolygonF([QPointF(cx + radius * v * dx, cy + radius * v * dy)
+                          for v, (dx, dy) in zip(values, _AXES)])
+
         color = QColor("#38bdf8")
         painter.setPen(QPen(color, 2))
         fill_color = QColor(color)
@@ -132,25 +177,18 @@ class RadarChartWidget(QWidget):
     def _draw_labels(self, painter, center, radius):
         painter.setPen(self.label_color)
         painter.setFont(QFont("Inter", 8, QFont.Bold))
-        
-        for i, text in enumerate(self.labels):
-            angle = math.radians(i * 72 - 90)
-            dist = radius + 25
-            x = center.x() + dist * math.cos(angle)
-            y = center.y() + dist * math.sin(angle)
-            
+
+        fm = painter.fontMetrics()
+        th = fm.height()
+        dist = radius + 25
+        for text, (dx, dy) in zip(self._labels, _AXES):
+            x = center.x() + dist * dx
+            y = center.y() + dist * dy
+
             # Etiket metnini ortala
-            fm = painter.fontMetrics()
             tw = fm.horizontalAdvance(text)
-            th = fm.height()
-            painter.drawText(x - tw/2, y + th/4, text)
+            painter.drawText(QPointF(x - tw/2, y + th/4), text)
 
     def _get_poly(self, center, radius):
-        poly = QPolygonF()
-        for i in range(5):
-            angle = math.radians(i * 72 - 90)
-            poly.append(QPointF(
-                center.x() + radius * math.cos(angle),
-                center.y() + radius * math.sin(angle)
-            ))
-        return poly
+        cx, cy = center.x(), center.y()
+        return QPolygonF([QPointF(cx + radius * dx, cy + radius * dy) for dx, dy in _AXES])
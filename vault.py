@@ -1,21 +1,80 @@
 import sqlite3
 import os
 import base64
+import json
+from collections import namedtuple
+
+from vault_crypto import KDF_PARAMS, PREFIX as ENCRYPTED_PREFIX, VaultCipher
+
+# Arama sonuçları: yalnızca döndürülen satırların şifresi çözülür
+VaultEntry = namedtuple("VaultEntry", "id service username password")
+# Sayfa: entries ve bir sonraki sayfa için imleç (son sayfada None)
+Page = namedtuple("Page", "entries cursor")
+
+SEARCH_FIELDS = ("service", "username")
+SEARCH_MODES = ("exact", "prefix", "fuzzy")
+# Önek aramasında üst sınır (tüm kod noktalarından büyük)
+_PREFIX_END = "\U0010ffff"
+
+# vault_fts (harici içerik) tablosunu silme/güncellemede eşzamanlı tutan
+# tetikleyiciler. Eklemeler satır başına tetikleyici yerine toplu yapılır
+# (bkz. _index_new_rows); 100K satırda ~15 kat daha hızlıdır.
+_FTS_TRIGGERS = (
+    """CREATE TRIGGER vault_fts_ad AFTER DELETE ON vault BEGIN
+        INSERT INTO vault_fts(vault_fts, rowid, service, username)
+        VALUES ('delete', old.id, old.service, old.username);
+    END""",
+    """CREATE TRIGGER vault_fts_au AFTER UPDATE OF service, username ON vault BEGIN
+        INSERT INTO vault_fts(vault_fts, rowid, service, username)
+        VALUES ('delete', old.id, old.service, old.username);
+        INSERT INTO vault_fts(rowid, service, username)
+        VALUES (new.id, new.service, new.username);
+    END""",
+)
 
 class PasswordVault:
     """
     Basit ve güvenli yerel şifre kasası.
-    Verileri SQLite veritabanında saklar. 
-    Not: Bu örnekte şifreleme basit tutulmuştur, 
-    gerçek projede 'cryptography' kütüphanesi önerilir.
+    Verileri SQLite veritabanında saklar.
+    Ana parola verilirse şifreler AES-GCM ile şifrelenir (bkz. vault_crypto);
+    anahtar kilit açılışında bir kez türetilir. Ana parola verilmeyen kasalar
+    eski base64 gizlemesini kullanır; ilk kilit açılışında mevcut satırlar
+    şifrelenir ve kasa bundan sonra kilitliyken okunamaz/yazılamaz.
+
+    Bağlantı kasa ömrü boyunca açık kalır (WAL kipi, ayarlı pragmalar);
+    iş bitince close() çağrılmalı ya da `with PasswordVault(...)` kullanılmalı.
+
+    Şema sürümü PRAGMA user_version ile tutulur; eski dosyalar açılışta
+    sırayla taşınır (bkz. _MIGRATIONS).
     """
-    
-    def __init__(self, db_path="locksense_vault.db"):
+
+    SCHEMA_VERSION = 3
+
+    # Toplu içe/dışa aktarma için ayarlar (WAL'da NORMAL senkron güvenlidir)
+    PRAGMAS = (
+        ("journal_mode", "WAL"),
+        ("synchronous", "NORMAL"),
+        ("temp_store", "MEMORY"),
+        ("cache_size", -16000),     # ~16 MB sayfa önbelleği
+        ("busy_timeout", 5000),
+    )
+    # get_passwords() imlecinin tek seferde çektiği satır sayısı
+    FETCH_SIZE = 1000
+
+    def __init__(self, db_path="locksense_vault.db", master_password=None, decrypt_workers=1):
         self.db_path = db_path
+        self._conn = sqlite3.connect(db_path)
+        for name, value in self.PRAGMAS:
+            self._conn.execute(f"PRAGMA {name}={value}")
+        self._cipher = None
+        # get_passwords() parça başına şifre çözmede kullanılacak iş parçacığı sayısı
+        self.decrypt_workers = decrypt_workers
         self._init_db()
+        if master_password is not None:
+            self.unlock(master_password)
 
     def _init_db(self):
-        with sqlite3.connect(self.db_path) as conn:
+        with self._conn as conn:
             conn.execute("""
                 CREATE TABLE IF NOT EXISTS vault (
                     id INTEGER PRIMARY KEY AUTOINCREMENT,
@@ -24,21 +83,369 @@ class PasswordVault:
                     password TEXT NOT NULL
                 )
             """)
+        self._migrate()
+        self._fts = self._conn.execute(
+            "SELECT 1 FROM sqlite_master WHERE name = 'vault_fts'").fetchone() is not None
+        # Satır başına vault_meta sorgusu yapılmaması için açılışta bir kez okunur
+        self._encrypted = self._meta("kdf_salt") is not None
+
+    def _migrate(self):
+        """Şemayı SCHEMA_VERSION'a taşır; her adım kendi işleminde çalışır."""
+        conn = self._conn
+        version = conn.execute("PRAGMA user_version").fetchone()[0]
+        for target, step in self._MIGRATIONS:
+            if version >= target:
+                continue
+            with conn:
+                conn.execute("BEGIN")
+                step(conn)
+                conn.execute(f"PRAGMA user_version = {target}")
+            version = target
+
+    @staticmethod
+    def _migrate_v1(conn):
+        """Servis/kullanıcı indeksleri ve (varsa) FTS5 trigram tablosu."""
+        conn.execute("CREATE INDEX IF NOT EXISTS idx_vault_service "
+                     "ON vault(service COLLATE NOCASE, id)")
+        conn.execute("CREATE INDEX IF NOT EXISTS idx_vault_username "
+                     "ON vault(username COLLATE NOCASE, id)")
+        try:
+            conn.execute("""
+                CREATE VIRTUAL TABLE vault_fts USING fts5(
+                    service, username, content='vault', content_rowid='id',
+                    tokenize='trigram'
+                )
+            """)
+        except sqlite3.OperationalError:
+            # FTS5/trigram yoksa bulanık arama LIKE taramasına düşer
+            return
+        # executescript bekleyen işlemi işlediğinden tetikleyiciler tek tek eklenir
+        for trigger in _FTS_TRIGGERS:
+            conn.execute(trigger)
+        # Mevcut satırları dizine al
+        conn.execute("INSERT INTO vault_fts(vault_fts) VALUES ('rebuild')")
+
+    @staticmethod
+    def _migrate_v2(conn):
+        """Şifreleme meta verileri (tuz, KDF parametreleri, doğrulayıcı)."""
+        conn.execute("""
+            CREATE TABLE IF NOT EXISTS vault_meta (
+                key TEXT PRIMARY KEY,
+                value TEXT NOT NULL
+            )
+        """)
+
+    @staticmethod
+    def _migrate_v3(conn):
+        """
+        Sağlık denetimi sonuçları (bkz. vault_audit). Satır değişince veya
+        silinince denetim kaydı tetikleyiciyle silinir ve satır yeniden puanlanır.
+        """
+        conn.execute("""
+            CREATE TABLE IF NOT EXISTS vault_audit (
+                row_id INTEGER PRIMARY KEY,
+                score INTEGER NOT NULL,
+                status TEXT NOT NULL,
+                fingerprint TEXT NOT NULL,
+                breached INTEGER NOT NULL,
+                analyzer_version TEXT NOT NULL
+            )
+        """)
+        conn.execute("CREATE INDEX IF NOT EXISTS idx_vault_audit_fingerprint "
+                     "ON vault_audit(fingerprint)")
+        for event in ("UPDATE", "DELETE"):
+            conn.execute(f"""
+                CREATE TRIGGER IF NOT EXISTS vault_audit_{event.lower()} AFTER {event} ON vault
+                BEGIN
+                    DELETE FROM vault_audit WHERE row_id = old.id;
+                END
+            """)
+
+    # (hedef sürüm, adım) sırayla uygulanır
+    _MIGRATIONS = (
+        (1, _migrate_v1),
+        (2, _migrate_v2),
+        (3, _migrate_v3),
+    )
+
+    def _meta(self, key):
+        row = self._conn.execute("SELECT value FROM vault_meta WHERE key = ?", (key,)).fetchone()
+        return row[0] if row else None
+
+    @property
+    def is_encrypted(self):
+        """Kasa bir ana parolayla şifrelenmiş mi."""
+        return self._encrypted
+
+    @property
+    def is_unlocked(self):
+        return self._cipher is not None
+
+    def unlock(self, master_password):
+        """
+        Ana paroladan anahtarı türetir (KDF bir kez çalışır). Kasa ilk kez
+        şifreleniyorsa tuz ve doğrulayıcı oluşturulur ve mevcut satırlar
+        tek işlemde şifrelenir. Yanlış parolada ValueError.
+        """
+        self.lock()
+        salt = self._meta("kdf_salt")
+        if salt is not None:
+            params = json.loads(self._meta("kdf_params"))
+            self._cipher = VaultCipher.unlock(master_password, bytes.fromhex(salt),
+                                              self._meta("verifier"), **params)
+            return
+        salt = VaultCipher.new_salt()
+        cipher = VaultCipher.unlock(master_password, salt)
+        with self._conn as conn:
+            conn.executemany("INSERT INTO vault_meta (key, value) VALUES (?, ?)", (
+                ("kdf_salt", salt.hex()),
+                ("kdf_params", json.dumps(KDF_PARAMS)),
+                ("verifier", cipher.make_verifier()),
+            ))
+            rows = conn.execute("SELECT id, service, username, password FROM vault "
+                                "WHERE password NOT LIKE 'v1:%'").fetchall()
+            conn.executemany("UPDATE vault SET password = ? WHERE id = ?", (
+                (cipher.encrypt(self._decode_legacy(value), cipher.aad(service, username)), row_id)
+                for row_id, service, username, value in rows))
+        self._encrypted = True
+        self._cipher = cipher
+
+    def fingerprint_key(self):
+        """
+        Yeniden kullanım tespiti için parmak izi anahtarı ve kimliği.
+        Şifreli kasada kasa anahtarından türetilir (kilit açık olmalı);
+        şifresiz kasada vault_meta'daki rastgele anahtar kullanılır.
+        """
+        if self._cipher is not None:
+            return self._cipher.derive_subkey(b"fingerprint"), "enc"
+        if self._encrypted:
+            raise PermissionError("Kasa kilitli: ana parola gerekli")
+        key = self._meta("fingerprint_key")
+        if key is None:
+            key = os.urandom(32).hex()
+            with self._conn as conn:
+                conn.execute("INSERT INTO vault_meta (key, value) VALUES ('fingerprint_key', ?)",
+                             (key,))
+        return bytes.fromhex(key), "plain"
+
+    def lock(self):
+        """Anahtarı bellekten siler."""
+        if self._cipher is not None:
+            self._cipher.wipe()
+            self._cipher = None
+
+    def _encode(self, service, username, password):
+        cipher = self._cipher
+        if cipher is not None:
+            return cipher.encrypt(password, cipher.aad(service, username))
+        if self._encrypted:
+            raise PermissionError("Kasa kilitli: ana parola gerekli")
+        # Şifresiz kasalar için basit bir obfuscation (Gizleme)
+        return base64.b64encode(password.encode()).decode()
+
+    def _decode(self, service, username, encoded_pass):
+        if not encoded_pass.startswith(ENCRYPTED_PREFIX):
+            return self._decode_legacy(encoded_pass)
+        cipher = self._cipher
+        if cipher is None:
+            raise PermissionError("Kasa kilitli: ana parola gerekli")
+        return cipher.decrypt(encoded_pass, cipher.aad(service, username))
+
+    @staticmethod
+    def _decode_legacy(encoded_pass):
+        return base64.b64decode(encoded_pass.encode()).decode()
+
+    def _decode_rows(self, rows):
+        """(service, username, değer) satırlarının şifrelerini sırayla döner."""
+        cipher = self._cipher
+        if cipher is not None and self.decrypt_workers > 1:
+            if all(value.startswith(ENCRYPTED_PREFIX) for _, _, value in rows):
+                return cipher.decrypt_many(
+                    ((value, cipher.aad(service, username)) for service, username, value in rows),
+                    self.decrypt_workers)
+        decode = self._decode
+        return [decode(service, username, value) for service, username, value in rows]
+
+    def _index_new_rows(self, conn, after_id):
+        """after_id'den sonra eklenen satırları FTS dizinine tek sorguda ekler."""
+        if self._fts:
+            conn.execute("INSERT INTO vault_fts(rowid, service, username) "
+                         "SELECT id, service, username FROM vault WHERE id > ?", (after_id,))
+
+    def _last_id(self, conn):
+        return conn.execute("SELECT COALESCE(MAX(id), 0) FROM vault").fetchone()[0]
 
     def add_password(self, service, username, password):
-        # Basit bir obfuscation (Gizleme) - Gerçek projede AES kullanılmalı
-        encoded_pass = base64.b64encode(password.encode()).decode()
-        with sqlite3.connect(self.db_path) as conn:
-            conn.execute(
+        with self._conn as conn:
+            cursor = conn.execute(
                 "INSERT INTO vault (service, username, password) VALUES (?, ?, ?)",
-                (service, username, encoded_pass)
+                (service, username, self._encode(service, username, password))
             )
+            self._index_new_rows(conn, cursor.lastrowid - 1)
+
+    def add_many(self, entries):
+        """
+        (service, username, password) kayıtlarını tek işlemde (transaction)
+        executemany ile ekler; eklenen satır sayısını döner.
+        Hata olursa hiçbir kayıt eklenmez.
+        """
+        encode = self._encode
+        rows = ((service, username, encode(service, username, password))
+                for service, username, password in entries)
+        with self._conn as conn:
+            last_id = self._last_id(conn)
+            cursor = conn.executemany(
+                "INSERT INTO vault (service, username, password) VALUES (?, ?, ?)", rows)
+            self._index_new_rows(conn, last_id)
+        return cursor.rowcount
 
     def get_passwords(self):
-        with sqlite3.connect(self.db_path) as conn:
-            cursor = conn.execute("SELECT service, username, password FROM vault")
-            results = []
-            for service, username, encoded_pass in cursor.fetchall():
-                password = base64.b64decode(encoded_pass.encode()).decode()
-                results.append((service, username, password))
-            return results
+        """(service, username, password) demetlerini sırayla üreten yineleyici."""
+        cursor = self._conn.execute("SELECT service, username, password FROM vault")
+        try:
+            while True:
+                rows = cursor.fetchmany(self.FETCH_SIZE)
+                if not rows:
+                    return
+                for (service, username, _), password in zip(rows, self._decode_rows(rows)):
+                    yield service, username, password
+        finally:
+            cursor.close()
+
+    def search(self, query, field="service", mode="exact", limit=50, cursor=None):
+        """
+        service veya username alanında arama yapar ve bir Page döner.
+          exact:  büyük/küçük harf duyarsız tam eşleşme (indeks)
+          prefix: büyük/küçük harf duyarsız önek (indeks aralığı)
+          fuzzy:  alt dize eşleşmesi (FTS5 trigram; 3 karakterden kısa
+                  sorgularda veya FTS5 yoksa LIKE taraması)
+        Sayfalama anahtar kümesiyle (keyset) yapılır: sonraki sayfa için
+        önceki sayfanın cursor değeri verilir. Yalnızca döndürülen satırların
+        şifresi çözülür.
+        """
+        if field not in SEARCH_FIELDS:
+            raise ValueError(f"Geçersiz arama alanı: {field}")
+        if mode not in SEARCH_MODES:
+            raise ValueError(f"Geçersiz arama kipi: {mode}")
+        columns = "v.id, v.service, v.username, v.password"
+        if mode == "exact":
+            sql = (f"SELECT {columns} FROM vault v WHERE v.{field} = ? COLLATE NOCASE "
+                   f"AND v.id > ? ORDER BY v.id LIMIT ?")
+            params = (query, cursor or 0, limit)
+        elif mode == "prefix":
+            # İmleç (son değer, son id): aralık son değerden başlar, eşitlikte id ile ilerler
+            last_value, last_id = cursor or (query, 0)
+            sql = (f"SELECT {columns} FROM vault v "
+                   f"WHERE v.{field} >= ? COLLATE NOCASE AND v.{field} < ? COLLATE NOCASE "
+                   f"AND (v.{field} > ? COLLATE NOCASE OR v.id > ?) "
+                   f"ORDER BY v.{field} COLLATE NOCASE, v.id LIMIT ?")
+            params = (last_value, query + _PREFIX_END, last_value, last_id, limit)
+        elif self._fts and len(query) >= 3:
+            phrase = '"' + query.replace('"', '""') + '"'
+            sql = (f"SELECT {columns} FROM vault_fts f JOIN vault v ON v.id = f.rowid "
+                   f"WHERE vault_fts MATCH ? AND f.rowid > ? ORDER BY f.rowid LIMIT ?")
+            params = (f"{field} : {phrase}", cursor or 0, limit)
+        else:
+            pattern = "%" + query.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_") + "%"
+            sql = (f"SELECT {columns} FROM vault v WHERE v.{field} LIKE ? ESCAPE '\\' "
+                   f"AND v.id > ? ORDER BY v.id LIMIT ?")
+            params = (pattern, cursor or 0, limit)
+
+        rows = self._conn.execute(sql, params).fetchall()
+        passwords = self._decode_rows([row[1:] for row in rows])
+        entries = [VaultEntry(row_id, service, username, password)
+                   for (row_id, service, username, _), password in zip(rows, passwords)]
+        next_cursor = None
+        if len(entries) == limit:
+            last = entries[-1]
+            next_cursor = (getattr(last, field), last.id) if mode == "prefix" else last.id
+        return Page(entries, next_cursor)
+
+    def audit_batches(self, version, full=False, batch_size=FETCH_SIZE):
+        """
+        Denetim kaydı olmayan veya analyzer_version'ı farklı satırları
+        (full=True ise tümünü) id sırasıyla VaultEntry listeleri halinde üretir.
+        Her parça anahtar kümesiyle (id > son id) ayrı sorguda okunur; bellek
+        kullanımı batch_size ile sınırlıdır ve parçalar arasında yazılabilir.
+        """
+        if full:
+            sql = ("SELECT v.id, v.service, v.username, v.password FROM vault v "
+                   "WHERE v.id > ? ORDER BY v.id LIMIT ?")
+        else:
+            sql = ("SELECT v.id, v.service, v.username, v.password "
+                   "FROM vault v LEFT JOIN vault_audit a ON a.row_id = v.id "
+                   "WHERE v.id > ? AND (a.row_id IS NULL OR a.analyzer_version != ?) "
+                   "ORDER BY v.id LIMIT ?")
+        last_id = 0
+        while True:
+            params = (last_id, batch_size) if full else (last_id, version, batch_size)
+            rows = self._conn.execute(sql, params).fetchall()
+            if not rows:
+                return
+            passwords = self._decode_rows([row[1:] for row in rows])
+            yield [VaultEntry(row_id, service, username, password)
+                   for (row_id, service, username, _), password in zip(rows, passwords)]
+            last_id = rows[-1][0]
+
+    def store_audit(self, records):
+        """
+        (row_id, score, status, fingerprint, breached, analyzer_version)
+        denetim kayıtlarını tek işlemde yazar (varsa değiştirir).
+        """
+        with self._conn as conn:
+            conn.executemany("""
+                INSERT OR REPLACE INTO vault_audit
+                    (row_id, score, status, fingerprint, breached, analyzer_version)
+                VALUES (?, ?, ?, ?, ?, ?)
+            """, records)
+
+    def prune_audit(self):
+        """Silinmiş satırların denetim kayıtlarını siler (tetikleyici öncesi kasalar)."""
+        with self._conn as conn:
+            conn.execute("DELETE FROM vault_audit WHERE row_id NOT IN (SELECT id FROM vault)")
+
+    def audit_summary(self):
+        """
+        Kayıtlı denetim sonuçlarının özeti: durum sayıları, zayıf ve sızdırılmış
+        satır kimlikleri, tekrar kullanılan satırlar ve grup sayısı.
+        """
+        conn = self._conn
+        statuses = dict(conn.execute(
+            "SELECT status, COUNT(*) FROM vault_audit GROUP BY status").fetchall())
+        reused = [row_id for (row_id,) in conn.execute("""
+            SELECT a.row_id FROM vault_audit a JOIN (
+                SELECT fingerprint FROM vault_audit GROUP BY fingerprint HAVING COUNT(*) > 1
+            ) d ON d.fingerprint = a.fingerprint
+            ORDER BY a.fingerprint, a.row_id
+        """)]
+        reused_groups = conn.execute("""
+            SELECT COUNT(*) FROM (
+                SELECT 1 FROM vault_audit GROUP BY fingerprint HAVING COUNT(*) > 1)
+        """).fetchone()[0]
+        breached = [row_id for (row_id,) in conn.execute(
+            "SELECT row_id FROM vault_audit WHERE breached ORDER BY row_id")]
+        weak = [row_id for (row_id,) in conn.execute(
+            "SELECT row_id FROM vault_audit WHERE status = 'weak' ORDER BY row_id")]
+        return {
+            "status": statuses,
+            "weak_ids": weak,
+            "breached_ids": breached,
+            "reused_groups": reused_groups,
+            "reused_ids": reused,
+        }
+
+    def __len__(self):
+        return self._conn.execute("SELECT COUNT(*) FROM vault").fetchone()[0]
+
+    def close(self):
+        """Anahtarı siler ve bağlantıyı kapatır (WAL içeriği ana dosyaya aktarılır)."""
+        self.lock()
+        if self._conn is not None:
+            self._conn.close()
+            self._conn = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
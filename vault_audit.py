@@ -0,0 +1,117 @@
+"""
+Kasa sağlık denetimi (zayıf, tekrar kullanılan ve sızdırılmış şifreler).
+
+Her satırın puanı, durumu, kara liste sonucu ve anahtarlı parmak izi
+vault_audit tablosunda analizör/politika sürümüyle birlikte saklanır.
+Denetim yalnızca denetim kaydı olmayan (yeni veya değişmiş; değişen ya da
+silinen satırın kaydı tetikleyiciyle silinir) ya da eski sürümle
+puanlanmış satırları çözer ve yeniden puanlar. Tekrar kullanım, parmak izi
+indeksi üzerinde SQL ile bulunur; şifreler hiçbir zaman düz olarak saklanmaz.
+
+Kara liste değişirse kayıtlı "breached" sonuçları güncellemek için
+run(full=True) kullanılmalıdır.
+
+Kullanım:
+    python -m vault_audit locksense_vault.db
+"""
+
+import hashlib
+import sys
+
+from ai_analyzer import AIAnalyzer
+
+# Çözme, puanlama ve işlem (commit) parça boyutu; bellek bununla sınırlıdır
+BATCH_SIZE = 5000
+
+
+def fingerprint(key, password):
+    """Şifrenin anahtarlı BLAKE2b parmak izi (anahtarsız karşılaştırılamaz)."""
+    return hashlib.blake2b(password.encode("utf-8", "surrogateescape"),
+                           key=key, digest_size=16).hexdigest()
+
+
+class VaultAuditor:
+    """
+    PasswordVault üzerinde artımlı sağlık denetimi.
+    Şifreli kasalarda kasanın kilidi açık olmalıdır.
+    """
+
+    def __init__(self, vault, analyzer=None):
+        self.vault = vault
+        self.analyzer = analyzer if analyzer is not None else AIAnalyzer()
+
+    def version(self, key_id):
+        # Parmak izi anahtarı değişirse (ör. kasa şifrelendiğinde) tümü yeniden hesaplanır
+        return f"{self.analyzer.version}/{key_id}"
+
+    def run(self, full=False):
+        """
+        Eksik veya eski denetim kayıtlarını günceller ve özet raporu döner.
+        full=True ise tüm satırlar yeniden puanlanır. Satırlar BATCH_SIZE'lık
+        parçalarla okunur ve her parça kendi işleminde yazılır; kesintide
+        yazılan parçalar korunur.
+        """
+        vault = self.vault
+        key, key_id = vault.fingerprint_key()
+        version = self.version(key_id)
+        policy = self.analyzer.policy
+
+        rescored = 0
+        vault.prune_audit()
+        for batch in vault.audit_batches(version, full, BATCH_SIZE):
+            passwords = [entry.password for entry in batch]
+            results = self.analyzer.analyze_many(passwords)
+            vault.store_audit(
+                (entry.id, result["score"],
+                 policy.status(result["score"]) if entry.password else "ready",
+                 fingerprint(key, entry.password),
+                 int(bool(entry.password) and not result["checks"]["common"]), version)
+                for entry, result in zip(batch, results)
+            )
+            rescored += len(batch)
+        return self.report(rescored)
+
+    def report(self, rescored=0):
+        """Kayıtlı denetim sonuçlarından özet sözlük döner."""
+        summary = self.vault.audit_summary()
+        statuses = summary["status"]
+        return {
+            "total": sum(statuses.values()),
+            "rescored": rescored,
+            "status": {key: statuses.get(key, 0) for key in ("weak", "medium", "strong")},
+            "weak_ids": summary["weak_ids"],
+            "breached_ids": summary["breached_ids"],
+            "reused_groups": summary["reused_groups"],
+            "reused_ids": summary["reused_ids"],
+        }
+
+
+def main(argv=None):
+    import argparse
+    import getpass
+    import json
+
+    from vault import PasswordVault
+
+    parser = argparse.ArgumentParser(
+        prog="python -m vault_audit",
+        description="Kasadaki zayıf, tekrar kullanılan ve sızdırılmış şifreleri raporlar.")
+    parser.add_argument("db", nargs="?", default="locksense_vault.db")
+    parser.add_argument("--full", action="store_true", help="tüm satırları yeniden puanla")
+    parser.add_argument("--ids", action="store_true", help="satır kimliklerini de yaz")
+    args = parser.parse_args(argv)
+
+    with PasswordVault(args.db) as vault:
+        if vault.is_encrypted:
+            vault.unlock(getpass.getpass("Ana parola: "))
+        report = VaultAuditor(vault).run(full=args.full)
+    if not args.ids:
+        report = {key: len(value) if key.endswith("_ids") else value
+                  for key, value in report.items()}
+    json.dump(report, sys.stdout, ensure_ascii=False, indent=2)
+    sys.stdout.write("\n")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
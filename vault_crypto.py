@@ -0,0 +1,196 @@
+"""
+Kasa için kimlik doğrulamalı şifreleme (AES-256-GCM).
+
+Anahtar ana paroladan scrypt ile türetilir; KDF yalnızca kilit açılışında
+bir kez çalışır, satır başına işlem yalnızca AES-GCM'dir (mikrosaniyeler).
+Türetilmiş anahtar bellekte kilitlenmiş (mlock, mümkünse) bir bytearray'de
+tutulur ve wipe() ile sıfırlanır. Not: cryptography'nin AESGCM nesnesi de
+anahtarın kendi kopyasını tutar; wipe() bu nesneyi de bırakır.
+
+Satır biçimi: "v1:" + base64(nonce(12) + şifreli metin + etiket(16)).
+İlişkili veri (AAD) servis ve kullanıcı adıdır; şifreli değerler satırlar
+arasında taşınamaz.
+
+cryptography isteğe bağlıdır: pip install cryptography
+"""
+
+import base64
+import hashlib
+import hmac
+import os
+
+try:
+    from cryptography.hazmat.primitives.ciphers.aead import AESGCM
+    from cryptography.exceptions import InvalidTag
+except ImportError:  # pragma: no cover - isteğe bağlı bağımlılık
+    AESGCM = None
+    InvalidTag = None
+
+PREFIX = "v1:"
+NONCE_SIZE = 12
+KEY_SIZE = 32
+SALT_SIZE = 16
+
+# scrypt maliyeti (OWASP önerisi: N=2^17, r=8, p=1 -> 128 MB bellek)
+KDF_PARAMS = {"n": 2 ** 17, "r": 8, "p": 1}
+
+# Kilit açılışında ana parolayı doğrulamak için şifrelenen sabit metin
+_VERIFIER_PLAINTEXT = b"locksense-vault-verifier"
+_VERIFIER_AAD = b"locksense-vault"
+
+
+def _require_crypto():
+    if AESGCM is None:
+        raise ImportError("Kasa şifrelemesi için cryptography gerekli: pip install cryptography")
+
+
+def derive_key(master_password, salt, n=None, r=None, p=None):
+    """Ana paroladan scrypt ile 32 baytlık anahtar türetir (bytearray)."""
+    n = n or KDF_PARAMS["n"]
+    r = r or KDF_PARAMS["r"]
+    p = p or KDF_PARAMS["p"]
+    key = hashlib.scrypt(master_password.encode("utf-8"), salt=salt, n=n, r=r, p=p,
+                         maxmem=256 * n * r, dklen=KEY_SIZE)
+    return bytearray(key)
+
+
+def _mlock(buffer):
+    """Tamponu belleğe kilitler (takas alanına yazılmasın); en iyi çaba."""
+    try:
+        import ctypes
+        import ctypes.util
+        libc = ctypes.CDLL(ctypes.util.find_library("c"), use_errno=True)
+        view = (ctypes.c_char * len(buffer)).from_buffer(buffer)
+        locked = libc.mlock(ctypes.addressof(view), ctypes.c_size_t(len(buffer))) == 0
+        return view, locked
+    except (OSError, AttributeError, TypeError, ValueError):
+        return None, False
+
+
+class VaultKey:
+    """
+    Türetilmiş anahtarı tutan sıfırlanabilir tampon.
+    with bloğundan çıkışta veya wipe() ile anahtar sıfırlanır.
+    """
+
+    def __init__(self, key):
+        self._key = bytearray(key)
+        self._view, self.locked = _mlock(self._key)
+
+    @property
+    def wiped(self):
+        return self._key is None
+
+    def buffer(self):
+        if self._key is None:
+            raise ValueError("Anahtar silinmiş")
+        return self._key
+
+    def wipe(self):
+        key = self._key
+        if key is None:
+            return
+        for i in range(len(key)):
+            key[i] = 0
+        if self._view is not None:
+            if self.locked:
+                import ctypes
+                import ctypes.util
+                libc = ctypes.CDLL(ctypes.util.find_library("c"))
+                libc.munlock(ctypes.addressof(self._view), ctypes.c_size_t(len(key)))
+            self._view = None
+        self._key = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.wipe()
+
+    def __del__(self):
+        self.wipe()
+
+
+class VaultCipher:
+    """AES-GCM ile satır şifreleme/çözme (anahtar VaultKey'den)."""
+
+    def __init__(self, key):
+        _require_crypto()
+        self.key = key if isinstance(key, VaultKey) else VaultKey(key)
+        self._aead = AESGCM(self.key.buffer())
+
+    @classmethod
+    def unlock(cls, master_password, salt, verifier=None, **kdf_params):
+        """
+        KDF'yi bir kez çalıştırır ve şifreleyiciyi döner. verifier verilirse
+        ana parola doğrulanır; yanlışsa ValueError.
+        """
+        key = derive_key(master_password, salt, **kdf_params)
+        try:
+            cipher = cls(key)
+        finally:
+            for i in range(len(key)):
+                key[i] = 0
+        if verifier is not None and not cipher.check_verifier(verifier):
+            cipher.wipe()
+            raise ValueError("Ana parola hatalı")
+        return cipher
+
+    @staticmethod
+    def aad(service, username):
+        return f"{service}\0{username or ''}".encode("utf-8")
+
+    def encrypt(self, plaintext, aad=b""):
+        nonce = os.urandom(NONCE_SIZE)
+        sealed = self._aead.encrypt(nonce, plaintext.encode("utf-8"), aad)
+        return PREFIX + base64.b64encode(nonce + sealed).decode("ascii")
+
+    def decrypt(self, token, aad=b""):
+        if not token.startswith(PREFIX):
+            raise ValueError("Şifreli değer değil")
+        raw = base64.b64decode(token[len(PREFIX):])
+        try:
+            plaintext = self._aead.decrypt(raw[:NONCE_SIZE], raw[NONCE_SIZE:], aad)
+        except InvalidTag:
+            raise ValueError("Şifreli değer doğrulanamadı (bozuk veya yanlış anahtar)") from None
+        return plaintext.decode("utf-8")
+
+    def decrypt_many(self, items, workers=1):
+        """
+        (token, aad) çiftlerini çözer ve listeyi sırayla döner.
+        workers > 1 ise parçalar iş parçacığı havuzunda çözülür (AES-GCM
+        OpenSSL'de GIL dışında çalışır).
+        """
+        items = list(items)
+        decrypt = self.decrypt
+        if workers <= 1 or len(items) < 2 * workers:
+            return [decrypt(token, aad) for token, aad in items]
+        from concurrent.futures import ThreadPoolExecutor
+        size = -(-len(items) // workers)
+        chunks = [items[i:i + size] for i in range(0, len(items), size)]
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            parts = pool.map(lambda chunk: [decrypt(token, aad) for token, aad in chunk], chunks)
+            return [plaintext for part in parts for plaintext in part]
+
+    def derive_subkey(self, label):
+        """Anahtardan amaç etiketine bağlı 32 baytlık alt anahtar (HMAC-SHA256)."""
+        return hmac.new(self.key.buffer(), b"locksense:" + label, hashlib.sha256).digest()
+
+    def make_verifier(self):
+        return self.encrypt(_VERIFIER_PLAINTEXT.decode("ascii"), _VERIFIER_AAD)
+
+    def check_verifier(self, verifier):
+        try:
+            plaintext = self.decrypt(verifier, _VERIFIER_AAD)
+        except ValueError:
+            return False
+        return hmac.compare_digest(plaintext.encode("ascii"), _VERIFIER_PLAINTEXT)
+
+    def wipe(self):
+        """Anahtarı sıfırlar; şifreleyici artık kullanılamaz."""
+        self._aead = None
+        self.key.wipe()
+
+    @staticmethod
+    def new_salt():
+        return os.urandom(SALT_SIZE)
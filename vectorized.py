@@ -0,0 +1,221 @@
+"""
+AIAnalyzer için NumPy tabanlı vektörel puanlama yolu (çevrimdışı denetimler).
+
+Şifre partisi sabit genişlikli kod noktası dizisi (uint32, n x w) olarak
+işlenir; uzunluk, karakter sınıfları, benzersizlik oranı ve Shannon bitleri
+NumPy işlemleriyle hesaplanır. Sonuçlar sütunlu dizilerdir ve aynı girdiler
+için analyze() ile bit düzeyinde aynıdır:
+  - Entropi terimleri analyze() ile aynı sırada (ilk görülme sırası) toplanır.
+  - p * log2(p) terimleri, farklı (sayı, uzunluk) çiftleri için math.log2 ile
+    hesaplanır; NumPy'nin log2 uygulamasından kaynaklanan ULP farkları oluşmaz.
+  - Karakter sınıfları analyze() ile aynı char_classes tablosundan gelir.
+
+Yaygın şifre kontrolü kara listeye bağlı olduğundan satır başına çalışır.
+NumPy isteğe bağlıdır: pip install numpy
+"""
+
+import math
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover - isteğe bağlı bağımlılık
+    np = None
+
+from ai_analyzer import AIAnalyzer
+from char_classes import UPPER, LOWER, DIGIT, SPECIAL, char_flags
+from policy import MAX_SCORE
+
+# status sütunundaki kodların çeviri anahtarları
+STATUS_KEYS = ("ready", "weak", "medium", "strong")
+
+# Dolgu konumları için Unicode aralığı dışında bir değer
+_PAD = 0xFFFFFFFF
+
+
+def encode_batch(passwords, width=None):
+    """
+    Şifreleri (n x w) uint32 kod noktası dizisine ve uzunluk dizisine çevirir.
+    width verilmezse en uzun şifre kullanılır; daha uzun şifreler hata verir.
+    """
+    _require_numpy()
+    passwords = list(passwords)
+    lengths = np.fromiter((len(p) for p in passwords), dtype=np.int64, count=len(passwords))
+    longest = int(lengths.max()) if len(passwords) else 0
+    if width is None:
+        width = longest
+    elif longest > width:
+        raise ValueError(f"Şifre uzunluğu ({longest}) genişliği ({width}) aşıyor")
+    width = max(1, width)
+    codes = np.array(passwords, dtype=f"<U{width}").view(np.uint32).reshape(len(passwords), width)
+    return codes, lengths
+
+
+class VectorAnalyzer:
+    """
+    Şifre partilerini sütunlu dizilerle puanlar.
+    Kurallar ve kara liste verilen AIAnalyzer örneğinden alınır.
+    """
+
+    def __init__(self, analyzer=None):
+        _require_numpy()
+        self.analyzer = analyzer if analyzer is not None else AIAnalyzer()
+        if self.analyzer.estimator is not None:
+            raise ValueError("VectorAnalyzer desen tahmincisini (estimator) desteklemez")
+        self.rules = self.analyzer.rules
+        self._ascii_flags = np.array(
+            [self._char_flags(chr(c)) for c in range(128)], dtype=np.uint8)
+        self._flag_cache = {}
+        self._term_cache = {}
+
+    def analyze_batch(self, passwords, width=None):
+        """Şifre listesini analiz eder (bkz. analyze_codes)."""
+        passwords = list(passwords)
+        codes, lengths = encode_batch(passwords, width)
+        return self.analyze_codes(codes, lengths, passwords)
+
+    def analyze_codes(self, codes, lengths, passwords=None):
+        """
+        Kod noktası dizisini analiz eder ve sütunlar sözlüğü döner:
+        score, status (STATUS_KEYS indeksi), entropy (2 basamak), entropy_bits,
+        check_* (bool) ve metric_* (float64) dizileri.
+        Boş şifrelerde entropi ve metrikler 0'dır.
+        """
+        codes = np.ascontiguousarray(codes, dtype=np.uint32)
+        lengths = np.asarray(lengths, dtype=np.int64)
+        n, width = codes.shape
+        policy = self.analyzer.policy
+
+        valid = np.arange(width) < lengths[:, None]
+
+        # Karakter sınıfları
+        flags = self._lookup_flags(codes) * valid
+        row_flags = np.bitwise_or.reduce(flags, axis=1) if width else np.zeros(n, np.uint8)
+        has_upper = (row_flags & UPPER) != 0
+        has_lower = (row_flags & LOWER) != 0
+        has_digit = (row_flags & DIGIT) != 0
+        has_special = (row_flags & SPECIAL) != 0
+        variety = (has_upper.astype(np.int64) + has_lower + has_digit + has_special)
+
+        unique, entropy = self._entropy(codes, valid, lengths)
+
+        is_common = np.fromiter(
+            (bool(p) and p in self.analyzer.blocklist
+             for p in self._iter_passwords(codes, lengths, passwords)),
+            dtype=bool, count=n)
+
+        # Puanlama (analizörün politikasıyla aynı ağırlıklar)
+        class_points = np.array([points for points, _ in policy.class_table], dtype=np.int64)
+        score = np.where(lengths >= policy.desired_length, policy.desired_length_points,
+                         np.where(lengths >= policy.min_length, policy.min_length_points, 0))
+        score = score + class_points[row_flags & 15] - is_common * policy.common_penalty
+        nonempty = lengths > 0
+        score = np.where(nonempty, np.clip(score, 0, MAX_SCORE), 0)
+
+        status = np.where(score < policy.medium_threshold, 1,
+                          np.where(score < policy.strong_threshold, 2, 3))
+        status = np.where(nonempty, status, 0).astype(np.int8)
+
+        safe_len = np.where(nonempty, lengths, 1)
+        zero = np.zeros(n)
+        return {
+            "score": score.astype(np.int64),
+            "status": status,
+            "entropy": np.array([round(x, 2) for x in entropy.tolist()]),
+            "entropy_bits": entropy,
+            "check_length": lengths >= policy.min_length,
+            "check_upper": has_upper,
+            "check_lower": has_lower,
+            "check_digit": has_digit,
+            "check_special": has_special,
+            "check_common": nonempty & ~is_common,
+            "metric_length": np.where(nonempty, np.minimum(1.0, lengths / 16), zero),
+            "metric_variety": np.where(nonempty, variety / 4, zero),
+            "metric_entropy": np.where(nonempty, np.minimum(1.0, entropy / 128), zero),
+            "metric_uniqueness": np.where(nonempty, unique / safe_len, zero),
+            "metric_safety": np.where(nonempty & ~is_common, 1.0, zero),
+        }
+
+    @staticmethod
+    def _char_flags(char):
+        return char_flags(char)
+
+    def _lookup_flags(self, codes):
+        """Kod noktalarını sınıf bitlerine çevirir (ASCII için tablo)."""
+        flags = self._ascii_flags[np.minimum(codes, 127)]
+        wide = codes > 127
+        if wide.any():
+            values, inverse = np.unique(codes[wide], return_inverse=True)
+            cache = self._flag_cache
+            table = np.empty(len(values), dtype=np.uint8)
+            for i, code in enumerate(values.tolist()):
+                value = cache.get(code)
+                if value is None:
+                    value = cache[code] = self._char_flags(chr(code))
+                table[i] = value
+            flags[wide] = table[inverse]
+        return flags
+
+    def _entropy(self, codes, valid, lengths):
+        """Satır başına benzersiz karakter sayısını ve Shannon bitlerini döner."""
+        n, width = codes.shape
+        if not n or not width:
+            return np.zeros(n, np.int64), np.zeros(n)
+
+        padded = np.where(valid, codes, np.uint32(_PAD))
+        order = np.argsort(padded, axis=1, kind="stable")
+        ordered = np.take_along_axis(padded, order, axis=1)
+
+        # Her satırda eşit karakter dizilerinin (run) başlangıçları
+        starts = np.ones((n, width), dtype=bool)
+        starts[:, 1:] = ordered[:, 1:] != ordered[:, :-1]
+        index = np.flatnonzero(starts)
+        run_len = np.diff(np.append(index, n * width))
+        run_char = ordered.ravel()[index]
+        keep = run_char != _PAD
+        index, run_len = index[keep], run_len[keep]
+        row = index // width
+        # Kararlı sıralama: run'ın ilk elemanı karakterin ilk görülme konumudur
+        first_seen = order.ravel()[index]
+
+        unique = np.bincount(row, minlength=n)
+
+        # analyze() ile aynı toplama sırası: ilk görülme sırasına göre
+        by_seen = np.argsort(row * width + first_seen)
+        row, run_len = row[by_seen], run_len[by_seen]
+        row_start = np.concatenate(([0], np.cumsum(unique)[:-1]))
+        rank = np.arange(len(row)) - row_start[row]
+
+        terms = np.zeros((n, int(unique.max())))
+        terms[row, rank] = self._terms(run_len, lengths[row], width)
+
+        entropy = np.zeros(n)
+        for j in range(terms.shape[1]):
+            entropy = entropy - terms[:, j]
+        return unique, entropy * lengths
+
+    def _terms(self, counts, lengths, width):
+        """p * log2(p) terimlerini farklı (sayı, uzunluk) çiftleri için math ile hesaplar."""
+        keys, inverse = np.unique(counts * (width + 1) + lengths, return_inverse=True)
+        cache = self._term_cache
+        table = np.empty(len(keys))
+        for i, (count, length) in enumerate(zip(*divmod(keys, width + 1))):
+            count, length = int(count), int(length)
+            value = cache.get((count, length))
+            if value is None:
+                p_i = count / length
+                value = cache[(count, length)] = p_i * math.log2(p_i)
+            table[i] = value
+        return table[inverse]
+
+    @staticmethod
+    def _iter_passwords(codes, lengths, passwords):
+        if passwords is not None:
+            return iter(passwords)
+        strings = codes.view(f"<U{codes.shape[1]}").ravel()
+        # NumPy sondaki NUL karakterleri atar; gerçek uzunluğa tamamlanır
+        return (s.ljust(length, "\0") for s, length in zip(strings.tolist(), lengths.tolist()))
+
+
+def _require_numpy():
+    if np is None:
+        raise ImportError("Vektörel analiz için NumPy gerekli: pip install numpy")